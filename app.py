@@ -2,14 +2,20 @@
 Excel Processor Application with CIP-Signal Automation
 """
 
-from flask import Flask, render_template, request, send_file, jsonify, session
-import io
+from flask import Flask, render_template, request, send_file, jsonify, session, after_this_request
 import pandas as pd
+import shutil
 from converters import process_excel, get_process_display_name, get_process_filename
+import fast_xlsx
+import numba_util
 from datetime import datetime
 from openpyxl import Workbook
-from openpyxl.styles import Alignment
-import threading
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import time
 import json
 import os
@@ -27,7 +33,10 @@ except ImportError as e:
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB
-app.config['SECRET_KEY'] = os.urandom(24)  # For session management
+# For session management. Set SECRET_KEY in the environment for multi-worker
+# deploys - the os.urandom fallback gives every worker a different key, which
+# invalidates sessions signed by its siblings
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or os.urandom(24)
 
 # List of available processes
 PROCESSES = [
@@ -44,6 +53,171 @@ PROCESSES = [
 FIXED_CIP_USERNAME = "signal@master.com"
 FIXED_CIP_PASSWORD = "qwerty"
 
+# Per-process Excel formatting specs used when writing the output workbook:
+# data_start_row = first Excel row with data (rows above are report headers)
+# int_cols / float_cols = 1-based column numbers coerced to numbers
+# money_cols = numeric columns formatted as '#,##0.00'
+# center_cols / right_cols = 1-based column numbers to align
+# widths = column letter -> column width
+PROCESS_SPECS = {
+    'dbk_disbursement': {
+        'data_start_row': 5,
+        'int_cols': {1, 3, 5, 9},  # S No., Shipping Bill No., Scroll No., Amount
+        'float_cols': set(),
+        'money_cols': set(),
+        'center_cols': set(range(1, 10)),  # Columns A-I
+        'right_cols': set(),
+        'widths': {
+            'A': 8,   # S No.
+            'B': 10,  # Port
+            'C': 18,  # Shipping Bill No.
+            'D': 18,  # Shipping Bill Date
+            'E': 12,  # Scroll No.
+            'F': 12,  # Scroll Date
+            'G': 10,  # Drawback
+            'H': 8,   # STR
+            'I': 12,  # Amount
+        },
+    },
+    'dbk_pendency': {
+        'data_start_row': 5,
+        'int_cols': {1, 2, 5},  # S No., Shipping Bill No., Amount
+        'float_cols': set(),
+        'money_cols': set(),
+        'center_cols': set(range(1, 7)),  # Columns A-F
+        'right_cols': set(),
+        'widths': {
+            'A': 8,   # S No.
+            'B': 18,  # Shipping Bill No.
+            'C': 18,  # Shipping Bill Date
+            'D': 12,  # LEO Date
+            'E': 12,  # Amount
+            'F': 15,  # Current Queue
+        },
+    },
+    'brc': {
+        # 12 columns, data starts from row 4
+        'data_start_row': 4,
+        'int_cols': {4, 5},  # Bill ID, SHB No
+        'float_cols': set(),
+        'money_cols': {8},  # Realised Value formatted with 2 decimal places
+        'center_cols': set(range(1, 13)),  # Columns A-L
+        'right_cols': set(),
+        'widths': {
+            'A': 20,  # BRC Number
+            'B': 12,  # BRC Date
+            'C': 12,  # BRC Status
+            'D': 12,  # Bill ID
+            'E': 12,  # SHB No
+            'F': 30,  # SHB Port
+            'G': 12,  # SHB Date
+            'H': 15,  # Realised Value
+            'I': 10,  # Currency
+            'J': 18,  # Date of Realization
+            'K': 20,  # BRC Utlisation Status
+            'L': 10,  # BRC Lot
+        },
+    },
+    'igst_scroll': {
+        # 10 columns, data starts from row 7
+        'data_start_row': 7,
+        'int_cols': {1, 2},  # S No., Shipping Bill No.
+        'float_cols': {6},  # Scroll Amount
+        'money_cols': set(),
+        'center_cols': set(range(1, 11)),  # Columns A-J
+        'right_cols': set(),
+        'widths': {
+            'A': 8,   # S No.
+            'B': 18,  # Shipping Bill No.
+            'C': 18,  # Shipping Bill Date
+            'D': 18,  # IGST Scroll Number
+            'E': 18,  # IGST Scroll Date
+            'F': 15,  # Scroll Amount(INR)
+            'G': 12,  # Scroll Status At PFMS
+            'H': 12,  # Scroll Status At PAO
+            'I': 15,  # Bank Response Code
+            'J': 20,  # Bank Transaction Details
+        },
+    },
+    'rodtep_scroll': {
+        # Data starts from row 4
+        'data_start_row': 4,
+        'int_cols': {1, 2},  # Sr. No., SHB No
+        'float_cols': {6},  # Scroll Amt
+        'money_cols': set(),
+        'center_cols': set(range(1, 8)),  # Columns A-G
+        'right_cols': set(),
+        'widths': {
+            'A': 8,   # Sr. No.
+            'B': 15,  # SHB No
+            'C': 12,  # Date
+            'D': 15,  # Scroll No
+            'E': 12,  # Scroll Date
+            'F': 12,  # Scroll Amt
+            'G': 10,  # Port
+        },
+    },
+    'rodtep_scrip': {
+        # 13 columns (A-M), data starts from row 4 (headers at row 3)
+        'data_start_row': 4,
+        'int_cols': {1, 2, 3, 6},  # Sr. No., SCROLL NUMBER, SB NUMBER, SCRIP NUMBER
+        'float_cols': set(),
+        'money_cols': {9, 10},  # SCRIP ISSUE AMOUNT, SCRIP BALANCE AMOUNT
+        # Center align all data cells except amount columns (I and J) which are right-aligned
+        'center_cols': set(range(1, 14)) - {9, 10},
+        'right_cols': {9, 10},
+        'widths': {
+            'A': 8,   # Sr. No.
+            'B': 15,  # SCROLL NUMBER
+            'C': 15,  # SB NUMBER
+            'D': 12,  # SB DATE
+            'E': 12,  # SB AMOUNT
+            'F': 15,  # SCRIP NUMBER
+            'G': 15,  # SCRIP ISSUE DATE
+            'H': 15,  # SCRIP EXPIRY DATE
+            'I': 18,  # SCRIP ISSUE AMOUNT
+            'J': 18,  # SCRIP BALANCE AMOUNT
+            'K': 18,  # SCRIP TRANSFER DATE
+            'L': 15,  # SCRIP STATUS
+            'M': 20,  # Application Ref. No
+        },
+    },
+}
+
+# High-row-count processes written via the direct OOXML writer in fast_xlsx.py
+FAST_XLSX_PROCESSES = {'igst_scroll', 'rodtep_scrip'}
+
+# Accepted upload extensions (endswith takes the tuple directly)
+_ALLOWED_EXT = ('.xlsx', '.xls')
+
+# Bounded pool for background Selenium runs - each job drives a full browser,
+# so capping the workers keeps concurrent uploads from spawning one browser
+# per request; excess jobs wait in the pool's queue
+AUTOMATION_POOL = ThreadPoolExecutor(max_workers=2)
+atexit.register(AUTOMATION_POOL.shutdown, wait=False)
+
+# Style singletons shared by every request - constructing Alignment per call
+# costs a StyleArray lookup per cell assignment
+CENTER = Alignment(horizontal='center')
+RIGHT = Alignment(horizontal='right')
+# Explicit default for header cells in aligned columns - an explicit cell
+# style wins over the column-level alignment riding on <col>. 'general'
+# rather than Alignment(): an all-default Alignment is dropped by openpyxl
+# as no style at all, and the cell would inherit the column alignment
+HEADER_ALIGN = Alignment(horizontal='general')
+FMT_MONEY = '#,##0.00'
+
+# Fallback spec for processes without explicit formatting (e.g. IRM)
+DEFAULT_SPEC = {
+    'data_start_row': 0,
+    'int_cols': set(),
+    'float_cols': set(),
+    'money_cols': set(),
+    'center_cols': set(),
+    'right_cols': set(),
+    'widths': {col: 15 for col in 'ABCDEFGHIJKLM'},
+}
+
 def run_cip_automation_background(process_type, iec_number, file_path, brc_type=None):
     """Run CIP automation in background with fixed credentials and specific process"""
     try:
@@ -84,8 +258,7 @@ def run_cip_automation_background(process_type, iec_number, file_path, brc_type=
 
 def allowed_file(filename):
     """Check if file has allowed extension"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in {'xlsx', 'xls'}
+    return filename.lower().endswith(_ALLOWED_EXT)
 
 @app.route('/')
 def index():
@@ -96,6 +269,7 @@ def index():
 def process_files():
     """Handle file processing"""
     temp_file_path = None
+    upload_paths = []
     try:
         # Get selected process
         process_type = request.form.get('process_type')
@@ -120,13 +294,18 @@ def process_files():
         if not files or files[0].filename == '':
             return jsonify({'error': 'No files selected'}), 400
         
-        # Store file data
+        # Save each upload straight to disk and hand paths around - pandas reads
+        # the path directly, so the file bytes are never buffered in memory
         file_data_list = []
         for file in files:
             if file and allowed_file(file.filename):
                 filename = file.filename
-                file_data = file.read()
-                file_data_list.append((filename, file_data))
+                suffix = os.path.splitext(filename)[1]
+                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+                tmp.close()
+                file.save(tmp.name)
+                upload_paths.append(tmp.name)
+                file_data_list.append((filename, tmp.name))
             else:
                 return jsonify({'error': 'Invalid file type. Only .xlsx and .xls files allowed.'}), 400
         
@@ -150,419 +329,201 @@ def process_files():
             else:
                 raise e
         
-        if processed_df.empty:
+        # len() on the index is cheaper than the .empty property chain
+        n_rows = len(processed_df.index)
+        if n_rows == 0:
             return jsonify({'error': 'Processed data is empty. No data to export.'}), 400
+        n_cols = len(processed_df.columns)
         
-        # Create Excel file in memory
-        output = io.BytesIO()
-        
-        # Create a new workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = 'Sheet1'
-        
-        # Write data row by row
-        for row_idx, row in processed_df.iterrows():
-            excel_row = row_idx + 1
-            
-            for col_idx, value in enumerate(row):
-                cell = ws.cell(row=excel_row, column=col_idx + 1)
-                
-                if pd.isna(value):
-                    cell.value = None
-                else:
-                    cell.value = value
-        
-        # Apply number formatting to numeric columns based on process type
-        if process_type == 'dbk_disbursement':
-            # DBK Disbursement formatting
-            for row in range(5, len(processed_df) + 1):
-                # Column A: S No.
-                cell_a = ws.cell(row=row, column=1)
-                if cell_a.value is not None:
-                    try:
-                        cell_a.value = int(cell_a.value)
-                    except:
-                        pass
-                
-                # Column C: Shipping Bill No.
-                cell_c = ws.cell(row=row, column=3)
-                if cell_c.value is not None:
-                    try:
-                        cell_c.value = int(cell_c.value)
-                    except:
-                        pass
-                
-                # Column E: Scroll No.
-                cell_e = ws.cell(row=row, column=5)
-                if cell_e.value is not None:
-                    try:
-                        cell_e.value = int(cell_e.value)
-                    except:
-                        pass
-                
-                # Column I: Amount
-                cell_i = ws.cell(row=row, column=9)
-                if cell_i.value is not None:
-                    try:
-                        cell_i.value = int(cell_i.value)
-                    except:
-                        pass
-            
-            # Set column widths for DBK Disbursement
-            column_widths = {
-                'A': 8,   # S No.
-                'B': 10,  # Port
-                'C': 18,  # Shipping Bill No.
-                'D': 18,  # Shipping Bill Date
-                'E': 12,  # Scroll No.
-                'F': 12,  # Scroll Date
-                'G': 10,  # Drawback
-                'H': 8,   # STR
-                'I': 12,  # Amount
-            }
-            
-        elif process_type == 'dbk_pendency':
-            # DBK Pendency formatting
-            for row in range(5, len(processed_df) + 1):
-                # Column A: S No.
-                cell_a = ws.cell(row=row, column=1)
-                if cell_a.value is not None:
-                    try:
-                        cell_a.value = int(cell_a.value)
-                    except:
-                        pass
-                
-                # Column B: Shipping Bill No.
-                cell_b = ws.cell(row=row, column=2)
-                if cell_b.value is not None:
-                    try:
-                        cell_b.value = int(cell_b.value)
-                    except:
-                        pass
-                
-                # Column E: Amount
-                cell_e = ws.cell(row=row, column=5)
-                if cell_e.value is not None:
-                    try:
-                        cell_e.value = int(cell_e.value)
-                    except:
-                        pass
-            
-            # Set column widths for DBK Pendency
-            column_widths = {
-                'A': 8,   # S No.
-                'B': 18,  # Shipping Bill No.
-                'C': 18,  # Shipping Bill Date
-                'D': 12,  # LEO Date
-                'E': 12,  # Amount
-                'F': 15,  # Current Queue
-            }
-        
-        elif process_type == 'brc':
-            # BRC formatting - 12 columns
-            for row in range(4, len(processed_df) + 1):  # Data starts from row 4
-                # Column D: Bill ID (convert to number)
-                cell_d = ws.cell(row=row, column=4)
-                if cell_d.value is not None and str(cell_d.value).strip():
-                    try:
-                        cell_d.value = int(float(cell_d.value))
-                    except:
-                        pass
-                
-                # Column E: SHB No (convert to number)
-                cell_e = ws.cell(row=row, column=5)
-                if cell_e.value is not None and str(cell_e.value).strip():
-                    try:
-                        cell_e.value = int(float(cell_e.value))
-                    except:
-                        pass
-                
-                # Column H: Realised Value (convert to number)
-                cell_h = ws.cell(row=row, column=8)
-                if cell_h.value is not None and str(cell_h.value).strip():
-                    try:
-                        cell_h.value = float(cell_h.value)
-                        # Format as number with 2 decimal places
-                        cell_h.number_format = '#,##0.00'
-                    except:
-                        pass
-            
-            # Set column widths for BRC
-            column_widths = {
-                'A': 20,  # BRC Number
-                'B': 12,  # BRC Date
-                'C': 12,  # BRC Status
-                'D': 12,  # Bill ID
-                'E': 12,  # SHB No
-                'F': 30,  # SHB Port
-                'G': 12,  # SHB Date
-                'H': 15,  # Realised Value
-                'I': 10,  # Currency
-                'J': 18,  # Date of Realization
-                'K': 20,  # BRC Utlisation Status
-                'L': 10,  # BRC Lot
-            }
-        
-        elif process_type == 'igst_scroll':
-            # IGST Scroll formatting - 10 columns
-            for row in range(7, len(processed_df) + 1):
-                # Column A: S No.
-                cell_a = ws.cell(row=row, column=1)
-                if cell_a.value is not None:
-                    try:
-                        cell_a.value = int(cell_a.value)
-                    except:
-                        pass
-                
-                # Column B: Shipping Bill No.
-                cell_b = ws.cell(row=row, column=2)
-                if cell_b.value is not None:
-                    try:
-                        cell_b.value = int(cell_b.value)
-                    except:
-                        pass
-                
-                # Column F: Scroll Amount
-                cell_f = ws.cell(row=row, column=6)
-                if cell_f.value is not None:
-                    try:
-                        cell_f.value = float(cell_f.value)
-                    except:
-                        pass
-            
-            # Set column widths for IGST Scroll (10 columns: A-J)
-            column_widths = {
-                'A': 8,   # S No.
-                'B': 18,  # Shipping Bill No.
-                'C': 18,  # Shipping Bill Date
-                'D': 18,  # IGST Scroll Number
-                'E': 18,  # IGST Scroll Date
-                'F': 15,  # Scroll Amount(INR)
-                'G': 12,  # Scroll Status At PFMS
-                'H': 12,  # Scroll Status At PAO
-                'I': 15,  # Bank Response Code
-                'J': 20,  # Bank Transaction Details
-            }
-        
-        elif process_type == 'rodtep_scroll':
-            # RODTEP Scroll formatting
-            for row in range(4, len(processed_df) + 1):
-                # Column A: Sr. No.
-                cell_a = ws.cell(row=row, column=1)
-                if cell_a.value is not None:
-                    try:
-                        cell_a.value = int(cell_a.value)
-                    except:
-                        pass
-                
-                # Column B: SHB No
-                cell_b = ws.cell(row=row, column=2)
-                if cell_b.value is not None:
-                    try:
-                        cell_b.value = int(cell_b.value)
-                    except:
-                        pass
-                
-                # Column E: Scroll Amt
-                cell_e = ws.cell(row=row, column=6)
-                if cell_e.value is not None:
-                    try:
-                        cell_e.value = float(cell_e.value)
-                    except:
-                        pass
-            
-            # Set column widths for RODTEP Scroll
-            column_widths = {
-                'A': 8,   # Sr. No.
-                'B': 15,  # SHB No
-                'C': 12,  # Date
-                'D': 15,  # Scroll No
-                'E': 12,  # Scroll Date
-                'F': 12,  # Scroll Amt
-                'G': 10,  # Port
-            }
-        
-        elif process_type == 'rodtep_scrip':
-            # RODTEP Scrip formatting - 13 columns (A-M)
-            for row in range(4, len(processed_df) + 1):  # Data starts from row 4 (headers at row 3)
-                # Column A: Sr. No.
-                cell_a = ws.cell(row=row, column=1)
-                if cell_a.value is not None and str(cell_a.value).strip():
-                    try:
-                        cell_a.value = int(float(cell_a.value))
-                    except:
-                        pass
-                
-                # Column B: SCROLL NUMBER
-                cell_b = ws.cell(row=row, column=2)
-                if cell_b.value is not None and str(cell_b.value).strip():
-                    try:
-                        cell_b.value = int(float(cell_b.value))
-                    except:
-                        pass
-                
-                # Column C: SB NUMBER
-                cell_c = ws.cell(row=row, column=3)
-                if cell_c.value is not None and str(cell_c.value).strip():
-                    try:
-                        cell_c.value = int(float(cell_c.value))
-                    except:
-                        pass
-                
-                # Column F: SCRIP NUMBER
-                cell_f = ws.cell(row=row, column=6)
-                if cell_f.value is not None and str(cell_f.value).strip():
-                    try:
-                        cell_f.value = int(float(cell_f.value))
-                    except:
-                        pass
-                
-                # Column I: SCRIP ISSUE AMOUNT
-                cell_i = ws.cell(row=row, column=9)
-                if cell_i.value is not None and str(cell_i.value).strip():
-                    try:
-                        cell_i.value = float(cell_i.value)
-                        cell_i.number_format = '#,##0.00'
-                    except:
-                        pass
-                
-                # Column J: SCRIP BALANCE AMOUNT
-                cell_j = ws.cell(row=row, column=10)
-                if cell_j.value is not None and str(cell_j.value).strip():
-                    try:
-                        cell_j.value = float(cell_j.value)
-                        cell_j.number_format = '#,##0.00'
-                    except:
-                        pass
-            
-            # Set column widths for RODTEP Scrip (13 columns: A-M)
-            column_widths = {
-                'A': 8,   # Sr. No.
-                'B': 15,  # SCROLL NUMBER
-                'C': 15,  # SB NUMBER
-                'D': 12,  # SB DATE
-                'E': 12,  # SB AMOUNT
-                'F': 15,  # SCRIP NUMBER
-                'G': 15,  # SCRIP ISSUE DATE
-                'H': 15,  # SCRIP EXPIRY DATE
-                'I': 18,  # SCRIP ISSUE AMOUNT
-                'J': 18,  # SCRIP BALANCE AMOUNT
-                'K': 18,  # SCRIP TRANSFER DATE
-                'L': 15,  # SCRIP STATUS
-                'M': 20,  # Application Ref. No
-            }
-            
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
-            
-            # Center align all data cells for RODTEP Scrip (columns A-M, starting from row 4)
-            # Except for amount columns (I and J) which are right-aligned
-            for row in range(4, len(processed_df) + 1):  # Data starts from row 4
-                for col in range(1, 14):  # Columns A-M (1-13)
-                    cell = ws.cell(row=row, column=col)
-                    # Don't center align amounts (columns I and J) - right align for numbers
-                    if col in [9, 10]:  # Columns I and J (SCRIP ISSUE AMOUNT, SCRIP BALANCE AMOUNT)
-                        cell.alignment = Alignment(horizontal='right')
-                    else:
-                        cell.alignment = Alignment(horizontal='center')   
-        else:
-            # Default column widths for other processes
-            column_widths = {
-                'A': 15,
-                'B': 15,
-                'C': 15,
-                'D': 15,
-                'E': 15,
-                'F': 15,
-                'G': 15,
-                'H': 15,
-                'I': 15,
-                'J': 15,  # Added for processes that might have 10 columns
-                'K': 15,  # Added for BRC (11 columns)
-                'L': 15,  # Added for BRC (12 columns)
-                'M': 15,  # Added for RODTEP Scrip (13 columns)
-            }
-        
-        # Apply column widths (for processes other than rodtep_scrip which already applied them)
-        if process_type != 'rodtep_scrip':
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
-        
-        # Center align all data cells for other processes
-        center_alignment = Alignment(horizontal='center')
-        
-        if process_type == 'dbk_pendency':
-            # For DBK Pendency, align data from row 5 onwards (columns A-F)
-            for row in range(5, len(processed_df) + 1):
-                for col in range(1, 7):  # Columns A-F
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = center_alignment
-        elif process_type == 'brc':
-            # For BRC, align data from row 4 onwards (columns A-L)
-            for row in range(4, len(processed_df) + 1):
-                for col in range(1, 13):  # Columns A-L (1-12)
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = center_alignment
-        elif process_type == 'igst_scroll':
-            # For IGST Scroll, align data from row 7 onwards (columns A-J)
-            for row in range(7, len(processed_df) + 1):
-                for col in range(1, 11):  # Columns 1 to 10 (A-J)
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = center_alignment
-        elif process_type == 'rodtep_scroll':
-            # For RODTEP Scroll, align data from row 4 onwards (columns A-G)
-            for row in range(4, len(processed_df) + 1):
-                for col in range(1, 8):  # Columns A-G
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = center_alignment
-        elif process_type == 'dbk_disbursement':
-            # For DBK Disbursement, align data from row 5 onwards (columns A-I)
-            for row in range(5, len(processed_df) + 1):
-                for col in range(1, 10):  # Columns A-I
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = center_alignment
-        # Note: rodtep_scrip alignment is already handled above
-        
-        # Save workbook to bytes first
-        wb.save(output)
-        output.seek(0)
-        
+        # Look up the per-process formatting spec (data-driven, see PROCESS_SPECS)
+        spec = PROCESS_SPECS.get(process_type, DEFAULT_SPEC)
+        data_start_row = spec['data_start_row']
+        int_cols = spec['int_cols']
+        float_cols = spec['float_cols']
+        money_cols = spec['money_cols']
+        center_cols = spec['center_cols']
+        right_cols = spec['right_cols']
+        column_widths = spec['widths']
+
+        # Coerce numeric columns column-wise with pandas before the write loop,
+        # so the per-cell try/except disappears from the hot path. Only the data
+        # rows are touched - the report header rows above data_start_row keep
+        # their text values. Unparseable values keep their original content.
+        if data_start_row > 0:
+            first_data_idx = data_start_row - 1
+            for col_num in (int_cols | money_cols | float_cols):
+                col_idx = col_num - 1
+                if col_idx >= n_cols:
+                    continue
+                series = processed_df.iloc[first_data_idx:, col_idx]
+                coerced = pd.to_numeric(series, errors='coerce')
+                if col_num in int_cols:
+                    # One truncating pass per column (JIT above the row
+                    # threshold, numpy below - both truncate toward zero
+                    # like the old per-cell int()). A plain astype('Int64')
+                    # would refuse the whole column when any single value
+                    # is fractional
+                    values, null_mask = numba_util.coerce_int_col(
+                        coerced.to_numpy(dtype='float64'))
+                    coerced = pd.Series(
+                        pd.arrays.IntegerArray(values, null_mask),
+                        index=coerced.index)
+                processed_df.iloc[first_data_idx:, col_idx] = series.where(coerced.isna(), coerced)
+
+        # Convert NaN to None once at the DataFrame level - both writers emit
+        # None as an empty cell, so the write loop needs no per-cell pd.isna branch
+        processed_df = processed_df.astype(object).where(processed_df.notna(), None)
+
         # Generate filename
         process_filename = get_process_filename(process_type)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+
         if process_type in ['dbk_disbursement', 'dbk_pendency', 'brc']:
             download_name = f"merged_{process_filename}_{timestamp}.xlsx"
         else:
             download_name = f"{process_filename}_{timestamp}.xlsx"
-        
+
         # Create a temporary file to save the processed Excel
         temp_dir = tempfile.mkdtemp()
         temp_file_path = os.path.join(temp_dir, download_name)
-        
-        # Save the workbook to the temp file
-        wb.save(temp_file_path)
-        
+
+        if process_type in FAST_XLSX_PROCESSES:
+            # High-row-count processes: stream OOXML directly into the zip,
+            # bypassing openpyxl's cell model entirely (see fast_xlsx.py)
+            col_styles = {}
+            for col_num in range(1, n_cols + 1):
+                if col_num in money_cols:
+                    col_styles[col_num] = (fast_xlsx.STYLE_MONEY_RIGHT if col_num in right_cols
+                                           else fast_xlsx.STYLE_MONEY_CENTER)
+                elif col_num in right_cols:
+                    col_styles[col_num] = fast_xlsx.STYLE_RIGHT
+                elif col_num in center_cols:
+                    col_styles[col_num] = fast_xlsx.STYLE_CENTER
+
+            rows = processed_df.itertuples(index=False, name=None)
+            serialize_fn = lambda target: fast_xlsx.write_xlsx(
+                target,
+                rows,
+                column_widths=column_widths,
+                col_styles=col_styles,
+                data_start_row=data_start_row,
+            )
+        else:
+            # Create a write-only workbook so rows stream straight into the XLSX
+            # zip instead of building the full cell tree in memory
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(title='Sheet1')
+
+            # Column widths must be set before any rows are appended in write-only
+            # mode. Build every ColumnDimension up front and install them with one
+            # dict update instead of autovivifying through column_dimensions[col]
+            # per key. Uniform alignment also rides on the <col> element - Excel
+            # applies it to any cell without an explicit style, so the sheet XML
+            # carries one style index per column, not per cell
+            dims = {}
+            for col_num in range(1, n_cols + 1):
+                col = get_column_letter(col_num)
+                dim = ColumnDimension(ws, index=col, width=column_widths.get(col, 15))
+                if col_num in right_cols:
+                    dim.alignment = RIGHT
+                elif col_num in center_cols:
+                    dim.alignment = CENTER
+                dims[col] = dim
+            ws.column_dimensions.update(dims)
+
+            # Per-cell styling survives only for the exceptions: money columns
+            # need a number format, which would misformat the header rows if
+            # set column-wide. Register the two money variants as named styles
+            # once per workbook - cell.style = '<name>' then reuses a single
+            # interned style index instead of rebuilding number_format and
+            # alignment for every cell
+            wb.add_named_style(NamedStyle(name='money2', number_format=FMT_MONEY, alignment=RIGHT))
+            wb.add_named_style(NamedStyle(name='money2_center', number_format=FMT_MONEY, alignment=CENTER))
+
+            # col_num -> named style for money cells
+            col_spec = {}
+            for col_num in money_cols:
+                if col_num <= n_cols:
+                    col_spec[col_num] = 'money2' if col_num in right_cols else 'money2_center'
+
+            # Columns whose <col> alignment must NOT bleed into the report
+            # header rows; those few cells get an explicit default style,
+            # mirroring how fast_xlsx gates col_styles on data_start_row
+            header_aligned_cols = (right_cols | center_cols) if data_start_row > 0 else set()
+
+            # Write data row by row, applying the money format in the same
+            # streaming pass (write-only cells can't be revisited).
+            # itertuples yields plain tuples; iterrows would build a Series
+            # per row, which dominates the loop on large sheets
+            for row_idx, row in enumerate(processed_df.itertuples(index=False, name=None)):
+                excel_row = row_idx + 1
+                cells = []
+
+                for col_idx, value in enumerate(row):
+                    cell = WriteOnlyCell(ws, value=value)
+
+                    if data_start_row > 0 and excel_row >= data_start_row:
+                        cspec = col_spec.get(col_idx + 1)
+                        if cspec and isinstance(cell.value, (int, float)):
+                            # The named style carries the alignment too, since
+                            # an explicit style replaces the column default
+                            cell.style = cspec
+                    elif (col_idx + 1) in header_aligned_cols:
+                        # Header row cell in an aligned column: pin the
+                        # default alignment so it renders as the baseline
+                        # did (left), not centered/right via the column
+                        cell.alignment = HEADER_ALIGN
+
+                    cells.append(cell)
+
+                ws.append(cells)
+
+            serialize_fn = wb.save
+
+        # Serialize the workbook once, straight to disk - with the complete
+        # file on disk werkzeug serves it through wsgi.file_wrapper (sendfile
+        # on platforms that have it) and can answer Range/If-None-Match
+        # requests, which need the final size, mtime and ETag up front
+        serialize_fn(temp_file_path)
+
         print(f"\n✓ File saved to temp location: {temp_file_path}")
-        
-        # Start automation in background with the temp file path
+
+        # Give the background automation its own path so its cleanup can't
+        # delete the file while the response is still being sent. A hardlink
+        # shares the inode, so nothing is re-copied; either path can be
+        # removed independently and the data survives until both are gone
+        automation_dir = tempfile.mkdtemp()
+        automation_path = os.path.join(automation_dir, download_name)
+        try:
+            os.link(temp_file_path, automation_path)
+        except OSError:
+            # Hardlinks unavailable (Windows without privileges, cross-device)
+            shutil.copy(temp_file_path, automation_path)
+
+        # Queue automation on the bounded pool with its copy of the file
         print(f"Starting CIP-Signal automation for process: {process_type}...")
-        
-        # Run automation in a separate thread
-        automation_thread = threading.Thread(
-            target=run_cip_automation_background, 
-            args=(process_type, iec_number, temp_file_path, brc_type)  # Pass brc_type here
+        AUTOMATION_POOL.submit(
+            run_cip_automation_background,
+            process_type, iec_number, automation_path, brc_type  # Pass brc_type here
         )
-        automation_thread.daemon = True
-        automation_thread.start()
-        
+
+        # Delete the response temp file once the download has been served
+        @after_this_request
+        def _cleanup_response_file(response):
+            try:
+                os.remove(temp_file_path)
+            except OSError:
+                pass
+            return response
+
         # Send the file for download
         return send_file(
-            output,
+            temp_file_path,
             as_attachment=True,
             download_name=download_name,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            conditional=True,
+            etag=True
         )
         
     except ImportError as e:
@@ -587,6 +548,13 @@ def process_files():
             except:
                 pass
         return jsonify({'error': str(e)}), 500
+    finally:
+        # The uploads have been parsed by this point; drop their temp files
+        for upload_path in upload_paths:
+            try:
+                os.remove(upload_path)
+            except OSError:
+                pass
 
 if __name__ == '__main__':
     print("="*60)
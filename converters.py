@@ -3,17 +3,220 @@ Excel conversion functions for different process types
 """
 
 import pandas as pd
-import io
+import numpy as np
 from typing import List, Tuple, Dict, Optional
+import logging
 import re
-import datetime
 import os
+import pickle
+import openpyxl
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Hot-path diagnostics go through the logger and stay silent by default -
+# raise the level to DEBUG to get the old per-file/per-row traces back
+logging.basicConfig(level=logging.WARNING)
+log = logging.getLogger(__name__)
+
+# Optional Aho-Corasick support for single-pass keyword scans; the plain
+# substring loops remain as the fallback when pyahocorasick isn't installed
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Arrow-backed strings (contiguous buffer + offsets) when pyarrow is
+# installed; plain object-backed string dtype otherwise
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
+# Rust-backed calamine parser for .xlsx reads when python-calamine is
+# installed (pandas >= 2.2); openpyxl remains the fallback engine
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+
+# Hot-path regexes compiled once at import instead of per call
+_FILE_NUM_RE = re.compile(r'\((\d+)\)')
+_PIN6_RE = re.compile(r'\b(\d{6})\b')
+_WORD_RE = re.compile(r'\b\w+\b')
+_CODE_RE = re.compile(r'\b([A-Z]{2}\d{4}|[A-Z]{2}\d{3}[A-Z]|[A-Z]{6})\b')
+# BRC header keywords used to spot a repeated header row in merged files
+_BRC_HDR_RE = re.compile('brc|sb|date|number|port|invoice|currency|realization')
+# Full header phrases joined into one alternation, so a repeated header row
+# inside the data is found with a single regex pass per column
+_BRC_HEADER_ROW_RE = re.compile('|'.join(map(re.escape, (
+    'brc number', 'brc date', 'brc status', 'invoice number',
+    'sb number', 'port code', 'sb date', 'realised value',
+    'currency', 'realization_date', 'brc utilisation status'))),
+    re.IGNORECASE)
+# Common port-name prefixes/suffixes stripped when building name variants;
+# one alternation replaces a sub() per prefix
+_STRIP_RE = re.compile(
+    r'\b(CUSTOM HOUSE|CUSTOMS HOUSE|SEAPORT|PORT|AIR CARGO COMPLEX|ACC|ICD|LCS|'
+    r'LAND CUSTOMS STATION)[,\s]*', re.IGNORECASE)
+
+# Characters stripped from amount columns before the numeric cast: grouping
+# commas, the currency symbols seen in RODTEP amounts, whitespace. A
+# translation table deletes them all in one C-level pass per string
+_NUM_STRIP_TRANS = str.maketrans('', '', ',₹$€£¥ \t\n\r\x0b\x0c\xa0')
+# Everything but digits, for identifier columns
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+# Dominant dd.mm.yyyy date shape, parsed on a fast path before the cascade
+_DOT_DATE_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})$')
+
+# Date formats tried in order by the vectorized date parser
+_DATE_FORMATS = [
+    '%d-%b-%y',      # 09-Jul-25 (two-digit year becomes 20XX)
+    '%d-%b-%Y',      # 09-Jul-2025
+    '%Y-%m-%d',      # 2025-07-09
+    '%d/%m/%Y',      # 09/07/2025
+    '%m/%d/%Y',      # 07/09/2025
+    '%Y/%m/%d',      # 2025/07/09
+    '%d-%m-%Y',      # 09-07-2025
+    '%m-%d-%Y',      # 07-09-2025
+    '%d.%m.%Y',      # 09.07.2025
+    '%d.%m.%y',      # 09.07.25 (two-digit year becomes 20XX)
+]
+
+
+def parse_date_series(s: pd.Series) -> pd.Series:
+    """Parse a date column, trying each known format over the whole Series at
+    once instead of once per cell; whatever is still unparsed goes through
+    pandas' flexible parser in a single final pass. Returns datetimes with
+    NaT for unparseable values."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    if pd.api.types.is_numeric_dtype(s):
+        # Excel serial dates count days from 1899-12-30
+        return pd.to_datetime(s, unit='D', origin='1899-12-30', errors='coerce')
+
+    out = pd.Series(pd.NaT, index=s.index, dtype='datetime64[ns]')
+
+    # Excel serial numbers hiding inside object columns convert in one
+    # origin-based pass instead of a Timestamp + Timedelta pair per value
+    num_mask = s.map(lambda v: isinstance(v, (int, float, np.integer, np.floating))
+                     and not isinstance(v, bool))
+    if num_mask.any():
+        out.loc[num_mask] = pd.to_datetime(
+            s[num_mask].astype('float64'), unit='D', origin='1899-12-30', errors='coerce')
+
+    str_mask = ~num_mask
+
+    # Fast path for the dominant dd.mm.yyyy inputs: one regex extract plus a
+    # single year/month/day assembly handles the whole column without
+    # touching the per-format cascade below
+    if str_mask.any():
+        parts = s[str_mask].astype(str).str.strip().str.extract(_DOT_DATE_RE)
+        got = parts[0].notna()
+        if got.any():
+            years = pd.to_numeric(parts.loc[got, 2])
+            # Two-digit years become 20XX, as the old per-cell parser did
+            years = years.where(years >= 100, years + 2000)
+            out.loc[got.index[got]] = pd.to_datetime(
+                pd.DataFrame({'year': years,
+                              'month': pd.to_numeric(parts.loc[got, 1]),
+                              'day': pd.to_numeric(parts.loc[got, 0])}),
+                errors='coerce')
+
+    for fmt in _DATE_FORMATS:
+        mask = out.isna() & str_mask
+        if not mask.any():
+            break
+        out.loc[mask] = pd.to_datetime(s[mask], format=fmt, errors='coerce')
+
+    leftover = out.isna() & str_mask
+    if leftover.any():
+        out.loc[leftover] = pd.to_datetime(s[leftover], errors='coerce', dayfirst=True)
+
+    return out
+
+
+def format_date_series(s: pd.Series, fmt: str = '%d-%b-%Y') -> pd.Series:
+    """Parse and render a date column as strings; unparseable values become ''"""
+    return parse_date_series(s).dt.strftime(fmt).fillna('')
+
+
+def to_number_series(s: pd.Series) -> pd.Series:
+    """Coerce a column to numbers in one pass. One compiled regex strips
+    everything but digits, '.' and '-' (currency symbols, commas, spaces)
+    before the numeric cast, replacing the per-cell character filter. Whole
+    values come back as ints, fractional as floats, unparseable as None."""
+    cleaned = s.astype(str).str.replace(r'[^\d.\-]', '', regex=True)
+    num = pd.to_numeric(cleaned, errors='coerce')
+    # Work on the raw object array: Series setitem would re-coerce the ints
+    # straight back to floats
+    arr = num.to_numpy()
+    is_whole = (num.notna() & (num % 1 == 0)).to_numpy()
+    out = arr.astype(object)
+    out[is_whole] = arr[is_whole].astype(np.int64)
+    out[num.isna().to_numpy()] = None
+    return pd.Series(out, index=s.index, dtype=object)
+
+
+def clean_number_series(s: pd.Series) -> pd.Series:
+    """Stricter sibling of to_number_series for the BRC/IGST converters:
+    only commas, currency symbols and whitespace are stripped, so values
+    with stray letters stay unparseable instead of losing characters. Whole
+    values come back as ints, fractional as floats, the rest as ''."""
+    if pd.api.types.is_integer_dtype(s):
+        # Already integral - skip the cleanup and the whole-number mask
+        out = s.to_numpy(dtype=object)
+        na = s.isna().to_numpy()
+        if na.any():
+            out[na] = ''
+        return pd.Series(out, index=s.index, dtype=object)
+    if pd.api.types.is_numeric_dtype(s):
+        num = pd.to_numeric(s, errors='coerce')
+    else:
+        cleaned = s.astype(str).str.translate(_NUM_STRIP_TRANS)
+        num = pd.to_numeric(cleaned, errors='coerce')
+    # Same object-array dance as to_number_series so the ints survive
+    arr = num.to_numpy()
+    is_whole = (num.notna() & (num % 1 == 0)).to_numpy()
+    out = arr.astype(object)
+    out[is_whole] = arr[is_whole].astype(np.int64)
+    out[num.isna().to_numpy()] = ''
+    return pd.Series(out, index=s.index, dtype=object)
+
+
+def to_integer_series(s: pd.Series) -> pd.Series:
+    """Digits-only coercion for identifier columns (SB numbers, scrip
+    numbers): every non-digit character is stripped before the cast, so
+    formatted identifiers still resolve. Values with no digits at all come
+    back as ''."""
+    if pd.api.types.is_integer_dtype(s):
+        # Already integral - nothing to strip or truncate
+        out = s.to_numpy(dtype=object)
+        na = s.isna().to_numpy()
+        if na.any():
+            out[na] = ''
+        return pd.Series(out, index=s.index, dtype=object)
+    if pd.api.types.is_numeric_dtype(s):
+        num = pd.to_numeric(s, errors='coerce')
+    else:
+        digits = s.astype(str).str.replace(_NON_DIGIT_RE, '', regex=True)
+        num = pd.to_numeric(digits, errors='coerce')
+    arr = num.to_numpy()
+    na = num.isna().to_numpy()
+    out = np.empty(len(arr), dtype=object)
+    out[~na] = arr[~na].astype(np.int64)
+    out[na] = ''
+    return pd.Series(out, index=s.index, dtype=object)
 
 
 def extract_file_number(filename: str) -> int:
     """Extract sequence number from filename (1), (2), etc."""
     filename = filename.split('.')[0]
-    match = re.search(r'\((\d+)\)', filename)
+    match = _FILE_NUM_RE.search(filename)
     if match:
         try:
             return int(match.group(1))
@@ -22,7 +225,7 @@ def extract_file_number(filename: str) -> int:
     return 0
 
 
-def sort_files_by_sequence(files: List[Tuple[str, bytes]]) -> List[Tuple[str, bytes]]:
+def sort_files_by_sequence(files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
     """Sort files by extracted sequence number"""
     files_info = []
     
@@ -39,23 +242,46 @@ def sort_files_by_sequence(files: List[Tuple[str, bytes]]) -> List[Tuple[str, by
     return [(info['filename'], info['data']) for info in files_info]
 
 
+# Pickled copy of the built port mapping, written next to the workbook and
+# invalidated whenever the workbook is newer
+_PORT_CACHE_FILE = "port_mapping.pkl"
+
+
 def load_port_code_mapping() -> Dict[str, str]:
     """Load port code mapping from Port Code List.xlsx"""
+    # Entries memoized against a previous mapping are stale now
+    _port_code_cache.clear()
+    _word_index_cache.clear()
+    _key_arrays_cache.clear()
+    _keyword_automaton_cache.clear()
+    _code_set_cache.clear()
     port_mapping = {}
     reverse_port_mapping = {}  # For searching by code
     
     try:
         # First check if the port code file exists in the current directory
         port_file_path = "Port Code List.xlsx"
-        
+
         if os.path.exists(port_file_path):
+            # Warm start: reuse the pickled mapping when it's at least as new
+            # as the workbook, skipping the xlsx parse and variant generation
+            try:
+                if (os.path.exists(_PORT_CACHE_FILE) and
+                        os.path.getmtime(_PORT_CACHE_FILE) >= os.path.getmtime(port_file_path)):
+                    with open(_PORT_CACHE_FILE, 'rb') as f:
+                        port_mapping = pickle.load(f)
+                    log.debug(f"Loaded {len(port_mapping)} port code mappings from cache")
+                    return port_mapping
+            except Exception as e:
+                log.warning(f"Could not use port mapping cache: {e}")
+
             # Load the port code mapping file
             port_df = pd.read_excel(port_file_path)
             
             # Clean column names (remove newlines)
             port_df.columns = [col.replace('\n', ' ').strip() for col in port_df.columns]
             
-            print(f"Port file columns: {port_df.columns.tolist()}")
+            log.debug(f"Port file columns: {port_df.columns.tolist()}")
             
             # Look for the correct columns - based on the file structure
             # Column A: Sl no
@@ -66,16 +292,20 @@ def load_port_code_mapping() -> Dict[str, str]:
             location_code_col = None
             location_name_col = None
             state_col = None
-            
-            # Try to find columns by common patterns
-            for col in port_df.columns:
-                col_lower = str(col).lower()
-                if 'code' in col_lower and 'location' in col_lower:
-                    location_code_col = col
-                elif 'name' in col_lower and 'location' in col_lower:
-                    location_name_col = col
-                elif 'state' in col_lower:
-                    state_col = col
+
+            # Try to find columns by common patterns - matched over the whole
+            # Index at once instead of a per-column Python loop
+            cols_lower = port_df.columns.map(lambda c: str(c).lower())
+            has_loc = cols_lower.str.contains('location', regex=False)
+            is_code = has_loc & cols_lower.str.contains('code', regex=False)
+            is_name = has_loc & ~is_code & cols_lower.str.contains('name', regex=False)
+            is_state = ~is_code & ~is_name & cols_lower.str.contains('state', regex=False)
+            if is_code.any():
+                location_code_col = port_df.columns[is_code][-1]
+            if is_name.any():
+                location_name_col = port_df.columns[is_name][-1]
+            if is_state.any():
+                state_col = port_df.columns[is_state][-1]
             
             # If not found by patterns, use positional mapping
             if not location_code_col and len(port_df.columns) >= 2:
@@ -85,101 +315,210 @@ def load_port_code_mapping() -> Dict[str, str]:
             if not state_col and len(port_df.columns) >= 5:
                 state_col = port_df.columns[4]  # Column E
             
-            print(f"Using Location Code column: '{location_code_col}'")
-            print(f"Using Location Name column: '{location_name_col}'")
-            print(f"Using State column: '{state_col if state_col else 'Not found'}'")
-            
-            # Create comprehensive mapping
-            for _, row in port_df.iterrows():
-                try:
-                    location_code = row[location_code_col] if location_code_col in row else None
-                    location_name = row[location_name_col] if location_name_col in row else None
-                    
-                    if pd.notna(location_code) and pd.notna(location_name):
-                        location_code_str = str(location_code).strip()
-                        location_name_str = str(location_name).strip()
-                        
-                        # Add primary mapping
-                        port_mapping[location_name_str] = location_code_str
-                        
-                        # Store reverse mapping
-                        reverse_port_mapping[location_code_str] = location_name_str
-                        
-                        # Add mapping with state if available
-                        if state_col and state_col in row:
-                            state = str(row[state_col]).strip() if pd.notna(row[state_col]) else ''
-                            if state:
-                                port_mapping[f"{location_name_str} - {state}"] = location_code_str
-                        
-                        # Extract 6-digit PIN codes if present
-                        pin_codes = re.findall(r'\b(\d{6})\b', location_name_str)
-                        for pin in pin_codes:
-                            port_mapping[pin] = location_code_str
-                        
-                        # Create variations of the location name for better matching
-                        # 1. Remove common prefixes/suffixes
-                        clean_name = location_name_str
-                        prefixes_to_remove = ['CUSTOM HOUSE', 'CUSTOMS HOUSE', 'SEAPORT', 'PORT', 
-                                            'AIR CARGO COMPLEX', 'ACC', 'ICD', 'LCS', 'LAND CUSTOMS STATION']
-                        
-                        for prefix in prefixes_to_remove:
-                            if prefix in clean_name.upper():
-                                clean_name = re.sub(f'{prefix}[,\\s]*', '', clean_name, flags=re.IGNORECASE).strip()
-                        
-                        if clean_name and clean_name != location_name_str:
-                            port_mapping[clean_name] = location_code_str
-                        
-                        # 2. Create acronym or short form
-                        words = re.split(r'[,\s-]+', clean_name)
-                        if len(words) > 1:
-                            # Take first letters of major words
-                            short_form = ''.join([w[0].upper() for w in words if w and len(w) > 2])
-                            if short_form:
-                                port_mapping[short_form] = location_code_str
-                        
-                        # 3. Create mapping without special characters
-                        clean_name_no_special = re.sub(r'[^\w\s-]', ' ', location_name_str)
-                        clean_name_no_special = re.sub(r'\s+', ' ', clean_name_no_special).strip()
-                        if clean_name_no_special and clean_name_no_special != location_name_str:
-                            port_mapping[clean_name_no_special] = location_code_str
-                
-                except Exception as e:
-                    print(f"Error processing row {_}: {e}")
-                    continue
+            log.debug(f"Using Location Code column: '{location_code_col}'")
+            log.debug(f"Using Location Name column: '{location_name_col}'")
+            log.debug(f"Using State column: '{state_col if state_col else 'Not found'}'")
             
-            print(f"Loaded {len(port_mapping)} port code mappings")
+            # Create comprehensive mapping - each variant family is derived
+            # column-wise and merged with one dict update instead of building
+            # every string per row in Python
+            codes = port_df[location_code_col].astype('string').str.strip()
+            names = port_df[location_name_col].astype('string').str.strip()
+
+            valid = codes.notna() & names.notna()
+            codes = codes[valid]
+            names = names[valid]
+
+            # Add primary mapping
+            port_mapping.update(zip(names, codes))
+
+            # Store reverse mapping
+            reverse_port_mapping.update(zip(codes, names))
+
+            # Add mapping with state if available
+            if state_col:
+                states = port_df[state_col].astype('string').str.strip()[valid].fillna('')
+                has_state = states != ''
+                port_mapping.update(
+                    zip(names[has_state] + ' - ' + states[has_state], codes[has_state]))
+
+            # Extract 6-digit PIN codes if present
+            pins = names.str.extractall(_PIN6_RE)[0]
+            if len(pins):
+                port_mapping.update(
+                    zip(pins, codes.reindex(pins.index.get_level_values(0))))
+
+            # Create variations of the location name for better matching
+            # 1. Remove common prefixes/suffixes in one alternation pass
+            cleaned = names.str.replace(_STRIP_RE, '', regex=True).str.strip()
+            changed = (cleaned != '') & (cleaned != names)
+            port_mapping.update(zip(cleaned[changed], codes[changed]))
+
+            # 2. Create acronym or short form - first letters of major words;
+            # this one stays a (small) Python loop per row
+            for clean_name, location_code_str in zip(cleaned.tolist(), codes.tolist()):
+                words = re.split(r'[,\s-]+', clean_name)
+                if len(words) > 1:
+                    short_form = ''.join([w[0].upper() for w in words if w and len(w) > 2])
+                    if short_form:
+                        port_mapping[short_form] = location_code_str
+
+            # 3. Create mapping without special characters
+            no_special = (names.str.replace(r'[^\w\s-]', ' ', regex=True)
+                               .str.replace(r'\s+', ' ', regex=True).str.strip())
+            changed = (no_special != '') & (no_special != names)
+            port_mapping.update(zip(no_special[changed], codes[changed]))
             
-            # Debug: Print some sample mappings
-            print("\nSample port mappings:")
-            sample_count = 0
-            for key, value in list(port_mapping.items()):
-                if 'NHAVA' in key.upper() or 'SAHAR' in key.upper() or '400707' in key or '400099' in key:
-                    display_key = key if len(key) <= 60 else key[:57] + "..."
-                    print(f"  '{display_key}' -> '{value}'")
-                    sample_count += 1
-                if sample_count >= 10:
-                    break
-        
+            log.debug(f"Loaded {len(port_mapping)} port code mappings")
+
+            # Debug: Print some sample mappings (skip the scan entirely when
+            # nobody is listening)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Sample port mappings:")
+                sample_count = 0
+                for key, value in list(port_mapping.items()):
+                    if 'NHAVA' in key.upper() or 'SAHAR' in key.upper() or '400707' in key or '400099' in key:
+                        display_key = key if len(key) <= 60 else key[:57] + "..."
+                        log.debug(f"  '{display_key}' -> '{value}'")
+                        sample_count += 1
+                    if sample_count >= 10:
+                        break
+
+            # Persist the built mapping for the next start
+            try:
+                with open(_PORT_CACHE_FILE, 'wb') as f:
+                    pickle.dump(port_mapping, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                log.warning(f"Could not write port mapping cache: {e}")
+
         else:
-            print(f"Port Code List file not found at: {port_file_path}")
+            log.warning(f"Port Code List file not found at: {port_file_path}")
             
     except Exception as e:
-        print(f"Error loading port code mapping: {e}")
-        import traceback
-        traceback.print_exc()
-    
+        log.warning(f"Error loading port code mapping: {e}", exc_info=True)
+
     return port_mapping
 
 
+# Known aliases for the ports we see most, tried before any fuzzy work
+_COMMON_KEYWORDS = {
+    'NHAVA SHEVA': 'INNSA1',
+    'JNCH': 'INNSA1',
+    'SAHAR ANDHERI': 'INBOM4',
+    'SAHAR, ANDHERI': 'INBOM4',
+    'MUMBAI AIRPORT': 'INBOM4',
+    'AIR CARGO SAHAR': 'INBOM4',
+    '400707': 'INNSA1',  # PIN for NHAVA SHEVA
+    '400099': 'INBOM4',  # PIN for SAHAR ANDHERI
+}
+
+_FUZZY_MATCHES = {
+    'JNCH, NHAVA SHEVA': 'INNSA1',
+    'NHAVA SHEVA PORT': 'INNSA1',
+    'SAHAR AIR CARGO': 'INBOM4',
+    'ANDHERI AIR CARGO': 'INBOM4',
+    'MUMBAI SAHAR': 'INBOM4',
+}
+
+# Aho-Corasick automaton per mapping covering keywords, aliases and mapping
+# keys - one O(len(input)) walk replaces the per-dict substring loops
+_keyword_automaton_cache: Dict[int, object] = {}
+
+
+def _get_keyword_automaton(port_mapping: Dict[str, str]):
+    """Build (or fetch) the keyword automaton for a mapping"""
+    auto = _keyword_automaton_cache.get(id(port_mapping))
+    if auto is None:
+        merged = {str(k).upper(): v for k, v in port_mapping.items()}
+        merged.update(_FUZZY_MATCHES)
+        merged.update(_COMMON_KEYWORDS)
+        auto = ahocorasick.Automaton()
+        for keyword, code in merged.items():
+            auto.add_word(keyword, (len(keyword), code))
+        auto.make_automaton()
+        _keyword_automaton_cache[id(port_mapping)] = auto
+    return auto
+
+
+# Memo for get_port_code - merges see few distinct port names, so the fuzzy
+# scan runs once per unique string instead of once per row. Keyed by the
+# mapping object's id so a freshly loaded mapping starts clean
+_port_code_cache: Dict[Tuple[int, str], str] = {}
+
+# Inverted word index per mapping: word -> keys containing it, plus each
+# key's precomputed word set, so the fuzzy scorer only visits keys that
+# share a word with the input instead of the whole mapping
+_word_index_cache: Dict[int, Tuple[Dict[str, set], Dict[str, frozenset]]] = {}
+
+
+def _get_word_index(port_mapping: Dict[str, str]):
+    """Build (or fetch) the inverted word index for a mapping"""
+    cached = _word_index_cache.get(id(port_mapping))
+    if cached is None:
+        word_index = {}
+        key_words = {}
+        for key in port_mapping:
+            words = frozenset(_WORD_RE.findall(str(key).lower()))
+            key_words[key] = words
+            for w in words:
+                word_index.setdefault(w, set()).add(key)
+        cached = (word_index, key_words)
+        _word_index_cache[id(port_mapping)] = cached
+    return cached
+
+
+# Parallel arrays over the mapping keys (lowercased keys, position lookup,
+# codes) so candidate scoring can run through numpy's C string ops instead
+# of lowercasing and substring-testing each key per call
+_key_arrays_cache: Dict[int, Tuple[np.ndarray, Dict[str, int], np.ndarray]] = {}
+
+
+def _get_key_arrays(port_mapping: Dict[str, str]):
+    """Build (or fetch) the scoring arrays for a mapping"""
+    cached = _key_arrays_cache.get(id(port_mapping))
+    if cached is None:
+        keys = list(port_mapping.keys())
+        keys_lower = np.array([str(k).lower() for k in keys])
+        codes = np.array([port_mapping[k] for k in keys], dtype=object)
+        key_pos = {k: i for i, k in enumerate(keys)}
+        cached = (keys_lower, key_pos, codes)
+        _key_arrays_cache[id(port_mapping)] = cached
+    return cached
+
+
+# Every code that appears as a mapping value, for the "input is already a
+# port code" fast path - covers codes the structural 6-char check misses
+_code_set_cache: Dict[int, frozenset] = {}
+
+
+def _get_code_set(port_mapping: Dict[str, str]) -> frozenset:
+    """Build (or fetch) the set of known port codes for a mapping"""
+    cached = _code_set_cache.get(id(port_mapping))
+    if cached is None:
+        cached = frozenset(port_mapping.values())
+        _code_set_cache[id(port_mapping)] = cached
+    return cached
+
+
 def get_port_code(port_name: str, port_mapping: Dict[str, str]) -> str:
     """Get port code from port name using mapping"""
     if not port_name or pd.isna(port_name):
         return ''
-    
+
     port_str = str(port_name).strip()
     if not port_str:
         return ''
-    
+
+    cache_key = (id(port_mapping), port_str)
+    code = _port_code_cache.get(cache_key)
+    if code is None:
+        code = _resolve_port_code(port_str, port_mapping)
+        _port_code_cache[cache_key] = code
+    return code
+
+
+def _resolve_port_code(port_str: str, port_mapping: Dict[str, str]) -> str:
+    """Uncached lookup behind get_port_code"""
     # If it's already a 6-character code (like INNSA1)
     if len(port_str) == 6 and port_str.isalnum() and port_str[:2].isalpha() and port_str[2:].isalnum():
         return port_str
@@ -187,244 +526,336 @@ def get_port_code(port_name: str, port_mapping: Dict[str, str]) -> str:
     # Check if it's already in the mapping (exact match)
     if port_str in port_mapping:
         return port_mapping[port_str]
-    
+
     # Clean the port string
     port_clean = port_str.upper()
-    
+
+    # Upper-cased exact match, then "already a code" check - realistic BRC
+    # data mostly hits one of these and never reaches the fuzzy fallback
+    code = port_mapping.get(port_clean)
+    if code is not None:
+        return code
+    if port_clean in _get_code_set(port_mapping):
+        return port_clean
+
     # Try to find 6-digit PIN code in the string
-    pin_match = re.search(r'\b(\d{6})\b', port_clean)
+    pin_match = _PIN6_RE.search(port_clean)
     if pin_match:
         pin_code = pin_match.group(1)
         if pin_code in port_mapping:
             return port_mapping[pin_code]
     
     # Try partial matches with priority
-    # 1. Try matching by common keywords first
-    common_keywords = {
-        'NHAVA SHEVA': 'INNSA1',
-        'JNCH': 'INNSA1',
-        'SAHAR ANDHERI': 'INBOM4',
-        'SAHAR, ANDHERI': 'INBOM4',
-        'MUMBAI AIRPORT': 'INBOM4',
-        'AIR CARGO SAHAR': 'INBOM4',
-        '400707': 'INNSA1',  # PIN for NHAVA SHEVA
-        '400099': 'INBOM4',  # PIN for SAHAR ANDHERI
-    }
-    
-    for keyword, code in common_keywords.items():
-        if keyword in port_clean:
-            return code
+    # 1. Try matching by known keywords first. With pyahocorasick the common
+    # keywords, fuzzy aliases and every mapping key are scanned in a single
+    # automaton walk over the input (longest hit wins); otherwise fall back
+    # to the plain substring loop over the common keywords
+    if AHOCORASICK_AVAILABLE:
+        best_hit = None
+        for _, (length, code) in _get_keyword_automaton(port_mapping).iter(port_clean):
+            if best_hit is None or length > best_hit[0]:
+                best_hit = (length, code)
+        if best_hit:
+            return best_hit[1]
+    else:
+        for keyword, code in _COMMON_KEYWORDS.items():
+            if keyword in port_clean:
+                return code
     
     # 2. Try case-insensitive partial matching
     port_clean_lower = port_str.lower()
-    best_match = None
-    best_match_score = 0
-    
-    for map_key, map_code in port_mapping.items():
-        map_key_lower = str(map_key).lower()
-        
-        # Calculate match score
-        score = 0
-        
-        # Exact substring match
-        if map_key_lower in port_clean_lower or port_clean_lower in map_key_lower:
-            score = 100
-        
-        # Word-based matching
-        port_words = set(re.findall(r'\b\w+\b', port_clean_lower))
-        map_words = set(re.findall(r'\b\w+\b', map_key_lower))
-        common_words = port_words.intersection(map_words)
-        
-        if common_words:
-            score = max(score, len(common_words) * 20)
-        
-        # If this is a better match, update
-        if score > best_match_score:
-            best_match_score = score
-            best_match = map_code
-    
-    if best_match and best_match_score > 30:  # Threshold for a good match
-        return best_match
+
+    # Only mapping keys that share at least one word with the input can score,
+    # so pull the candidate set from the inverted word index instead of
+    # scanning the whole mapping
+    word_index, key_words = _get_word_index(port_mapping)
+    keys_lower_arr, key_pos, codes_arr = _get_key_arrays(port_mapping)
+    port_words = set(_WORD_RE.findall(port_clean_lower))
+    candidates = set()
+    for w in port_words:
+        candidates.update(word_index.get(w, ()))
+
+    if candidates:
+        cand_list = list(candidates)
+        idx = np.fromiter((key_pos[k] for k in cand_list), dtype=np.intp, count=len(cand_list))
+        cand_lower = keys_lower_arr[idx]
+
+        # Exact substring match, checked both ways across all candidates in
+        # two C-level passes
+        scores = np.where(
+            (np.char.find(cand_lower, port_clean_lower) != -1) |
+            (np.char.find(port_clean_lower, cand_lower) != -1),
+            100, 0)
+
+        # Word-based matching (word sets precomputed with the index)
+        overlaps = np.fromiter(
+            (len(port_words.intersection(key_words[k])) for k in cand_list),
+            dtype=np.int64, count=len(cand_list)) * 20
+        scores = np.maximum(scores, overlaps)
+
+        best_idx = int(scores.argmax())
+        best_match = codes_arr[idx[best_idx]]
+        if best_match and scores[best_idx] > 30:  # Threshold for a good match
+            return str(best_match)
     
     # 3. Try acronym matching
-    port_acronym = ''.join([w[0].upper() for w in re.findall(r'\b\w+\b', port_clean) if w])
+    port_acronym = ''.join([w[0].upper() for w in _WORD_RE.findall(port_clean) if w])
     if port_acronym and port_acronym in port_mapping:
         return port_mapping[port_acronym]
     
-    # 4. Try fuzzy matching for common ports
-    fuzzy_matches = {
-        'JNCH, NHAVA SHEVA': 'INNSA1',
-        'NHAVA SHEVA PORT': 'INNSA1',
-        'SAHAR AIR CARGO': 'INBOM4',
-        'ANDHERI AIR CARGO': 'INBOM4',
-        'MUMBAI SAHAR': 'INBOM4',
-    }
-    
-    for fuzzy_key, fuzzy_code in fuzzy_matches.items():
-        if fuzzy_key in port_clean:
-            return fuzzy_code
+    # 4. Try fuzzy matching for common ports (already covered by the
+    # automaton scan above when pyahocorasick is installed)
+    if not AHOCORASICK_AVAILABLE:
+        for fuzzy_key, fuzzy_code in _FUZZY_MATCHES.items():
+            if fuzzy_key in port_clean:
+                return fuzzy_code
     
     # If no match found, return original (or try to extract a code if possible)
     # Try to extract any 6-char alphanumeric code
-    code_match = re.search(r'\b([A-Z]{2}\d{4}|[A-Z]{2}\d{3}[A-Z]|[A-Z]{6})\b', port_clean)
+    code_match = _CODE_RE.search(port_clean)
     if code_match:
         return code_match.group(1)
     
     return port_str  # Return original if no match
 
 
+# Currency mapping dictionary, shared by every call
+_CURRENCY_MAP = {
+    # Major currencies
+    'US DOLLARS': 'USD',
+    'USD': 'USD',
+    'US DOLLAR': 'USD',
+    'U.S. DOLLAR': 'USD',
+    'U.S. DOLLARS': 'USD',
+    'DOLLAR': 'USD',
+    'DOLLARS': 'USD',
+
+    'EURO': 'EUR',
+    'EUROS': 'EUR',
+    'EUR': 'EUR',
+
+    'POUND': 'GBP',
+    'POUNDS': 'GBP',
+    'BRITISH POUND': 'GBP',
+    'GBP': 'GBP',
+
+    'YEN': 'JPY',
+    'JAPANESE YEN': 'JPY',
+    'JPY': 'JPY',
+
+    'AUSTRALIAN DOLLAR': 'AUD',
+    'AUD': 'AUD',
+
+    'CANADIAN DOLLAR': 'CAD',
+    'CAD': 'CAD',
+
+    'SWISS FRANC': 'CHF',
+    'CHF': 'CHF',
+
+    'YUAN': 'CNY',
+    'CHINESE YUAN': 'CNY',
+    'RENMINBI': 'CNY',
+    'CNY': 'CNY',
+
+    # Indian currency
+    'INDIAN RUPEE': 'INR',
+    'RUPEE': 'INR',
+    'RUPES': 'INR',
+    'RS': 'INR',
+    '₹': 'INR',
+    'INR': 'INR',
+
+    # Other currencies
+    'SINGAPORE DOLLAR': 'SGD',
+    'SGD': 'SGD',
+
+    'HONG KONG DOLLAR': 'HKD',
+    'HKD': 'HKD',
+
+    'NEW ZEALAND DOLLAR': 'NZD',
+    'NZD': 'NZD',
+
+    'SWEDISH KRONA': 'SEK',
+    'SEK': 'SEK',
+
+    'NORWEGIAN KRONE': 'NOK',
+    'NOK': 'NOK',
+
+    'DANISH KRONE': 'DKK',
+    'DKK': 'DKK',
+}
+
+# Single-pass scanner over the currency keys when pyahocorasick is
+# installed; one automaton walk replaces the per-key substring loop
+if AHOCORASICK_AVAILABLE:
+    _CURRENCY_AUTOMATON = ahocorasick.Automaton()
+    for _key, _code in _CURRENCY_MAP.items():
+        _CURRENCY_AUTOMATON.add_word(_key, (len(_key), _code))
+    _CURRENCY_AUTOMATON.make_automaton()
+else:
+    _CURRENCY_AUTOMATON = None
+
+
 def get_currency_code(currency_name: str) -> str:
     """Convert currency name to standard 3-letter code"""
     if not currency_name or pd.isna(currency_name):
         return ''
-    
+
     currency_str = str(currency_name).strip().upper()
     if not currency_str:
         return ''
-    
-    # Currency mapping dictionary
-    currency_map = {
-        # Major currencies
-        'US DOLLARS': 'USD',
-        'USD': 'USD',
-        'US DOLLAR': 'USD',
-        'U.S. DOLLAR': 'USD',
-        'U.S. DOLLARS': 'USD',
-        'DOLLAR': 'USD',
-        'DOLLARS': 'USD',
-        
-        'EURO': 'EUR',
-        'EUROS': 'EUR',
-        'EUR': 'EUR',
-        
-        'POUND': 'GBP',
-        'POUNDS': 'GBP',
-        'BRITISH POUND': 'GBP',
-        'GBP': 'GBP',
-        
-        'YEN': 'JPY',
-        'JAPANESE YEN': 'JPY',
-        'JPY': 'JPY',
-        
-        'AUSTRALIAN DOLLAR': 'AUD',
-        'AUD': 'AUD',
-        
-        'CANADIAN DOLLAR': 'CAD',
-        'CAD': 'CAD',
-        
-        'SWISS FRANC': 'CHF',
-        'CHF': 'CHF',
-        
-        'YUAN': 'CNY',
-        'CHINESE YUAN': 'CNY',
-        'RENMINBI': 'CNY',
-        'CNY': 'CNY',
-        
-        # Indian currency
-        'INDIAN RUPEE': 'INR',
-        'RUPEE': 'INR',
-        'RUPES': 'INR',
-        'RS': 'INR',
-        '₹': 'INR',
-        'INR': 'INR',
-        
-        # Other currencies
-        'SINGAPORE DOLLAR': 'SGD',
-        'SGD': 'SGD',
-        
-        'HONG KONG DOLLAR': 'HKD',
-        'HKD': 'HKD',
-        
-        'NEW ZEALAND DOLLAR': 'NZD',
-        'NZD': 'NZD',
-        
-        'SWEDISH KRONA': 'SEK',
-        'SEK': 'SEK',
-        
-        'NORWEGIAN KRONE': 'NOK',
-        'NOK': 'NOK',
-        
-        'DANISH KRONE': 'DKK',
-        'DKK': 'DKK',
-    }
-    
+
     # Check for exact match
-    if currency_str in currency_map:
-        return currency_map[currency_str]
-    
-    # Check for partial match
-    for key, code in currency_map.items():
-        if key in currency_str or currency_str in key:
-            return code
-    
+    if currency_str in _CURRENCY_MAP:
+        return _CURRENCY_MAP[currency_str]
+
+    # Check for partial match - one automaton pass (longest keyword wins)
+    # when available, otherwise the plain substring loop
+    if _CURRENCY_AUTOMATON is not None:
+        best_hit = None
+        for _, (length, code) in _CURRENCY_AUTOMATON.iter(currency_str):
+            if best_hit is None or length > best_hit[0]:
+                best_hit = (length, code)
+        if best_hit:
+            return best_hit[1]
+        # The automaton only finds keys inside the input; still cover the
+        # reverse direction (input is a fragment of a key)
+        for key, code in _CURRENCY_MAP.items():
+            if currency_str in key:
+                return code
+    else:
+        for key, code in _CURRENCY_MAP.items():
+            if key in currency_str or currency_str in key:
+                return code
+
     # If currency is already 3 uppercase letters, assume it's already a code
     if len(currency_str) == 3 and currency_str.isalpha() and currency_str.isupper():
         return currency_str
-    
+
     # Return original if no match
     return currency_str
 
 
-def merge_excel_files(files: List[Tuple[str, bytes]]) -> pd.DataFrame:
-    """Merge multiple Excel files into one DataFrame"""
+def _read_xlsx_fast(file_path: str) -> pd.DataFrame:
+    """Stream an .xlsx into a DataFrame via openpyxl's read-only mode.
+
+    read_only=True skips the full in-memory workbook model (styles, formula
+    tree) that pd.read_excel builds through openpyxl, and iterates rows
+    SAX-style instead - much faster and a fraction of the memory on big
+    sheets. First row becomes the header, matching read_excel(header=0)."""
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        return pd.DataFrame(rows, columns=header)
+    finally:
+        wb.close()
+
+
+def _read_one_excel(filename: str, file_path: str) -> Optional[pd.DataFrame]:
+    """Read one uploaded Excel file with the right engine; None on failure"""
+    try:
+        # Determine engine based on file extension
+        if filename.lower().endswith('.xls'):
+            # For .xls files, try xlrd engine
+            try:
+                return pd.read_excel(file_path, engine='xlrd', header=0)
+            except ImportError:
+                raise ImportError(
+                    "Missing dependency: xlrd library is required to read .xls files. "
+                    "Please install it using: pip install xlrd"
+                )
+        elif filename.lower().endswith('.xlsx'):
+            # Prefer the native calamine parser, then openpyxl read-only
+            # streaming; full pandas/openpyxl is the last resort
+            if CALAMINE_AVAILABLE:
+                try:
+                    return pd.read_excel(file_path, engine='calamine', header=0)
+                except Exception as e:
+                    log.warning(f"calamine read failed for {filename} ({e}), using openpyxl")
+            try:
+                return _read_xlsx_fast(file_path)
+            except Exception as e:
+                log.warning(f"Fast xlsx read failed for {filename} ({e}), using pandas")
+                return pd.read_excel(file_path, engine='openpyxl', header=0)
+        else:
+            # Try default engine
+            return pd.read_excel(file_path, header=0)
+    except Exception as e:
+        log.warning(f"Error processing {filename}: {e}")
+        return None
+
+
+def _compress_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast low-cardinality object columns to category dtype in place.
+
+    Merged BRC data holds thousands of rows but only a handful of distinct
+    ports, currencies and statuses; as category each distinct string is
+    stored once and the rows become small integer codes."""
+    n = len(df.index)
+    if n == 0:
+        return df
+    for col in df.columns:
+        s = df[col]
+        if s.dtype == object and s.nunique() / n < 0.1:
+            df[col] = s.astype('category')
+    return df
+
+
+def merge_excel_files(files: List[Tuple[str, str]]) -> pd.DataFrame:
+    """Merge multiple Excel files (given as (filename, path) tuples) into one DataFrame"""
     if not files:
         raise ValueError("No files provided")
-    
+
     # Sort files by sequence
     sorted_files = sort_files_by_sequence(files)
-    
+
+    # Parse all files concurrently - the Excel decode dominates the cost and
+    # runs largely outside the GIL, so threads scale for multi-file uploads.
+    # Results come back in submission order
+    with ThreadPoolExecutor(max_workers=min(8, len(sorted_files))) as executor:
+        dfs = list(executor.map(lambda fd: _read_one_excel(*fd), sorted_files))
+
     merged_data = []
-    
-    for i, (filename, file_data) in enumerate(sorted_files):
+    header_cols = None
+
+    for i, ((filename, file_path), df) in enumerate(zip(sorted_files, dfs)):
+        if df is None:
+            continue
+
         try:
-            print(f"\nProcessing file {i+1}: {filename}")
-            
-            # Determine engine based on file extension
-            if filename.lower().endswith('.xls'):
-                # For .xls files, try xlrd engine
-                try:
-                    df = pd.read_excel(io.BytesIO(file_data), engine='xlrd', header=0)
-                except ImportError:
-                    raise ImportError(
-                        "Missing dependency: xlrd library is required to read .xls files. "
-                        "Please install it using: pip install xlrd"
-                    )
-            elif filename.lower().endswith('.xlsx'):
-                # For .xlsx files, use openpyxl engine
-                df = pd.read_excel(io.BytesIO(file_data), engine='openpyxl', header=0)
-            else:
-                # Try default engine
-                df = pd.read_excel(io.BytesIO(file_data), header=0)
-            
-            print(f"  File shape: {df.shape}")
-            print(f"  File columns: {df.columns.tolist()}")
-            
+            log.debug(f"Processing file {i+1}: {filename}")
+            log.debug(f"  File shape: {df.shape}")
+            log.debug(f"  File columns: {df.columns.tolist()}")
+
             # For BRC files specifically - SIMPLE LOGIC
             if i == 0:
-                # First file - keep all rows
-                print(f"  First file - keeping all {len(df)} rows")
+                # First file - keep all rows; remember its header so the
+                # continuation files below can be matched against it
+                header_cols = [str(c) for c in df.columns]
+                log.debug(f"  First file - keeping all {len(df)} rows")
                 merged_data.append(df)
             else:
                 # For subsequent files, we need to check if first row is header
                 # BRC files have header row with specific column names
                 if len(df) > 0:
-                    first_row = df.iloc[0] if not df.empty else None
-                    is_header = False
-                    
-                    if first_row is not None:
-                        # Check if first row contains header-like values
-                        header_count = 0
-                        for cell in first_row:
-                            if isinstance(cell, str):
-                                cell_lower = str(cell).lower()
-                                # BRC header keywords
-                                if any(keyword in cell_lower for keyword in ['brc', 'sb', 'date', 'number', 'port', 'invoice', 'currency', 'realization']):
-                                    header_count += 1
-                        
+                    if header_cols is not None and [str(c) for c in df.columns] == header_cols:
+                        # Continuation of the first file: pandas already
+                        # consumed the shared header, so the only thing left
+                        # to catch is an exactly duplicated header row - a
+                        # straight comparison, no keyword scan needed
+                        is_header = df.iloc[0].astype(str).tolist() == header_cols
+                    else:
+                        # Count header-looking cells with one regex pass over the
+                        # whole first row instead of a per-cell keyword loop.
                         # If more than 3 columns look like headers, it's probably a header row
-                        if header_count > 3:
-                            is_header = True
-                            print(f"  Detected header row - skipping it")
+                        first_row = df.iloc[0].astype(str)
+                        header_count = int(first_row.str.lower().str.contains(_BRC_HDR_RE, na=False).sum())
+                        is_header = header_count > 3
+                    if is_header:
+                        log.debug(f"  Detected header row - skipping it")
                     
                     if is_header:
                         # Skip only the first row (header)
@@ -433,721 +864,543 @@ def merge_excel_files(files: List[Tuple[str, bytes]]) -> pd.DataFrame:
                         # No header detected, keep all rows
                         data_to_append = df
                     
-                    print(f"  Appending {len(data_to_append)} data rows")
+                    log.debug(f"  Appending {len(data_to_append)} data rows")
                     merged_data.append(data_to_append)
                 
         except Exception as e:
-            print(f"Error processing {filename}: {e}")
+            log.warning(f"Error processing {filename}: {e}")
             continue
-    
+
     if not merged_data:
         raise ValueError("No valid data found")
     
     # Concatenate all dataframes
-    print(f"\nConcatenating {len(merged_data)} dataframes")
+    log.debug(f"Concatenating {len(merged_data)} dataframes")
     combined_df = pd.concat(merged_data, ignore_index=True)
-    
-    print(f"Final merged DataFrame shape: {combined_df.shape}")
-    
+
+    # Deduplicate the repeating strings (ports, currencies, statuses) that
+    # the concat just multiplied across files
+    _compress_string_columns(combined_df)
+
+    log.debug(f"Final merged DataFrame shape: {combined_df.shape}")
+
     return combined_df
 
 
+# Static report headers prepended to each converter's output. The rows never
+# change between requests, so the frames are built once at import instead of
+# per call.
+_DBK_COLS = ['S No.', 'Port', 'Shipping Bill No.', 'Shipping Bill Date',
+             'Scroll No.', 'Scroll Date', 'Drawback', 'STR', 'Amount']
+_DBK_DISB_HEADER_DF = pd.DataFrame([
+    ['IEC Name - Alfa'] + [''] * 8,
+    ['Report Generated From - 2021/01/01To2021/06/30'] + [''] * 8,
+    ['Report Generated On - 16/02/2022 12:58:50'] + [''] * 8,
+    _DBK_COLS
+], columns=_DBK_COLS)
+
+_DBK_PEND_COLS = ['S No.', 'Shipping Bill No.', 'Shipping Bill Date',
+                  'LEO Date', 'Amount', 'Current Queue']
+_DBK_PEND_HEADER_DF = pd.DataFrame([
+    ['IEC Name-Alfa'] + [''] * 5,
+    ['Location Name-All Locations'] + [''] * 5,
+    ['Report Generated From-2021/07/01To2021/11/30'] + [''] * 5,
+    ['Report Generated On-16/02/2022 12:48:50'] + [''] * 5,
+    _DBK_PEND_COLS
+], columns=_DBK_PEND_COLS)
+
+_BRC_COLS = ['BRC Number', 'BRC Date', 'BRC Status', 'Bill ID', 'SHB No',
+             'SHB Port', 'SHB Date', 'Realised Value', 'Currency',
+             'Date of Realization', 'BRC Utlisation Status', 'BRC Lot']
+# Based on "BRC_upload.xlsx" format - 2 empty rows + column titles
+_BRC_HEADER_DF = pd.DataFrame([
+    [''] * len(_BRC_COLS),
+    [''] * len(_BRC_COLS),
+    _BRC_COLS
+], columns=_BRC_COLS)
+
+# Known input dtypes per process family, keyed by the canonical column
+# names. Callers of pd.read_excel can pass these through dtype= to skip
+# runtime type inference; the converters also apply them at entry so the
+# vectorized passes start from known dtypes instead of re-deducing per
+# cell. Date columns are deliberately absent: astype('datetime64[ns]')
+# parses strings month-first, which silently swaps day and month for the
+# day-first inputs these files use - parse_date_series owns date parsing.
+BRC_INPUT_DTYPES = {
+    'BRC Number': _STRING_DTYPE,
+    'BRC Status': _STRING_DTYPE,
+    'Invoice Number': _STRING_DTYPE,
+    'SB NUMBER': 'Int64',
+    'PORT CODE': _STRING_DTYPE,
+    'REALISED VALUE': 'float64',
+    'CURRENCY': _STRING_DTYPE,
+    'BRC Utlisation Status': _STRING_DTYPE,
+}
+
+IGST_INPUT_DTYPES = {
+    'Shipping Bill No.': 'Int64',
+    'IGST Scroll No': _STRING_DTYPE,
+    'Scroll Amount(INR)': 'float64',
+    'Scroll Status At PFMS': _STRING_DTYPE,
+    'Scroll Status At PAO': _STRING_DTYPE,
+    'Bank Response Code': _STRING_DTYPE,
+    'Bank Transaction ID': _STRING_DTYPE,
+}
+
+SB_INPUT_DTYPES = {
+    'SB No': 'Int64',
+    'Custom Scroll No': _STRING_DTYPE,
+    'Location': _STRING_DTYPE,
+    'IgstAmount': 'float64',
+    'DBK Amount RS': 'float64',
+    'Curr Queue': _STRING_DTYPE,
+}
+
+
+def expected_dtypes(kind: str) -> Dict[str, str]:
+    """Return the expected input dtypes for a process kind ('brc',
+    'igst_scroll' or 'sb'), suitable for pd.read_excel(dtype=...)"""
+    return {'brc': BRC_INPUT_DTYPES,
+            'igst_scroll': IGST_INPUT_DTYPES,
+            'sb': SB_INPUT_DTYPES}.get(kind, {})
+
+
+def _apply_expected_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Cast the columns present in df to their expected dtypes, one column
+    at a time. Columns whose values don't fit the target dtype stay as
+    read (astype lost its errors='ignore' escape hatch, so each cast gets
+    its own try)."""
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    return df
+
+
+def _prepend_header(header_df: pd.DataFrame, result_df: pd.DataFrame) -> pd.DataFrame:
+    """Stack the static header rows on top of the converted data. Each output
+    column is one pre-sized object array filled with two slice assignments,
+    instead of pd.concat's per-column reallocate-and-copy path."""
+    h = len(header_df.index)
+    total = h + len(result_df.index)
+    cols = {}
+    for col in header_df.columns:
+        out = np.empty(total, dtype=object)
+        out[:h] = header_df[col].to_numpy()
+        out[h:] = result_df[col].to_numpy()
+        cols[col] = out
+    return pd.DataFrame(cols)
+
+
+_IGST_COLS = ['S No.', 'Shipping Bill No.', 'Shipping Bill Date',
+              'IGST Scroll Number', 'IGST Scroll Date', 'Scroll Amount(INR)',
+              'Scroll Status At PFMS', 'Scroll Status At PAO',
+              'Bank Response Code', 'Bank Transaction Details']
+# Based on "IGST Scroll uploding.xlsx" format - 6 header rows
+_IGST_HEADER_DF = pd.DataFrame([
+    ['IEC Name  -  ALFA'] + [''] * 9,
+    ['Location Name  -  NHAVA SHEVA SEA (INNSA1)'] + [''] * 9,
+    ['Report Generated From -  2024/01/01  To  2024/06/30'] + [''] * 9,
+    ['Report Generated On  -  30/07/2024 15:05:26'] + [''] * 9,
+    ['S No.', 'Shipping Bill No.', 'Shipping Bill Date', 'IGST Scroll Number',
+     'IGST Scroll Date', 'Scroll Amount(INR)', 'Scroll Status', 'Scroll Status',
+     'Bank Response Code', 'Bank Transaction Details'],
+    [''] * 5 + ['', 'At PFMS', 'At PAO', '', '']
+], columns=_IGST_COLS)
+
+# Header keywords for spotting a repeated title row at the top of RODTEP
+# sheets, checked with one vectorized pass over the first row
+_RODTEP_SCROLL_HDR_RE = re.compile(r'sb|scroll|date|number|location|amount',
+                                   re.IGNORECASE)
+_RODTEP_SCRIP_HDR_RE = re.compile(
+    r'scrip|scroll|sb|date|number|amount|balance|status', re.IGNORECASE)
+
+# Column-name tokens for the RODTEP converters, tried in order against each
+# lowercased column name; the first matching token decides the mapping
+_RODTEP_SCROLL_TOKENS = (
+    ('sb number', 'sb_number'),
+    ('shipping bill', 'sb_number'),
+    ('sb date', 'sb_date'),
+    ('shipping bill date', 'sb_date'),
+    ('scroll number', 'scroll_number'),
+    ('scroll date', 'scroll_date'),
+    ('location', 'location'),
+    ('sanctioned', 'amount'),
+    ('amount', 'amount'),
+)
+
+_RODTEP_SCRIP_TOKENS = (
+    ('scrip no', 'scrip_no'),
+    ('scrip issue date', 'scrip_issue_date'),
+    ('scrip exp date', 'scrip_exp_date'),
+    ('scrip expiry date', 'scrip_exp_date'),
+    ('scrip issued amount', 'scrip_issued_amount'),
+    ('scrip balance', 'scrip_balance'),
+    ('scrip transfer date', 'scrip_transfer_date'),
+    ('scrip status', 'scrip_status'),
+    ('scroll number', 'scroll_number'),
+    ('sb number', 'sb_number'),
+    ('shipping bill', 'sb_number'),
+)
+
+_RODTEP_SCROLL_COLS = ['Sr. No.', 'SHB No', 'Date', 'Scroll No', 'Scroll Date',
+                       'Scroll Amt', 'Port']
+# Based on "RoDTEP Scroll Uploading.xlsx" format - 2 empty rows + titles
+_RODTEP_SCROLL_HEADER_DF = pd.DataFrame([
+    [''] * len(_RODTEP_SCROLL_COLS),
+    [''] * len(_RODTEP_SCROLL_COLS),
+    _RODTEP_SCROLL_COLS
+], columns=_RODTEP_SCROLL_COLS)
+
+_RODTEP_SCRIP_COLS = ['Sr. No', 'SCROLL NUMBER', 'SB NUMBER', 'SB DATE',
+                      'SB AMOUNT', 'SCRIP NUMBER', 'SCRIP ISSUE DATE',
+                      'SCRIP EXPIRY DATE', 'SCRIP ISSUE AMOUNT',
+                      'SCRIP BALANCE AMOUNT', 'SCRIP TRANSFER DATE',
+                      'SCRIP STATUS', 'Application Ref. No']
+# 2 empty rows + titles at row 3; data starts at row 4
+_RODTEP_SCRIP_HEADER_DF = pd.DataFrame([
+    [''] * len(_RODTEP_SCRIP_COLS),
+    [''] * len(_RODTEP_SCRIP_COLS),
+    _RODTEP_SCRIP_COLS
+], columns=_RODTEP_SCRIP_COLS)
+
+
 def convert_dbk_disbursement(df: pd.DataFrame) -> pd.DataFrame:
     """Convert DBK Disbursement Excel format to required output format"""
     if df.empty:
         return df
     
-    print(f"Input DataFrame columns: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
+    log.debug(f"Input DataFrame columns: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
+
+    n = len(df)
+
+    # Column-wise helpers so the whole conversion stays inside pandas C code
+    # instead of a Python loop over rows
+    def number_col(name):
+        if name not in df.columns:
+            return pd.Series(0, index=df.index)
+        return to_number_series(df[name]).fillna(0)
+
+    def date_col(name):
+        if name not in df.columns:
+            return pd.Series('', index=df.index)
+        # Formatted as '09-Jul-2025' (with 4-digit year)
+        return format_date_series(df[name])
+
+    def text_col(name):
+        if name not in df.columns:
+            return pd.Series('', index=df.index)
+        s = df[name]
+        return s.astype(object).where(s.notna(), '').astype(str)
+
+    # Assemble the result column by column - one allocation per column instead
+    # of one dict per row
+    result_df = pd.DataFrame({
+        'S No.': np.arange(1, n + 1, dtype=np.int64),
+        'Port': text_col('Location'),
+        'Shipping Bill No.': number_col('SB No'),
+        'Shipping Bill Date': date_col('SB Date'),  # Formatted as string '09-Jul-2025'
+        'Scroll No.': number_col('Custom Scroll No'),
+        'Scroll Date': date_col('Custom Scroll Date'),
+        'Drawback': '',
+        'STR': '',
+        'Amount': number_col('IgstAmount')
+    })
+    
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  Sample Shipping Bill Dates: {result_df['Shipping Bill Date'].head(3).tolist()}")
+        log.debug(f"  Sample Scroll Dates: {result_df['Scroll Date'].head(3).tolist()}")
+    
+    # Stack the static header rows on top of the data
+    final_df = _prepend_header(_DBK_DISB_HEADER_DF, result_df)
     
-    # Create a new DataFrame with the required format
-    result_data = []
+    return final_df
+
+def convert_dbk_pendency(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert DBK Pendency Excel format"""
+    if df.empty:
+        return df
     
-    # Start serial number from 1
-    serial_number = 1
+    log.debug(f"Input DataFrame columns for DBK Pendency: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
     
-    # Helper function to convert to datetime and format as string
-    def convert_and_format_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            # Format as '09-Jul-2025' (with 4-digit year)
-            return date_value.strftime('%d-%b-%Y')
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # Special handling for two-digit years - convert to four-digit (20XX)
-            # Look for patterns like dd-mmm-yy or dd-mmm-yyyy
-            date_formats = [
-                '%d-%b-%y',      # 09-Jul-25 (will convert 25 to 2025)
-                '%d-%b-%Y',      # 09-Jul-2025
-                '%Y-%m-%d',      # 2025-07-09
-                '%d/%m/%Y',      # 09/07/2025
-                '%m/%d/%Y',      # 07/09/2025
-                '%Y/%m/%d',      # 2025/07/09
-                '%d-%m-%Y',      # 09-07-2025
-                '%m-%d-%Y',      # 07-09-2025
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    # Force 4-digit year output
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    continue
-            
-            # Try with case-insensitive month
-            if any(month in date_str.upper() for month in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 
-                                                          'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']):
-                # Try with two-digit year first (most common case)
-                for month in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 
-                             'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']:
-                    if month in date_str.upper():
-                        # Convert to proper case
-                        date_str_proper = date_str.upper().replace(month, month.capitalize())
-                        try:
-                            # Try with two-digit year format
-                            date_obj = pd.to_datetime(date_str_proper, format='%d-%b-%y')
-                            return date_obj.strftime('%d-%b-%Y')
-                        except:
-                            try:
-                                # Try with four-digit year format
-                                date_obj = pd.to_datetime(date_str_proper, format='%d-%b-%Y')
-                                return date_obj.strftime('%d-%b-%Y')
-                            except:
-                                pass
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            # Excel serial date starts from 1899-12-30
-            try:
-                date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        return ''
-    
-    # Helper function to convert to number
-    def convert_to_number(value):
-        if pd.isna(value):
-            return None
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it
-            if isinstance(value, str):
-                cleaned = ''.join(c for c in value if c.isdigit() or c == '.' or c == '-')
-                if not cleaned:
-                    return None
-                
-                num_value = float(cleaned)
-                return int(num_value) if num_value == int(num_value) else num_value
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return None
-    
-    # Iterate through each row in the merged data
-    for index, row in df.iterrows():
-        try:
-            # Extract values
-            shipping_bill_no = convert_to_number(row['SB No']) if 'SB No' in df.columns else None
-            shipping_bill_date = convert_and_format_date(row['SB Date']) if 'SB Date' in df.columns else ''
-            scroll_no = convert_to_number(row['Custom Scroll No']) if 'Custom Scroll No' in df.columns else None
-            scroll_date = convert_and_format_date(row['Custom Scroll Date']) if 'Custom Scroll Date' in df.columns else ''
-            port = str(row['Location']) if 'Location' in df.columns and not pd.isna(row['Location']) else ''
-            amount = convert_to_number(row['IgstAmount']) if 'IgstAmount' in df.columns else None
-            
-            # Debug for first few rows
-            if index < 3:
-                print(f"\nRow {index} conversion:")
-                print(f"  SB Date raw: {row['SB Date'] if 'SB Date' in df.columns else 'N/A'} -> {shipping_bill_date}")
-                print(f"  Scroll Date raw: {row['Custom Scroll Date'] if 'Custom Scroll Date' in df.columns else 'N/A'} -> {scroll_date}")
-            
-            # Create a new row in the required format
-            new_row = {
-                'S No.': int(serial_number),
-                'Port': port,
-                'Shipping Bill No.': shipping_bill_no if shipping_bill_no is not None else 0,
-                'Shipping Bill Date': shipping_bill_date,  # Formatted as string '09-Jul-25'
-                'Scroll No.': scroll_no if scroll_no is not None else 0,
-                'Scroll Date': scroll_date,  # Formatted as string '31-Oct-25'
-                'Drawback': '',
-                'STR': '',
-                'Amount': amount if amount is not None else 0
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            continue
-    
-    # Create the result DataFrame
-    result_df = pd.DataFrame(result_data)
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    if not result_df.empty:
-        print(f"  Sample Shipping Bill Dates: {result_df['Shipping Bill Date'].head(3).tolist()}")
-        print(f"  Sample Scroll Dates: {result_df['Scroll Date'].head(3).tolist()}")
-    
-    # Create the header rows
-    header_rows = pd.DataFrame([
-        {'S No.': 'IEC Name - Alfa', 'Port': '', 'Shipping Bill No.': '', 'Shipping Bill Date': '', 
-         'Scroll No.': '', 'Scroll Date': '', 'Drawback': '', 'STR': '', 'Amount': ''},
-        {'S No.': 'Report Generated From - 2021/01/01To2021/06/30', 'Port': '', 'Shipping Bill No.': '', 
-         'Shipping Bill Date': '', 'Scroll No.': '', 'Scroll Date': '', 'Drawback': '', 'STR': '', 'Amount': ''},
-        {'S No.': 'Report Generated On - 16/02/2022 12:58:50', 'Port': '', 'Shipping Bill No.': '', 
-         'Shipping Bill Date': '', 'Scroll No.': '', 'Scroll Date': '', 'Drawback': '', 'STR': '', 'Amount': ''},
-        # Column headers
-        {'S No.': 'S No.', 'Port': 'Port', 'Shipping Bill No.': 'Shipping Bill No.',
-         'Shipping Bill Date': 'Shipping Bill Date', 'Scroll No.': 'Scroll No.',
-         'Scroll Date': 'Scroll Date', 'Drawback': 'Drawback', 'STR': 'STR', 'Amount': 'Amount'}
-    ])
-    
-    # Concatenate header rows with data
-    final_df = pd.concat([header_rows, result_df], ignore_index=True)
+    # Parse both date columns in one vectorized pass each, formatted as
+    # '31-OCT-2025'; the row loop below just picks up the finished strings
+    if 'SB Date' in df.columns:
+        sb_dates = format_date_series(df['SB Date']).str.upper()
+    else:
+        sb_dates = pd.Series('', index=df.index)
+    if 'Leo Date' in df.columns:
+        leo_dates = format_date_series(df['Leo Date']).str.upper()
+    else:
+        leo_dates = pd.Series('', index=df.index)
+
+    # Coerce both numeric columns in one vectorized pass each
+    if 'SB No' in df.columns:
+        sb_nos = to_number_series(df['SB No']).fillna(0)
+    else:
+        sb_nos = pd.Series(0, index=df.index)
+    if 'DBK Amount RS' in df.columns:
+        amounts = to_number_series(df['DBK Amount RS']).fillna(0)
+    else:
+        amounts = pd.Series(0, index=df.index)
+
+    # Column mapping:
+    # Output column 2 (Shipping Bill No.) -> merged file column A (SB No)
+    # Output column 3 (Shipping Bill Date) -> merged file column B (SB Date)
+    # Output column 4 (LEO Date) -> merged file column G (Leo Date)
+    # Output column 5 (Amount) -> merged file column E (DBK Amount RS)
+    # Output column 6 (Current Queue) -> merged file column F (Curr Queue)
+    if 'Curr Queue' in df.columns:
+        queues = df['Curr Queue']
+        queues = queues.astype(object).where(queues.notna(), '').astype(str)
+    else:
+        queues = pd.Series('', index=df.index)
+
+    # Assemble the result column-by-column: one contiguous buffer per output
+    # column instead of a dict per row, so pandas never re-infers dtypes
+    n = len(df.index)
+    result_df = pd.DataFrame({
+        'S No.': np.arange(1, n + 1, dtype=np.int64),
+        'Shipping Bill No.': sb_nos.to_numpy(),
+        'Shipping Bill Date': sb_dates.to_numpy(),
+        'LEO Date': leo_dates.to_numpy(),
+        'Amount': amounts.to_numpy(),
+        'Current Queue': queues.to_numpy()
+    })
+    
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  First few rows:\n{result_df.head()}")
+
+    # Stack the static header rows on top of the data
+    final_df = _prepend_header(_DBK_PEND_HEADER_DF, result_df)
     
     return final_df
 
-def convert_dbk_pendency(df: pd.DataFrame) -> pd.DataFrame:
-    """Convert DBK Pendency Excel format"""
-    if df.empty:
-        return df
-    
-    print(f"Input DataFrame columns for DBK Pendency: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
-    
-    # Create a new DataFrame with the required format
-    result_data = []
-    
-    # Start serial number from 1 (for data rows, starting from row 5)
-    serial_number = 1
-    
-    # Helper function to convert to datetime and format as string
-    def convert_and_format_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            # Format as '31-OCT-2025'
-            return date_value.strftime('%d-%b-%Y').upper()
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # Try common date formats
-            date_formats = [
-                '%d-%b-%Y',      # 31-OCT-2025
-                '%d-%b-%y',      # 31-OCT-25
-                '%Y-%m-%d',      # 2025-10-31
-                '%d/%m/%Y',      # 31/10/2025
-                '%m/%d/%Y',      # 10/31/2025
-                '%Y/%m/%d',      # 2025/10/31
-                '%d-%m-%Y',      # 31-10-2025
-                '%m-%d-%Y',      # 10-31-2025
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    # Format as '31-OCT-2025'
-                    return date_obj.strftime('%d-%b-%Y').upper()
-                except:
-                    continue
-            
-            # Try with case-insensitive month
-            if any(month in date_str.upper() for month in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 
-                                                          'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']):
-                # Try with two-digit year first (most common case)
-                try:
-                    date_obj = pd.to_datetime(date_str, format='%d-%b-%y')
-                    return date_obj.strftime('%d-%b-%Y').upper()
-                except:
-                    try:
-                        date_obj = pd.to_datetime(date_str, format='%d-%b-%Y')
-                        return date_obj.strftime('%d-%b-%Y').upper()
-                    except:
-                        pass
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y').upper()
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            # Excel serial date starts from 1899-12-30
-            try:
-                date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                return date_obj.strftime('%d-%b-%Y').upper()
-            except:
-                return ''
-        
-        return ''
-    
-    # Helper function to convert to number
-    def convert_to_number(value):
-        if pd.isna(value):
-            return None
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it
-            if isinstance(value, str):
-                cleaned = ''.join(c for c in value if c.isdigit() or c == '.' or c == '-')
-                if not cleaned:
-                    return None
-                
-                num_value = float(cleaned)
-                return int(num_value) if num_value == int(num_value) else num_value
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return None
-    
-    # Iterate through each row in the merged data (starting from row 1 as data starts from row 1 in merged file)
-    for index, row in df.iterrows():
-        try:
-            # Extract values based on your mapping:
-            # Output column 2 (Shipping Bill No.) -> merged file column A (SB No)
-            # Output column 3 (Shipping Bill Date) -> merged file column B (SB Date)
-            # Output column 4 (LEO Date) -> merged file column G (Leo Date)
-            # Output column 5 (Amount) -> merged file column E (DBK Amount RS)
-            # Output column 6 (Current Queue) -> merged file column F (Curr Queue)
-            
-            # Map the columns
-            shipping_bill_no = convert_to_number(row['SB No']) if 'SB No' in df.columns else None
-            shipping_bill_date = convert_and_format_date(row['SB Date']) if 'SB Date' in df.columns else ''
-            leo_date = convert_and_format_date(row['Leo Date']) if 'Leo Date' in df.columns else ''
-            amount = convert_to_number(row['DBK Amount RS']) if 'DBK Amount RS' in df.columns else None
-            current_queue = str(row['Curr Queue']) if 'Curr Queue' in df.columns and not pd.isna(row['Curr Queue']) else ''
-            
-            # Create a new row in the required format
-            new_row = {
-                'S No.': int(serial_number),
-                'Shipping Bill No.': shipping_bill_no if shipping_bill_no is not None else 0,
-                'Shipping Bill Date': shipping_bill_date,
-                'LEO Date': leo_date,
-                'Amount': amount if amount is not None else 0,
-                'Current Queue': current_queue
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            continue
-    
-    # Create the result DataFrame with data rows
-    result_df = pd.DataFrame(result_data)
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    if not result_df.empty:
-        print(f"  First few rows:")
-        print(result_df.head())
-    
-    # Create the header rows exactly as in the output file format
-    header_rows = pd.DataFrame([
-        {'S No.': 'IEC Name-Alfa', 'Shipping Bill No.': '', 'Shipping Bill Date': '', 
-         'LEO Date': '', 'Amount': '', 'Current Queue': ''},
-        {'S No.': 'Location Name-All Locations', 'Shipping Bill No.': '', 'Shipping Bill Date': '', 
-         'LEO Date': '', 'Amount': '', 'Current Queue': ''},
-        {'S No.': 'Report Generated From-2021/07/01To2021/11/30', 'Shipping Bill No.': '', 'Shipping Bill Date': '', 
-         'LEO Date': '', 'Amount': '', 'Current Queue': ''},
-        {'S No.': 'Report Generated On-16/02/2022 12:48:50', 'Shipping Bill No.': '', 'Shipping Bill Date': '', 
-         'LEO Date': '', 'Amount': '', 'Current Queue': ''},
-        # Column headers (row 5)
-        {'S No.': 'S No.', 'Shipping Bill No.': 'Shipping Bill No.', 'Shipping Bill Date': 'Shipping Bill Date',
-         'LEO Date': 'LEO Date', 'Amount': 'Amount', 'Current Queue': 'Current Queue'}
-    ])
-    
-    # Concatenate header rows with data rows
-    final_df = pd.concat([header_rows, result_df], ignore_index=True)
-    
-    return final_df
 
+# Expected BRC input columns and the internal names they map to
+_BRC_EXPECTED_COLUMNS = {
+    'BRC Number': 'brc_number',
+    'BRC Date': 'brc_date',
+    'BRC Status': 'brc_status',
+    'Invoice Number': 'invoice_number',
+    'SB NUMBER': 'sb_number',
+    'PORT CODE': 'port_code',
+    'SB Date': 'sb_date',
+    'REALISED VALUE': 'realised_value',
+    'CURRENCY': 'currency',
+    'REALIZATION_DATE': 'realization_date',
+    'BRC Utlisation Status': 'brc_utilisation'
+}
 
-def convert_brc(df: pd.DataFrame, brc_type: Optional[str] = None) -> pd.DataFrame:
-    """Convert BRC Excel format after merging"""
-    if df.empty:
-        return df
-    
-    print(f"Input DataFrame columns for BRC: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
-    print(f"BRC Type selected: {brc_type}")
-    
-    # Load port code mapping
-    port_mapping = load_port_code_mapping()
-    print(f"Loaded {len(port_mapping)} port code mappings")
-    
-    # Create a new DataFrame with the required format
-    result_data = []
-    
-    # Start serial number from 1 (for data rows, starting from row 4)
-    serial_number = 1
-    
-    # Helper function to clean and convert to number
-    def convert_to_number(value):
-        if pd.isna(value):
-            return ''
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it (remove commas, etc.)
-            if isinstance(value, str):
-                # Remove commas and any non-numeric except decimal point and minus
-                value_str = str(value)
-                value_str = value_str.replace(',', '').strip()
-                if not value_str:
-                    return ''
-                
-                try:
-                    num_value = float(value_str)
-                    # Convert to int if it's a whole number
-                    return int(num_value) if num_value == int(num_value) else num_value
-                except:
-                    return ''
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return ''
-    
-    # Helper function to convert date to dd-mmm-yyyy format
-    def convert_and_format_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            # Format as '07-Nov-2025'
-            return date_value.strftime('%d-%b-%Y')
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # Try common date formats including dd-mm-yyyy
-            date_formats = [
-                '%d-%m-%Y',      # 07-11-2025
-                '%d/%m/%Y',      # 07/11/2025
-                '%d-%b-%Y',      # 07-Nov-2025
-                '%d-%b-%y',      # 07-Nov-25
-                '%Y-%m-%d',      # 2025-11-07
-                '%d.%m.%Y',      # 07.11.2025
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    # Format as '07-Nov-2025'
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    continue
-            
-            # Try with case-insensitive month names
-            month_patterns = {
-                'jan': 'Jan', 'feb': 'Feb', 'mar': 'Mar', 'apr': 'Apr',
-                'may': 'May', 'jun': 'Jun', 'jul': 'Jul', 'aug': 'Aug',
-                'sep': 'Sep', 'oct': 'Oct', 'nov': 'Nov', 'dec': 'Dec'
-            }
-            
-            for month_abbr, month_proper in month_patterns.items():
-                if month_abbr in date_str.lower():
-                    # Try to parse with the proper month abbreviation
-                    try:
-                        # Replace the month abbreviation in the string
-                        date_str_modified = date_str.lower().replace(month_abbr, month_proper)
-                        date_obj = pd.to_datetime(date_str_modified, format='%d-%b-%Y')
-                        return date_obj.strftime('%d-%b-%Y')
-                    except:
-                        pass
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            # Excel serial date starts from 1899-12-30
-            try:
-                date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        return ''
-    
-    # Create column mapping based on the input file structure
+# Fallback positions in the standard BRC export layout
+_BRC_DEFAULT_POSITIONS = {
+    'brc_number': 0,
+    'brc_date': 1,
+    'brc_status': 2,
+    'invoice_number': 7,
+    'sb_number': 4,
+    'sb_date': 5,
+    'realised_value': 25,
+    'currency': 26,
+    'realization_date': 24,
+    'brc_utilisation': 22
+}
+
+
+@lru_cache(maxsize=16)
+def _resolve_brc_columns(brc_type: Optional[str], columns: tuple) -> Dict[str, int]:
+    """Resolve the BRC column layout for one (brc_type, schema) pair.
+
+    The matching passes (exact name, case-insensitive substring, port
+    search, positional defaults) depend only on the column names, so
+    repeated uploads with the same layout hit the cache and skip the
+    resolution work entirely."""
     column_indices = {}
-    
-    # Debug: Print all columns with indices
-    print("\n=== DEBUG: All columns in input DataFrame ===")
-    for i, col in enumerate(df.columns):
-        print(f"  Column {i} ('{col}'): Sample data = {df[col].iloc[0] if len(df) > 0 else 'N/A'}")
-    
-    # Try to find columns by exact name first
-    expected_columns = {
-        'BRC Number': 'brc_number',
-        'BRC Date': 'brc_date',
-        'BRC Status': 'brc_status',
-        'Invoice Number': 'invoice_number',
-        'SB NUMBER': 'sb_number',
-        'PORT CODE': 'port_code',
-        'SB Date': 'sb_date',
-        'REALISED VALUE': 'realised_value',
-        'CURRENCY': 'currency',
-        'REALIZATION_DATE': 'realization_date',
-        'BRC Utlisation Status': 'brc_utilisation'
-    }
-    
+
+    # Position and lowercased-name lookups, built once - the passes below do
+    # O(1) dict work per column instead of list(columns).index() scans
+    col_to_idx = {c: i for i, c in enumerate(columns)}
+    cols_lower = [str(c).lower() for c in columns]
+    expected_lower = [(expected.lower(), expected, map_name)
+                      for expected, map_name in _BRC_EXPECTED_COLUMNS.items()]
+
     # First pass: try exact column names
-    for col_name in df.columns:
-        if col_name in expected_columns:
-            column_indices[expected_columns[col_name]] = list(df.columns).index(col_name)
-            print(f"Found '{col_name}' at column {column_indices[expected_columns[col_name]]}")
-    
+    for col_name, map_name in _BRC_EXPECTED_COLUMNS.items():
+        if col_name in col_to_idx:
+            column_indices[map_name] = col_to_idx[col_name]
+            log.debug(f"Found '{col_name}' at column {column_indices[map_name]}")
+
     # Second pass: try case-insensitive matching
-    if len(column_indices) < len(expected_columns):
-        for col_name in df.columns:
-            col_lower = str(col_name).lower()
-            for expected, map_name in expected_columns.items():
-                if map_name not in column_indices:
-                    if expected.lower() in col_lower:
-                        column_indices[map_name] = list(df.columns).index(col_name)
-                        print(f"Found '{col_name}' (matches '{expected}') at column {column_indices[map_name]}")
-    
+    if len(column_indices) < len(_BRC_EXPECTED_COLUMNS):
+        for i, col_lower in enumerate(cols_lower):
+            for exp_lower, expected, map_name in expected_lower:
+                if map_name not in column_indices and exp_lower in col_lower:
+                    column_indices[map_name] = i
+                    log.debug(f"Found '{columns[i]}' (matches '{expected}') at column {i}")
+
     # Third pass: look specifically for port-related columns
-    for i, col_name in enumerate(df.columns):
-        col_lower = str(col_name).lower()
-        if 'port' in col_lower:
-            if 'port_code' not in column_indices:
+    if 'port_code' not in column_indices:
+        for i, col_lower in enumerate(cols_lower):
+            if 'port' in col_lower:
                 column_indices['port_code'] = i
-                print(f"Found port column at index {i}: '{col_name}'")
-    
+                log.debug(f"Found port column at index {i}: '{columns[i]}'")
+                break
+
     # If still not found, use default position 6 (column G/7)
-    if 'port_code' not in column_indices and len(df.columns) > 6:
+    if 'port_code' not in column_indices and len(columns) > 6:
         column_indices['port_code'] = 6
-        print(f"Using default port code column at index 6: '{df.columns[6] if 6 < len(df.columns) else 'N/A'}'")
-    
+        log.debug(f"Using default port code column at index 6: '{columns[6]}'")
+
     # Map other columns if not found
-    other_mappings = {
-        'brc_number': 0,
-        'brc_date': 1,
-        'brc_status': 2,
-        'invoice_number': 7,
-        'sb_number': 4,
-        'sb_date': 5,
-        'realised_value': 25,
-        'currency': 26,
-        'realization_date': 24,
-        'brc_utilisation': 22
-    }
-    
-    for map_name, default_pos in other_mappings.items():
-        if map_name not in column_indices and default_pos < len(df.columns):
+    for map_name, default_pos in _BRC_DEFAULT_POSITIONS.items():
+        if map_name not in column_indices and default_pos < len(columns):
             column_indices[map_name] = default_pos
-            print(f"Using positional mapping for {map_name}: column {default_pos} ('{df.columns[default_pos] if default_pos < len(df.columns) else 'N/A'}')")
+            log.debug(f"Using positional mapping for {map_name}: column {default_pos} ('{columns[default_pos]}')")
+
+    log.debug(f"Final column mapping: {column_indices}")
+    return column_indices
+
+
+def convert_brc(df: pd.DataFrame, brc_type: Optional[str] = None) -> pd.DataFrame:
+    """Convert BRC Excel format after merging"""
+    if df.empty:
+        return df
     
-    print(f"\nFinal column mapping: {column_indices}")
+    # Land the known columns on their expected dtypes up front so the
+    # column passes below hit the fast typed paths
+    df = _apply_expected_dtypes(df, BRC_INPUT_DTYPES)
     
+    log.debug(f"Input DataFrame columns for BRC: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
+    log.debug(f"BRC Type selected: {brc_type}")
+    
+    # Load port code mapping
+    port_mapping = load_port_code_mapping()
+    log.debug(f"Loaded {len(port_mapping)} port code mappings")
+
+    # Resolve the column layout once per (brc_type, schema) via the cache
+    column_indices = _resolve_brc_columns(brc_type, tuple(df.columns))
+
+    # Debug: Print all columns with indices
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("=== DEBUG: All columns in input DataFrame ===")
+        for i, col in enumerate(df.columns):
+            log.debug(f"  Column {i} ('{col}'): Sample data = {df[col].iloc[0] if len(df) > 0 else 'N/A'}")
+
     # Debug: Show sample data from each mapped column
-    if len(df) > 0:
-        print("\n=== Sample data from mapped columns ===")
+    if len(df) > 0 and log.isEnabledFor(logging.DEBUG):
+        log.debug("=== Sample data from mapped columns ===")
         for col_name, col_index in column_indices.items():
             if col_index < len(df.columns):
                 sample_value = df.iloc[0, col_index] if not df.empty else 'N/A'
-                print(f"  {col_name} (col {col_index}): {sample_value}")
-    
-    # Iterate through each row in the merged data
-    for index, row in df.iterrows():
-        try:
-            # Skip rows that are completely empty
-            if row.isna().all():
-                continue
-            
-            # Skip header rows (rows that contain column headers)
-            is_header = False
-            header_keywords = ['brc number', 'brc date', 'brc status', 'invoice number', 
-                              'sb number', 'port code', 'sb date', 'realised value', 
-                              'currency', 'realization_date', 'brc utilisation status']
-            
-            for cell in row:
-                if isinstance(cell, str):
-                    cell_lower = cell.lower()
-                    # Check if the cell contains any of the header keywords
-                    if any(keyword in cell_lower for keyword in header_keywords):
-                        is_header = True
-                        break
-            
-            if is_header:
-                print(f"Skipping header row {index}")
-                continue
-            
-            # Extract values using the column indices
-            def get_value(col_name, default=''):
-                if col_name in column_indices:
-                    col_idx = column_indices[col_name]
-                    if col_idx < len(row):
-                        value = row.iloc[col_idx]
-                        return value if not pd.isna(value) else default
-                return default
-            
-            brc_number = get_value('brc_number')
-            brc_date = get_value('brc_date')
-            brc_status = get_value('brc_status')
-            invoice_number = get_value('invoice_number')
-            sb_number = get_value('sb_number')
-            port_name = get_value('port_code')  # This contains the port name/code
-            sb_date = get_value('sb_date')
-            realised_value = get_value('realised_value')
-            currency = get_value('currency')
-            realization_date = get_value('realization_date')
-            brc_utilisation = get_value('brc_utilisation')
-            
-            # Debug for first few rows
-            if index < 3:
-                print(f"\nRow {index} extracted values:")
-                print(f"  BRC Number: {brc_number}")
-                print(f"  BRC Date: {brc_date}")
-                print(f"  BRC Status: {brc_status}")
-                print(f"  Invoice Number: {invoice_number}")
-                print(f"  SB Number: {sb_number}")
-                print(f"  PORT NAME/CODE: '{port_name}'")
-                print(f"  SB Date: {sb_date}")
-                print(f"  Realised Value: {realised_value}")
-                print(f"  Currency: '{currency}'")
-                print(f"  Realization Date: {realization_date}")
-                print(f"  BRC Utlisation Status: '{brc_utilisation}'")
-            
-            # Validate we have at least some data
-            if pd.isna(brc_number) and pd.isna(sb_number):
-                print(f"Skipping row {index} - no data")
-                continue
-            
-            # Convert port name to short form code using mapping
-            port_code_clean = get_port_code(port_name, port_mapping)
-            
-            # Convert currency to 3-letter code
-            currency_clean = get_currency_code(currency)
-            
-            # Debug port and currency conversion
-            if index < 3:
-                print(f"  Port code conversion: '{port_name}' -> '{port_code_clean}'")
-                print(f"  Currency conversion: '{currency}' -> '{currency_clean}'")
-            
-            # Create a new row in the output format
-            new_row = {
-                'BRC Number': str(brc_number).strip() if brc_number is not None and not pd.isna(brc_number) else '',
-                'BRC Date': convert_and_format_date(brc_date) if brc_date is not None and not pd.isna(brc_date) else '',
-                'BRC Status': str(brc_status).strip() if brc_status is not None and not pd.isna(brc_status) else '',
-                'Bill ID': convert_to_number(invoice_number) if invoice_number is not None and not pd.isna(invoice_number) else '',
-                'SHB No': convert_to_number(sb_number) if sb_number is not None and not pd.isna(sb_number) else '',
-                'SHB Port': port_code_clean,  # Short form port code
-                'SHB Date': convert_and_format_date(sb_date) if sb_date is not None and not pd.isna(sb_date) else '',
-                'Realised Value': convert_to_number(realised_value) if realised_value is not None and not pd.isna(realised_value) else '',
-                'Currency': currency_clean,  # 3-letter currency code
-                'Date of Realization': convert_and_format_date(realization_date) if realization_date is not None and not pd.isna(realization_date) else '',
-                'BRC Utlisation Status': str(brc_utilisation).strip() if brc_utilisation is not None and not pd.isna(brc_utilisation) else '',
-                'BRC Lot': ''
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-    
-    # Create the result DataFrame with data rows
-    result_df = pd.DataFrame(result_data, columns=[
-        'BRC Number', 'BRC Date', 'BRC Status', 'Bill ID', 'SHB No', 
-        'SHB Port', 'SHB Date', 'Realised Value', 'Currency', 
-        'Date of Realization', 'BRC Utlisation Status', 'BRC Lot'
-    ])
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    print(f"  Total rows processed: {len(result_data)}")
-    if not result_df.empty:
-        print(f"  First 3 rows:")
-        print(result_df.head(3))
-        print(f"\n  SHB Port sample: {result_df['SHB Port'].head(5).tolist()}")
-        print(f"  Currency sample: {result_df['Currency'].head(5).tolist()}")
+                log.debug(f"  {col_name} (col {col_index}): {sample_value}")
     
-    # Create the header rows to match the output file format
-    # Based on "BRC_upload.xlsx" format - 3 rows: 2 empty rows + header row
-    header_rows = pd.DataFrame([
-        # Row 1: Empty
-        {col: '' for col in result_df.columns},
-        # Row 2: Empty
-        {col: '' for col in result_df.columns},
-        # Row 3: Column headers
-        {
-            'BRC Number': 'BRC Number',
-            'BRC Date': 'BRC Date',
-            'BRC Status': 'BRC Status',
-            'Bill ID': 'Bill ID',
-            'SHB No': 'SHB No',
-            'SHB Port': 'SHB Port',
-            'SHB Date': 'SHB Date',
-            'Realised Value': 'Realised Value',
-            'Currency': 'Currency',
-            'Date of Realization': 'Date of Realization',
-            'BRC Utlisation Status': 'BRC Utlisation Status',
-            'BRC Lot': 'BRC Lot'
-        }
-    ])
+    # --- Row filtering, done once over the whole frame instead of per row ---
+    # Completely empty rows
+    empty_mask = df.isna().all(axis=1)
+
+    # Header rows repeated from the merged files: any cell containing one of
+    # the header phrases marks the row. Only string-holding columns can carry
+    # a header phrase, so numeric columns skip the scan, and the
+    # case-insensitive alternation removes the per-column lowercase copy
+    header_mask = pd.Series(False, index=df.index)
+    for col_name in df.select_dtypes(include=['object', 'category']).columns:
+        header_mask |= df[col_name].str.contains(_BRC_HEADER_ROW_RE, na=False)
+    skipped_headers = int(header_mask.sum())
+    if skipped_headers:
+        log.debug(f"Skipping {skipped_headers} header row(s)")
+
+    # Rows missing both key cells carry no usable record; checking just the
+    # two key columns avoids another scan across the full row
+    key_idx = [column_indices[k] for k in ('brc_number', 'sb_number')
+               if k in column_indices and column_indices[k] < len(df.columns)]
+    if key_idx:
+        key_missing = df.iloc[:, key_idx].isna().all(axis=1)
+    else:
+        key_missing = pd.Series(False, index=df.index)
+
+    data = df.loc[~(empty_mask | header_mask | key_missing)]
+
+    # --- Column extraction and conversion, one pass per output column ---
+    def raw_col(map_name):
+        idx = column_indices.get(map_name)
+        if idx is None or idx >= len(data.columns):
+            return pd.Series('', index=data.index)
+        return data.iloc[:, idx]
+
+    def text_col(map_name):
+        # One bulk NaN mask per column replaces a pd.isna dispatch per cell
+        raw = raw_col(map_name)
+        na = raw.isna().to_numpy()
+        vals = raw.astype(str).str.strip().to_numpy()
+        return pd.Series(np.where(na, '', vals), index=data.index)
+
+    def number_col(map_name):
+        # One vectorized clean+parse pass over the whole column
+        return clean_number_series(raw_col(map_name))
+
+    def date_col(map_name):
+        # Batched multi-format parse over the whole column, '07-Nov-2025' out
+        return format_date_series(raw_col(map_name))
+
+    # Convert port names to short form codes and currencies to 3-letter
+    # codes: resolve each distinct value once, then broadcast the resulting
+    # dict over the column with a C-level map instead of a Python call per row
+    port_raw = raw_col('port_code')
+    port_lut = {v: get_port_code(v, port_mapping)
+                for v in port_raw.dropna().unique()}
+    ports = port_raw.map(port_lut).fillna('')
+
+    currency_raw = raw_col('currency')
+    currency_lut = {v: get_currency_code(v)
+                    for v in currency_raw.dropna().unique()}
+    currencies = currency_raw.map(currency_lut).fillna('')
+
+    # Assemble the result straight from the finished Series - a dict of
+    # columns skips the row-to-column pivot pd.DataFrame does for records
+    result_df = pd.DataFrame({
+        'BRC Number': text_col('brc_number'),
+        'BRC Date': date_col('brc_date'),
+        'BRC Status': text_col('brc_status'),
+        'Bill ID': number_col('invoice_number'),
+        'SHB No': number_col('sb_number'),
+        'SHB Port': ports,  # Short form port code
+        'SHB Date': date_col('sb_date'),
+        'Realised Value': number_col('realised_value'),
+        'Currency': currencies,  # 3-letter currency code
+        'Date of Realization': date_col('realization_date'),
+        'BRC Utlisation Status': text_col('brc_utilisation'),
+        'BRC Lot': pd.Series('', index=data.index)
+    })
+
+    # Tighten storage: the free-text columns move off object dtype and the
+    # few-distinct-values columns become integer-coded categories
+    result_df = result_df.astype({
+        'BRC Number': _STRING_DTYPE,
+        'BRC Status': 'category',
+        'SHB Port': 'category',
+        'Currency': 'category',
+        'BRC Utlisation Status': 'category'
+    })
+
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    log.debug(f"  Total rows processed: {len(result_df)}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  First 3 rows:\n{result_df.head(3)}")
+        log.debug(f"  SHB Port sample: {result_df['SHB Port'].head(5).tolist()}")
+        log.debug(f"  Currency sample: {result_df['Currency'].head(5).tolist()}")
     
-    # Concatenate header rows with data rows
-    final_df = pd.concat([header_rows, result_df], ignore_index=True)
+    # Stack the static header rows on top of the data
+    final_df = _prepend_header(_BRC_HEADER_DF, result_df)
     
     return final_df
 
@@ -1166,235 +1419,82 @@ def convert_igst_scroll(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    print(f"Input DataFrame columns for IGST Scroll: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
-    
-    # Create a new DataFrame with the required format
-    result_data = []
-    
-    # Start serial number from 1 (for data rows, starting from row 7 in output)
-    serial_number = 1
-    
-    # Helper function to clean and convert to number
-    def convert_to_number(value):
-        if pd.isna(value):
-            return ''
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it (remove currency symbols, commas, etc.)
-            if isinstance(value, str):
-                # Remove currency symbols, commas, and any non-numeric except decimal point and minus
-                value_str = str(value)
-                # Remove ₹ symbol and commas
-                value_str = value_str.replace('₹', '').replace(',', '').strip()
-                if not value_str:
-                    return ''
-                
-                try:
-                    num_value = float(value_str)
-                    # Convert to int if it's a whole number
-                    return int(num_value) if num_value == int(num_value) else num_value
-                except:
-                    return ''
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return ''
-    
-    # Helper function to convert date to dd-mmm-yyyy format
-    def convert_and_format_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            # Format as '10-Jul-2025' (with 4-digit year)
-            return date_value.strftime('%d-%b-%Y')
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # Try common date formats including the ones in your example
-            date_formats = [
-                '%Y-%m-%d',      # 2025-07-10
-                '%d-%b-%y',      # 10-Jul-25
-                '%d-%b-%Y',      # 10-Jul-2025
-                '%d/%m/%Y',      # 10/07/2025
-                '%m/%d/%Y',      # 07/10/2025
-                '%Y/%m/%d',      # 2025/07/10
-                '%d-%m-%Y',      # 10-07-2025
-                '%m-%d-%Y',      # 07-10-2025
-                '%d.%m.%Y',      # 10.07.2025
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    # Force 4-digit year output
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    continue
-            
-            # Try with case-insensitive month
-            if any(month in date_str.upper() for month in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 
-                                                          'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']):
-                # Try with two-digit year first (most common case)
-                try:
-                    date_obj = pd.to_datetime(date_str, format='%d-%b-%y')
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    try:
-                        date_obj = pd.to_datetime(date_str, format='%d-%b-%Y')
-                        return date_obj.strftime('%d-%b-%Y')
-                    except:
-                        pass
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            # Excel serial date starts from 1899-12-30
-            try:
-                date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        return ''
+    # Land the known columns on their expected dtypes up front so the
+    # column passes below hit the fast typed paths
+    df = _apply_expected_dtypes(df, IGST_INPUT_DTYPES)
     
+    log.debug(f"Input DataFrame columns for IGST Scroll: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
+
     # Debug: Show first few rows of input
-    print("\nFirst few rows of input DataFrame:")
-    print(df.head(10))
-    
-    # Iterate through each row in the input data
-    # Start from row 0 since pandas already read the header
-    for index, row in df.iterrows():
-        try:
-            # Skip rows that are completely empty
-            if row.isna().all():
-                print(f"Skipping empty row {index}")
-                continue
-            
-            # Debug: Show row data
-            if index < 5:  # Show first 5 data rows for debugging
-                print(f"\nProcessing row {index}:")
-                for i, col in enumerate(df.columns):
-                    print(f"  {col}: {row[col]}")
-            
-            # Extract values using column names (more reliable)
-            shipping_bill_no = row['Shipping Bill No.'] if 'Shipping Bill No.' in df.columns else None
-            shipping_bill_date = row['Shipping Bill Date'] if 'Shipping Bill Date' in df.columns else None
-            igst_scroll_no = row['IGST Scroll No'] if 'IGST Scroll No' in df.columns else None
-            igst_scroll_date = row['IGST Scroll Date'] if 'IGST Scroll Date' in df.columns else None
-            scroll_amount = row['Scroll Amount(INR)'] if 'Scroll Amount(INR)' in df.columns else None
-            status_pfms = row['Scroll Status At PFMS'] if 'Scroll Status At PFMS' in df.columns else None
-            status_pao = row['Scroll Status At PAO'] if 'Scroll Status At PAO' in df.columns else None
-            bank_response = row['Bank Response Code'] if 'Bank Response Code' in df.columns else None
-            bank_transaction_id = row['Bank Transaction ID'] if 'Bank Transaction ID' in df.columns else None
-            
-            # Debug specific row for troubleshooting
-            if index < 3:
-                print(f"\nRow {index} extracted values:")
-                print(f"  Shipping Bill No.: {shipping_bill_no}")
-                print(f"  Shipping Bill Date: {shipping_bill_date}")
-                print(f"  IGST Scroll No: {igst_scroll_no}")
-                print(f"  IGST Scroll Date: {igst_scroll_date}")
-                print(f"  Scroll Amount: {scroll_amount}")
-                print(f"  Status PFMS: {status_pfms}")
-                print(f"  Status PAO: {status_pao}")
-                print(f"  Bank Response: {bank_response}")
-                print(f"  Bank Transaction ID: {bank_transaction_id}")
-            
-            # Check if this is a header row by looking at column names
-            # If the first column contains the header text, skip it
-            if isinstance(shipping_bill_no, str) and 'Shipping Bill No.' in shipping_bill_no:
-                print(f"Skipping header row {index}")
-                continue
-            
-            # Validate we have at least some data
-            if (pd.isna(shipping_bill_no) or shipping_bill_no == '') and (pd.isna(igst_scroll_no) or igst_scroll_no == ''):
-                print(f"Skipping row {index} - no data")
-                continue
-            
-            # Create a new row in the output format
-            new_row = {
-                'S No.': int(serial_number),
-                'Shipping Bill No.': convert_to_number(shipping_bill_no) if shipping_bill_no is not None and not pd.isna(shipping_bill_no) else '',
-                'Shipping Bill Date': convert_and_format_date(shipping_bill_date) if shipping_bill_date is not None and not pd.isna(shipping_bill_date) else '',
-                'IGST Scroll Number': str(igst_scroll_no).strip() if igst_scroll_no is not None and not pd.isna(igst_scroll_no) else '',
-                'IGST Scroll Date': convert_and_format_date(igst_scroll_date) if igst_scroll_date is not None and not pd.isna(igst_scroll_date) else '',
-                'Scroll Amount(INR)': convert_to_number(scroll_amount) if scroll_amount is not None and not pd.isna(scroll_amount) else '',
-                'Scroll Status At PFMS': str(status_pfms).strip() if status_pfms is not None and not pd.isna(status_pfms) else '',
-                'Scroll Status At PAO': str(status_pao).strip() if status_pao is not None and not pd.isna(status_pao) else '',
-                'Bank Response Code': str(bank_response).strip() if bank_response is not None and not pd.isna(bank_response) else '',
-                'Bank Transaction Details': str(bank_transaction_id).strip() if bank_transaction_id is not None and not pd.isna(bank_transaction_id) else ''
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-    
-    # Create the result DataFrame with data rows
-    result_df = pd.DataFrame(result_data, columns=[
-        'S No.', 'Shipping Bill No.', 'Shipping Bill Date', 'IGST Scroll Number',
-        'IGST Scroll Date', 'Scroll Amount(INR)', 'Scroll Status At PFMS',
-        'Scroll Status At PAO', 'Bank Response Code', 'Bank Transaction Details'
-    ])
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    print(f"  Total rows processed: {len(result_data)}")
-    if not result_df.empty:
-        print(f"  First few rows:")
-        print(result_df.head())
-    
-    # Create the header rows to match the output file format
-    # Based on "IGST Scroll uploding.xlsx" format - 6 header rows
-    header_data = [
-        # Row 1: IEC Name (only in first column)
-        ['IEC Name  -  ALFA'] + [''] * 9,
-        # Row 2: Location Name (only in first column)
-        ['Location Name  -  NHAVA SHEVA SEA (INNSA1)'] + [''] * 9,
-        # Row 3: Report Generated From (only in first column)
-        ['Report Generated From -  2024/01/01  To  2024/06/30'] + [''] * 9,
-        # Row 4: Report Generated On (only in first column)
-        ['Report Generated On  -  30/07/2024 15:05:26'] + [''] * 9,
-        # Row 5: Column Headers
-        ['S No.', 'Shipping Bill No.', 'Shipping Bill Date', 'IGST Scroll Number',
-         'IGST Scroll Date', 'Scroll Amount(INR)', 'Scroll Status', 'Scroll Status',
-         'Bank Response Code', 'Bank Transaction Details'],
-        # Row 6: Sub-headers (only for Scroll Status columns)
-        [''] * 5 + ['', 'At PFMS', 'At PAO', '', '']
-    ]
-    
-    # Create header DataFrame
-    header_df = pd.DataFrame(header_data, columns=[
-        'S No.', 'Shipping Bill No.', 'Shipping Bill Date', 'IGST Scroll Number',
-        'IGST Scroll Date', 'Scroll Amount(INR)', 'Scroll Status At PFMS',
-        'Scroll Status At PAO', 'Bank Response Code', 'Bank Transaction Details'
-    ])
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"First few rows of input DataFrame:\n{df.head(10)}")
+
+    # --- Row filtering, done once over the whole frame instead of per row ---
+    def input_col(name):
+        if name in df.columns:
+            return df[name]
+        return pd.Series(np.nan, index=df.index)
+
+    sb_no_raw = input_col('Shipping Bill No.')
+    scroll_no_raw = input_col('IGST Scroll No')
+
+    # Completely empty rows
+    empty_mask = df.isna().all(axis=1)
+    # Header rows repeated in the data carry the column title in the first field
+    header_mask = sb_no_raw.map(
+        lambda v: isinstance(v, str) and 'Shipping Bill No.' in v)
+    # Rows with neither a shipping bill number nor a scroll number hold no data
+    nodata_mask = ((sb_no_raw.isna() | (sb_no_raw == '')) &
+                   (scroll_no_raw.isna() | (scroll_no_raw == '')))
+
+    data = df.loc[~(empty_mask | header_mask | nodata_mask)]
+
+    # --- Column extraction and conversion, one pass per output column ---
+    def raw_col(name):
+        if name in data.columns:
+            return data[name]
+        return pd.Series(np.nan, index=data.index)
+
+    def text_col(name):
+        # One bulk NaN mask per column replaces a pd.isna dispatch per cell
+        raw = raw_col(name)
+        na = raw.isna().to_numpy()
+        vals = raw.astype(str).str.strip().to_numpy()
+        return pd.Series(np.where(na, '', vals), index=data.index)
+
+    def number_col(name):
+        # One vectorized clean+parse pass over the whole column
+        return clean_number_series(raw_col(name))
+
+    def date_col(name):
+        # Batched multi-format parse over the whole column, '10-Jul-2025' out
+        return format_date_series(raw_col(name))
+
+    # Assemble the result straight from the finished Series - a dict of
+    # columns skips the row-to-column pivot pd.DataFrame does for records
+    result_df = pd.DataFrame({
+        'S No.': pd.Series(np.arange(1, len(data.index) + 1, dtype=np.int64),
+                           index=data.index),
+        'Shipping Bill No.': number_col('Shipping Bill No.'),
+        'Shipping Bill Date': date_col('Shipping Bill Date'),
+        'IGST Scroll Number': text_col('IGST Scroll No'),
+        'IGST Scroll Date': date_col('IGST Scroll Date'),
+        'Scroll Amount(INR)': number_col('Scroll Amount(INR)'),
+        'Scroll Status At PFMS': text_col('Scroll Status At PFMS'),
+        'Scroll Status At PAO': text_col('Scroll Status At PAO'),
+        'Bank Response Code': text_col('Bank Response Code'),
+        'Bank Transaction Details': text_col('Bank Transaction ID')
+    })
+
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    log.debug(f"  Total rows processed: {len(result_df)}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  First few rows:\n{result_df.head()}")
     
-    # Concatenate header rows with data rows
-    final_df = pd.concat([header_df, result_df], ignore_index=True)
+    # Stack the static header rows on top of the data
+    final_df = _prepend_header(_IGST_HEADER_DF, result_df)
     
     return final_df
 
@@ -1403,144 +1503,30 @@ def convert_rodtep_scroll(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    print(f"Input DataFrame columns for RODTEP Scroll: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
-    
-    # Create a new DataFrame with the required format
-    result_data = []
-    
-    # Start serial number from 1 (for data rows, starting from row 4)
-    serial_number = 1
-    
-    # Helper function to clean and convert to number
-    def convert_to_number(value):
-        if pd.isna(value):
-            return ''
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it (remove currency symbols, commas, etc.)
-            if isinstance(value, str):
-                # Remove currency symbols, commas, and any non-numeric except decimal point and minus
-                value_str = str(value)
-                # Remove ₹ symbol and commas
-                value_str = value_str.replace('₹', '').replace(',', '').strip()
-                if not value_str:
-                    return ''
-                
-                try:
-                    num_value = float(value_str)
-                    # Convert to int if it's a whole number
-                    return int(num_value) if num_value == int(num_value) else num_value
-                except:
-                    return ''
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return ''
-    
-    # Helper function to convert date from dd.mm.yyyy format
-    def convert_dot_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            return date_value.strftime('%d-%b-%Y')
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # First try the dd.mm.yyyy format explicitly
-            if '.' in date_str:
-                try:
-                    parts = date_str.split('.')
-                    if len(parts) == 3:
-                        day, month, year = parts
-                        # Ensure 4-digit year
-                        if len(year) == 2:
-                            year = '20' + year
-                        date_obj = datetime.datetime(int(year), int(month), int(day))
-                        return date_obj.strftime('%d-%b-%Y')
-                except:
-                    pass
-            
-            # Try other common formats
-            date_formats = [
-                '%d.%m.%Y',      # 27.10.2025
-                '%d-%m-%Y',      # 27-10-2025
-                '%d/%m/%Y',      # 27/10/2025
-                '%d-%b-%Y',      # 27-Oct-2025
-                '%d-%b-%y',      # 27-Oct-25
-                '%Y-%m-%d',      # 2025-10-27
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    continue
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            try:
-                # Excel serial date starts from 1899-12-30
-                if date_value > 0:
-                    date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                    return date_obj.strftime('%d-%b-%Y')
-                else:
-                    return ''
-            except:
-                return ''
-        
-        return ''
+    log.debug(f"Input DataFrame columns for RODTEP Scroll: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
     
     # Check the column names and map them
-    print("\nDebug: Column names in input DataFrame:")
-    for i, col in enumerate(df.columns):
-        print(f"  Column {i}: '{col}'")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Column names in input DataFrame:")
+        for i, col in enumerate(df.columns):
+            log.debug(f"  Column {i}: '{col}'")
     
-    # Try to find the correct columns by name or position
+    # Try to find the correct columns by name or position: one lowercase
+    # pass over the column names, matched against the module token table
     column_map = {}
-    
-    # Look for column names in the DataFrame
     for col_name in df.columns:
         col_lower = str(col_name).lower()
-        
-        if 'sb number' in col_lower or 'shipping bill' in col_lower:
-            column_map['sb_number'] = col_name
-        elif 'sb date' in col_lower or 'shipping bill date' in col_lower:
-            column_map['sb_date'] = col_name
-        elif 'scroll number' in col_lower:
-            column_map['scroll_number'] = col_name
-        elif 'scroll date' in col_lower:
-            column_map['scroll_date'] = col_name
-        elif 'location' in col_lower:
-            column_map['location'] = col_name
-        elif 'sanctioned' in col_lower or 'amount' in col_lower:
-            column_map['amount'] = col_name
+        for token, key in _RODTEP_SCROLL_TOKENS:
+            if token in col_lower:
+                column_map[key] = col_name
+                break
     
-    print(f"\nColumn mapping found: {column_map}")
+    log.debug(f"Column mapping found: {column_map}")
     
     # If column mapping failed, use positional mapping
     if not column_map:
-        print("Using positional mapping...")
+        log.debug("Using positional mapping...")
         if len(df.columns) >= 7:
             column_map = {
                 'sb_number': df.columns[0],
@@ -1551,97 +1537,75 @@ def convert_rodtep_scroll(df: pd.DataFrame) -> pd.DataFrame:
                 'amount': df.columns[6]
             }
     
-    # Iterate through each row in the input data
-    for index, row in df.iterrows():
-        try:
-            # Skip rows that are completely empty or header rows
-            if row.isna().all():
-                continue
-            
-            # Check if this is a header row
-            if index == 0:
-                # Check if any cell contains header-like text
-                header_keywords = ['sb', 'scroll', 'date', 'number', 'location', 'amount']
-                is_header = False
-                for cell in row:
-                    if isinstance(cell, str):
-                        cell_lower = cell.lower()
-                        if any(keyword in cell_lower for keyword in header_keywords):
-                            is_header = True
-                            break
-                if is_header:
-                    print(f"Skipping header row {index}")
-                    continue
-            
-            # Extract values using the column map
-            sb_number = row[column_map.get('sb_number')] if 'sb_number' in column_map else None
-            sb_date = row[column_map.get('sb_date')] if 'sb_date' in column_map else None
-            scroll_number = row[column_map.get('scroll_number')] if 'scroll_number' in column_map else None
-            scroll_date = row[column_map.get('scroll_date')] if 'scroll_date' in column_map else None
-            location = row[column_map.get('location')] if 'location' in column_map else None
-            amount = row[column_map.get('amount')] if 'amount' in column_map else None
-            
-            # Debug for first few rows
-            if index < 3:
-                print(f"\nRow {index} values:")
-                print(f"  SB Number: {sb_number}")
-                print(f"  SB Date: {sb_date}")
-                print(f"  Scroll Number: {scroll_number}")
-                print(f"  Scroll Date: {scroll_date}")
-                print(f"  Location: {location}")
-                print(f"  Amount: {amount}")
-            
-            # Validate we have at least some data
-            if pd.isna(sb_number) and pd.isna(scroll_number):
-                print(f"Skipping row {index} - no data")
-                continue
-            
-            # Create a new row in the output format
-            new_row = {
-                'Sr. No.': int(serial_number),
-                'SHB No': convert_to_number(sb_number),
-                'Date': convert_dot_date(sb_date),
-                'Scroll No': convert_to_number(scroll_number),
-                'Scroll Date': convert_dot_date(scroll_date),
-                'Scroll Amt': convert_to_number(amount),
-                'Port': str(location) if location is not None and not pd.isna(location) else ''
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-    
-    # Create the result DataFrame with data rows
-    result_df = pd.DataFrame(result_data)
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    if not result_df.empty:
-        print(f"  First few rows:")
-        print(result_df.head())
+    # --- Row filtering, done once over the whole frame instead of per row ---
+    # Completely empty rows
+    empty_mask = df.isna().all(axis=1)
+
+    # Header row: the first row can repeat the column titles - one
+    # vectorized regex pass over the row instead of a per-cell keyword loop
+    header_mask = pd.Series(False, index=df.index)
+    if len(df) > 0:
+        if df.iloc[0].astype(str).str.contains(_RODTEP_SCROLL_HDR_RE, na=False).any():
+            log.debug("Skipping header row 0")
+            header_mask.iloc[0] = True
+
+    def input_col(key):
+        name = column_map.get(key)
+        if name is None or name not in df.columns:
+            return pd.Series(np.nan, index=df.index)
+        return df[name]
+
+    # Rows with neither an SB number nor a scroll number hold no data
+    nodata_mask = input_col('sb_number').isna() & input_col('scroll_number').isna()
+
+    data = df.loc[~(empty_mask | header_mask | nodata_mask)]
+
+    # --- Column extraction and conversion, one pass per output column ---
+    def raw_col(key):
+        name = column_map.get(key)
+        if name is None or name not in data.columns:
+            return pd.Series(np.nan, index=data.index)
+        return data[name]
+
+    def text_col(key):
+        # One bulk NaN mask per column replaces a pd.isna dispatch per cell
+        raw = raw_col(key)
+        na = raw.isna().to_numpy()
+        vals = raw.astype(str).str.strip().to_numpy()
+        return pd.Series(np.where(na, '', vals), index=data.index)
+
+    def number_col(key):
+        # One vectorized clean+parse pass over the whole column
+        return clean_number_series(raw_col(key))
+
+    def date_col(key):
+        # Batched multi-format parse over the whole column, '27-Oct-2025' out
+        return format_date_series(raw_col(key))
+
+    # Assemble the result straight from the finished Series - a dict of
+    # columns skips the row-to-column pivot pd.DataFrame does for records
+    result_df = pd.DataFrame({
+        'Sr. No.': pd.Series(np.arange(1, len(data.index) + 1, dtype=np.int64),
+                             index=data.index),
+        'SHB No': number_col('sb_number'),
+        'Date': date_col('sb_date'),
+        'Scroll No': number_col('scroll_number'),
+        'Scroll Date': date_col('scroll_date'),
+        'Scroll Amt': number_col('amount'),
+        'Port': text_col('location')
+    })
+
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  First few rows:\n{result_df.head()}")
     
     # If result is empty, return empty DataFrame with headers
     if result_df.empty:
-        print("Warning: No data was processed. Returning empty DataFrame with headers.")
+        log.warning("No data was processed. Returning empty DataFrame with headers.")
     
-    # Create the header rows to match the output file format
-    # Based on "RoDTEP Scroll Uploading.xlsx" format - 3 header rows
-    header_rows = pd.DataFrame([
-        # Row 1: Empty
-        {'Sr. No.': '', 'SHB No': '', 'Date': '', 'Scroll No': '', 'Scroll Date': '', 'Scroll Amt': '', 'Port': ''},
-        # Row 2: Empty
-        {'Sr. No.': '', 'SHB No': '', 'Date': '', 'Scroll No': '', 'Scroll Date': '', 'Scroll Amt': '', 'Port': ''},
-        # Row 3: Column headers
-        {'Sr. No.': 'Sr. No.', 'SHB No': 'SHB No', 'Date': 'Date', 'Scroll No': 'Scroll No', 
-         'Scroll Date': 'Scroll Date', 'Scroll Amt': 'Scroll Amt', 'Port': 'Port'}
-    ])
-    
-    # Concatenate header rows with data rows
-    final_df = pd.concat([header_rows, result_df], ignore_index=True)
+    # Stack the static header rows on top of the data
+    final_df = _prepend_header(_RODTEP_SCROLL_HEADER_DF, result_df)
     
     return final_df
 
@@ -1650,213 +1614,35 @@ def convert_rodtep_scrip(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    print(f"Input DataFrame columns for RODTEP Scrip: {df.columns.tolist()}")
-    print(f"Input DataFrame shape: {df.shape}")
-    
-    # Create a new DataFrame with the required format
-    result_data = []
-    
-    # Start serial number from 1 (for data rows, starting from row 4 in output)
-    serial_number = 1
-    
-    # Helper function to clean and convert to number (for amounts) - remove currency symbols and commas
-    def convert_to_number(value):
-        if pd.isna(value):
-            return ''
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value) if value == int(value) else value
-            
-            # If string, clean it (remove currency symbols, commas, etc.)
-            if isinstance(value, str):
-                value_str = str(value).strip()
-                if not value_str or value_str.upper() == 'N.A' or value_str.upper() == 'NA':
-                    return ''
-                
-                # Remove currency symbols like ₹, $, €, £, etc.
-                value_str = re.sub(r'[₹$€£¥]', '', value_str)
-                
-                # Remove commas
-                value_str = value_str.replace(',', '').strip()
-                
-                # Remove any other non-numeric characters except decimal point and minus
-                value_str = re.sub(r'[^\d.-]', '', value_str)
-                
-                if not value_str:
-                    return ''
-                
-                try:
-                    num_value = float(value_str)
-                    # Convert to int if it's a whole number
-                    return int(num_value) if num_value == int(num_value) else num_value
-                except:
-                    return ''
-            
-            return pd.to_numeric(value, errors='coerce')
-        except Exception as e:
-            print(f"Error converting number '{value}': {e}")
-            return ''
-    
-    # Helper function to clean and convert to number for non-amount fields (like SB NUMBER, SCRIP NUMBER)
-    def convert_to_integer(value):
-        if pd.isna(value):
-            return ''
-        try:
-            # If already a number
-            if isinstance(value, (int, float)):
-                return int(value)
-            
-            # If string, clean it (remove non-digit characters)
-            if isinstance(value, str):
-                value_str = str(value).strip()
-                if not value_str:
-                    return ''
-                
-                # Remove any non-digit characters
-                value_str = re.sub(r'[^\d]', '', value_str)
-                
-                if not value_str:
-                    return ''
-                
-                try:
-                    return int(value_str)
-                except:
-                    return ''
-            
-            return int(value) if not pd.isna(value) else ''
-        except Exception as e:
-            print(f"Error converting to integer '{value}': {e}")
-            return ''
-    
-    # Helper function to convert date to dd-mmm-yyyy format, handling "N.A" values
-    def convert_and_format_date(date_value):
-        if pd.isna(date_value):
-            return ''
-        
-        # Check if it's "N.A" or "NA" (case-insensitive)
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip().upper()
-            if date_str == 'N.A' or date_str == 'NA':
-                return date_str  # Return as-is for SCRIP TRANSFER DATE
-        
-        # If it's already a datetime object
-        if isinstance(date_value, (pd.Timestamp, datetime.datetime)):
-            # Format as '09-Jul-2025'
-            return date_value.strftime('%d-%b-%Y')
-        
-        # If it's a string
-        if isinstance(date_value, str):
-            date_str = str(date_value).strip()
-            if not date_str:
-                return ''
-            
-            # Skip if it's "N.A" or "NA" (already handled above)
-            if date_str.upper() in ['N.A', 'NA']:
-                return date_str.upper()
-            
-            # Try date formats including dd.mm.yyyy (from your input example)
-            date_formats = [
-                '%d.%m.%Y',      # 22.07.2025 (from your input)
-                '%d-%b-%Y',      # 09-Jul-2025
-                '%d-%b-%y',      # 09-Jul-25
-                '%Y-%m-%d',      # 2025-07-09
-                '%d/%m/%Y',      # 09/07/2025
-                '%m/%d/%Y',      # 07/09/2025
-                '%Y/%m/%d',      # 2025/07/09
-                '%d-%m-%Y',      # 09-07-2025
-                '%m-%d-%Y',      # 07-09-2025
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    date_obj = pd.to_datetime(date_str, format=fmt)
-                    # Format as '09-Jul-2025'
-                    return date_obj.strftime('%d-%b-%Y')
-                except:
-                    continue
-            
-            # Try with case-insensitive month names
-            month_patterns = {
-                'jan': 'Jan', 'feb': 'Feb', 'mar': 'Mar', 'apr': 'Apr',
-                'may': 'May', 'jun': 'Jun', 'jul': 'Jul', 'aug': 'Aug',
-                'sep': 'Sep', 'oct': 'Oct', 'nov': 'Nov', 'dec': 'Dec'
-            }
-            
-            for month_abbr, month_proper in month_patterns.items():
-                if month_abbr in date_str.lower():
-                    # Try to parse with the proper month abbreviation
-                    try:
-                        # Replace the month abbreviation in the string
-                        date_str_modified = date_str.lower().replace(month_abbr, month_proper)
-                        date_obj = pd.to_datetime(date_str_modified, format='%d-%b-%Y')
-                        return date_obj.strftime('%d-%b-%Y')
-                    except:
-                        pass
-            
-            # Last resort: pandas flexible parser
-            try:
-                date_obj = pd.to_datetime(date_str, errors='coerce')
-                if pd.isna(date_obj):
-                    return ''
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        # If it's a number (Excel serial date), convert it
-        if isinstance(date_value, (int, float)):
-            # Excel serial date starts from 1899-12-30
-            try:
-                date_obj = pd.Timestamp('1899-12-30') + pd.Timedelta(days=date_value)
-                return date_obj.strftime('%d-%b-%Y')
-            except:
-                return ''
-        
-        return ''
-    
-    # Debug: Show first few rows of input
-    print("\nFirst few rows of input DataFrame:")
-    print(df.head(10))
+    log.debug(f"Input DataFrame columns for RODTEP Scrip: {df.columns.tolist()}")
+    log.debug(f"Input DataFrame shape: {df.shape}")
     
-    # Check the column names and map them
-    print("\nDebug: Column names in input DataFrame:")
-    for i, col in enumerate(df.columns):
-        print(f"  Column {i}: '{col}'")
+    # Debug: Show first few rows and column names of input
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"First few rows of input DataFrame:\n{df.head(10)}")
+        log.debug("Column names in input DataFrame:")
+        for i, col in enumerate(df.columns):
+            log.debug(f"  Column {i}: '{col}'")
     
     # Map column names from input to variables for clarity
     # Based on your input file structure:
     # A: Scrip No, B: Scrip Issue Date, C: Scrip Exp Date, D: Scrip Issued Amount
     # E: Scrip Balance, F: Scrip Transfer Date, G: Scrip Status, H: Scroll Number, I: SB Number
     
+    # Same token-table matching as the scroll converter
     column_map = {}
     for col_name in df.columns:
         col_lower = str(col_name).lower()
-        
-        if 'scrip no' in col_lower:
-            column_map['scrip_no'] = col_name
-        elif 'scrip issue date' in col_lower:
-            column_map['scrip_issue_date'] = col_name
-        elif 'scrip exp date' in col_lower or 'scrip expiry date' in col_lower:
-            column_map['scrip_exp_date'] = col_name
-        elif 'scrip issued amount' in col_lower:
-            column_map['scrip_issued_amount'] = col_name
-        elif 'scrip balance' in col_lower:
-            column_map['scrip_balance'] = col_name
-        elif 'scrip transfer date' in col_lower:
-            column_map['scrip_transfer_date'] = col_name
-        elif 'scrip status' in col_lower:
-            column_map['scrip_status'] = col_name
-        elif 'scroll number' in col_lower:
-            column_map['scroll_number'] = col_name
-        elif 'sb number' in col_lower or 'shipping bill' in col_lower:
-            column_map['sb_number'] = col_name
+        for token, key in _RODTEP_SCRIP_TOKENS:
+            if token in col_lower:
+                column_map[key] = col_name
+                break
     
-    print(f"\nColumn mapping found: {column_map}")
+    log.debug(f"Column mapping found: {column_map}")
     
     # If column mapping failed, use positional mapping (based on your input file)
     if not column_map:
-        print("Using positional mapping...")
+        log.debug("Using positional mapping...")
         if len(df.columns) >= 9:
             column_map = {
                 'scrip_no': df.columns[0],
@@ -1870,148 +1656,107 @@ def convert_rodtep_scrip(df: pd.DataFrame) -> pd.DataFrame:
                 'sb_number': df.columns[8]
             }
     
-    # Iterate through each row in the input data
-    for index, row in df.iterrows():
-        try:
-            # Skip rows that are completely empty
-            if row.isna().all():
-                continue
-            
-            # Check if this is a header row
-            if index == 0:
-                # Check if any cell contains header-like text
-                header_keywords = ['scrip', 'scroll', 'sb', 'date', 'number', 'amount', 'balance', 'status']
-                is_header = False
-                for cell in row:
-                    if isinstance(cell, str):
-                        cell_lower = cell.lower()
-                        if any(keyword in cell_lower for keyword in header_keywords):
-                            is_header = True
-                            break
-                if is_header:
-                    print(f"Skipping header row {index}")
-                    continue
-            
-            # Extract values using the column map
-            # Note: We'll still extract scroll_number for debugging, but output column 2 will be blank
-            scroll_number = row[column_map.get('scroll_number')] if 'scroll_number' in column_map else None
-            sb_number = row[column_map.get('sb_number')] if 'sb_number' in column_map else None
-            scrip_no = row[column_map.get('scrip_no')] if 'scrip_no' in column_map else None
-            scrip_issue_date = row[column_map.get('scrip_issue_date')] if 'scrip_issue_date' in column_map else None
-            scrip_exp_date = row[column_map.get('scrip_exp_date')] if 'scrip_exp_date' in column_map else None
-            scrip_issued_amount = row[column_map.get('scrip_issued_amount')] if 'scrip_issued_amount' in column_map else None
-            scrip_balance = row[column_map.get('scrip_balance')] if 'scrip_balance' in column_map else None
-            scrip_transfer_date = row[column_map.get('scrip_transfer_date')] if 'scrip_transfer_date' in column_map else None
-            scrip_status = row[column_map.get('scrip_status')] if 'scrip_status' in column_map else None
-            
-            # Debug for first few rows
-            if index < 3:
-                print(f"\nRow {index} values:")
-                print(f"  Scroll Number (input col 8): {scroll_number} (will be blank in output)")
-                print(f"  SB Number (input col 9): {sb_number}")
-                print(f"  Scrip No (input col 1): {scrip_no}")
-                print(f"  Scrip Issue Date (input col 2): {scrip_issue_date}")
-                print(f"  Scrip Exp Date (input col 3): {scrip_exp_date}")
-                print(f"  Scrip Issued Amount (input col 4): '{scrip_issued_amount}'")
-                print(f"  Scrip Balance (input col 5): '{scrip_balance}'")
-                print(f"  Scrip Transfer Date (input col 6): '{scrip_transfer_date}'")
-                print(f"  Scrip Status (input col 7): {scrip_status}")
-            
-            # Validate we have at least some data
-            if pd.isna(scrip_no) and pd.isna(scroll_number) and pd.isna(sb_number):
-                print(f"Skipping row {index} - no data")
-                continue
-            
-            # Special handling for SCRIP TRANSFER DATE - preserve "N.A" if present
-            scrip_transfer_date_formatted = ''
-            if scrip_transfer_date is not None and not pd.isna(scrip_transfer_date):
-                scrip_transfer_date_str = str(scrip_transfer_date).strip().upper()
-                if scrip_transfer_date_str in ['N.A', 'NA']:
-                    scrip_transfer_date_formatted = scrip_transfer_date_str
-                else:
-                    scrip_transfer_date_formatted = convert_and_format_date(scrip_transfer_date)
-            
-            # Create a new row in the output format according to your requirements
-            # Output column 2 (SCROLL NUMBER) is now blank as requested
-            new_row = {
-                'Sr. No': int(serial_number),
-                'SCROLL NUMBER': '',  # BLANK as per new requirement (output column 2)
-                'SB NUMBER': convert_to_integer(sb_number) if sb_number is not None and not pd.isna(sb_number) else '',
-                'SB DATE': '',  # Blank as per requirements
-                'SB AMOUNT': '',  # Blank as per requirements
-                'SCRIP NUMBER': convert_to_integer(scrip_no) if scrip_no is not None and not pd.isna(scrip_no) else '',
-                'SCRIP ISSUE DATE': convert_and_format_date(scrip_issue_date) if scrip_issue_date is not None and not pd.isna(scrip_issue_date) else '',
-                'SCRIP EXPIRY DATE': convert_and_format_date(scrip_exp_date) if scrip_exp_date is not None and not pd.isna(scrip_exp_date) else '',
-                'SCRIP ISSUE AMOUNT': convert_to_number(scrip_issued_amount) if scrip_issued_amount is not None and not pd.isna(scrip_issued_amount) else '',
-                'SCRIP BALANCE AMOUNT': convert_to_number(scrip_balance) if scrip_balance is not None and not pd.isna(scrip_balance) else '',
-                'SCRIP TRANSFER DATE': scrip_transfer_date_formatted,
-                'SCRIP STATUS': str(scrip_status).strip() if scrip_status is not None and not pd.isna(scrip_status) else '',
-                'Application Ref. No': ''  # Blank as per requirements
-            }
-            result_data.append(new_row)
-            serial_number += 1
-            
-        except Exception as e:
-            print(f"Error processing row {index}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-    
-    # Create the result DataFrame with data rows
-    result_df = pd.DataFrame(result_data, columns=[
-        'Sr. No', 'SCROLL NUMBER', 'SB NUMBER', 'SB DATE', 'SB AMOUNT',
-        'SCRIP NUMBER', 'SCRIP ISSUE DATE', 'SCRIP EXPIRY DATE',
-        'SCRIP ISSUE AMOUNT', 'SCRIP BALANCE AMOUNT',
-        'SCRIP TRANSFER DATE', 'SCRIP STATUS', 'Application Ref. No'
-    ])
-    
-    print(f"\nOutput DataFrame info:")
-    print(f"  Shape: {result_df.shape}")
-    print(f"  Total rows processed: {len(result_data)}")
-    if not result_df.empty:
-        print(f"  First few rows:")
-        print(result_df.head())
-        print(f"\n  Sample amounts (after cleaning):")
-        print(f"    SCRIP ISSUE AMOUNT: {result_df['SCRIP ISSUE AMOUNT'].head(3).tolist()}")
-        print(f"    SCRIP BALANCE AMOUNT: {result_df['SCRIP BALANCE AMOUNT'].head(3).tolist()}")
-        print(f"    SCRIP TRANSFER DATE: {result_df['SCRIP TRANSFER DATE'].head(3).tolist()}")
-        print(f"    SCROLL NUMBER (should be blank): {result_df['SCROLL NUMBER'].head(3).tolist()}")
-    
-    # Create the header rows to match the output file format
-    # Row 1: Empty
-    # Row 2: Empty  
-    # Row 3: Column headers (headers at row 3 as requested)
-    # Row 4 onwards: Data (data from row 4 as requested)
-    
-    header_rows = pd.DataFrame([
-        # Row 1: Empty
-        {col: '' for col in result_df.columns},
-        # Row 2: Empty
-        {col: '' for col in result_df.columns},
-        # Row 3: Column headers (headers at row 3)
-        {
-            'Sr. No': 'Sr. No',
-            'SCROLL NUMBER': 'SCROLL NUMBER',
-            'SB NUMBER': 'SB NUMBER',
-            'SB DATE': 'SB DATE',
-            'SB AMOUNT': 'SB AMOUNT',
-            'SCRIP NUMBER': 'SCRIP NUMBER',
-            'SCRIP ISSUE DATE': 'SCRIP ISSUE DATE',
-            'SCRIP EXPIRY DATE': 'SCRIP EXPIRY DATE',
-            'SCRIP ISSUE AMOUNT': 'SCRIP ISSUE AMOUNT',
-            'SCRIP BALANCE AMOUNT': 'SCRIP BALANCE AMOUNT',
-            'SCRIP TRANSFER DATE': 'SCRIP TRANSFER DATE',
-            'SCRIP STATUS': 'SCRIP STATUS',
-            'Application Ref. No': 'Application Ref. No'
-        }
-    ])
-    
-    # Concatenate header rows with data rows
-    final_df = pd.concat([header_rows, result_df], ignore_index=True)
+    # --- Row filtering, done once over the whole frame instead of per row ---
+    # Completely empty rows
+    empty_mask = df.isna().all(axis=1)
+
+    # Header row: the first row can repeat the column titles - one
+    # vectorized regex pass over the row instead of a per-cell keyword loop
+    header_mask = pd.Series(False, index=df.index)
+    if len(df) > 0:
+        if df.iloc[0].astype(str).str.contains(_RODTEP_SCRIP_HDR_RE, na=False).any():
+            log.debug("Skipping header row 0")
+            header_mask.iloc[0] = True
+
+    def input_col(key):
+        name = column_map.get(key)
+        if name is None or name not in df.columns:
+            return pd.Series(np.nan, index=df.index)
+        return df[name]
+
+    # Rows with no scrip number, scroll number or SB number hold no data
+    nodata_mask = (input_col('scrip_no').isna() &
+                   input_col('scroll_number').isna() &
+                   input_col('sb_number').isna())
+
+    data = df.loc[~(empty_mask | header_mask | nodata_mask)]
+
+    # --- Column extraction and conversion, one pass per output column ---
+    def raw_col(key):
+        name = column_map.get(key)
+        if name is None or name not in data.columns:
+            return pd.Series(np.nan, index=data.index)
+        return data[name]
+
+    def text_col(key):
+        # One bulk NaN mask per column replaces a pd.isna dispatch per cell
+        raw = raw_col(key)
+        na = raw.isna().to_numpy()
+        vals = raw.astype(str).str.strip().to_numpy()
+        return pd.Series(np.where(na, '', vals), index=data.index)
+
+    def int_col(key):
+        # Digits-only identifier cleanup in one pass over the column
+        return to_integer_series(raw_col(key))
+
+    def amount_col(key):
+        # One vectorized clean+parse pass over the whole column; 'N.A'
+        # values fail the numeric cast and come back as ''
+        return clean_number_series(raw_col(key))
+
+    def date_col(key):
+        # Scrip batches repeat the same date across many rows, so parse
+        # each distinct value once and broadcast the results with a
+        # C-level map; 'N.A'/'NA' markers pass through unchanged (the
+        # scrip transfer date keeps them)
+        raw = raw_col(key)
+        uniq = pd.Series(raw.dropna().unique())
+        formatted = format_date_series(uniq)
+        upper = uniq.map(lambda v: str(v).strip().upper())
+        formatted = formatted.where(~upper.isin(('N.A', 'NA')), upper)
+        return raw.map(dict(zip(uniq, formatted))).fillna('')
+
+    blank = pd.Series('', index=data.index)
+
+    # Assemble the result straight from the finished Series - a dict of
+    # columns skips the row-to-column pivot pd.DataFrame does for records.
+    # SCROLL NUMBER, SB DATE, SB AMOUNT and Application Ref. No stay blank
+    # per the output requirements
+    result_df = pd.DataFrame({
+        'Sr. No': pd.Series(np.arange(1, len(data.index) + 1, dtype=np.int64),
+                            index=data.index),
+        'SCROLL NUMBER': blank,
+        'SB NUMBER': int_col('sb_number'),
+        'SB DATE': blank,
+        'SB AMOUNT': blank,
+        'SCRIP NUMBER': int_col('scrip_no'),
+        'SCRIP ISSUE DATE': date_col('scrip_issue_date'),
+        'SCRIP EXPIRY DATE': date_col('scrip_exp_date'),
+        'SCRIP ISSUE AMOUNT': amount_col('scrip_issued_amount'),
+        'SCRIP BALANCE AMOUNT': amount_col('scrip_balance'),
+        'SCRIP TRANSFER DATE': date_col('scrip_transfer_date'),
+        'SCRIP STATUS': text_col('scrip_status'),
+        'Application Ref. No': blank
+    })
+    
+    log.debug("Output DataFrame info:")
+    log.debug(f"  Shape: {result_df.shape}")
+    log.debug(f"  Total rows processed: {len(result_df)}")
+    if not result_df.empty and log.isEnabledFor(logging.DEBUG):
+        log.debug(f"  First few rows:\n{result_df.head()}")
+        log.debug("  Sample amounts (after cleaning):")
+        log.debug(f"    SCRIP ISSUE AMOUNT: {result_df['SCRIP ISSUE AMOUNT'].head(3).tolist()}")
+        log.debug(f"    SCRIP BALANCE AMOUNT: {result_df['SCRIP BALANCE AMOUNT'].head(3).tolist()}")
+        log.debug(f"    SCRIP TRANSFER DATE: {result_df['SCRIP TRANSFER DATE'].head(3).tolist()}")
+        log.debug(f"    SCROLL NUMBER (should be blank): {result_df['SCROLL NUMBER'].head(3).tolist()}")
+    
+    # Stack the static header rows on top of the data (titles at row 3,
+    # data from row 4)
+    final_df = _prepend_header(_RODTEP_SCRIP_HEADER_DF, result_df)
     
     return final_df
 
-def process_excel(process_type: str, files: List[Tuple[str, bytes]], brc_type: Optional[str] = None) -> pd.DataFrame:
+def process_excel(process_type: str, files: List[Tuple[str, str]], brc_type: Optional[str] = None) -> pd.DataFrame:
     """
     Main processing function
     Returns: Processed DataFrame
@@ -2037,24 +1782,32 @@ def process_excel(process_type: str, files: List[Tuple[str, bytes]], brc_type: O
             raise ValueError("No file provided")
         
         # Get the single file
-        filename, file_data = files[0]
-        
+        filename, file_path = files[0]
+
         # Determine engine based on file extension
         if filename.lower().endswith('.xls'):
             # For .xls files, try xlrd engine
             try:
-                df = pd.read_excel(io.BytesIO(file_data), engine='xlrd')
+                df = pd.read_excel(file_path, engine='xlrd')
             except ImportError:
                 raise ImportError(
                     "Missing dependency: xlrd library is required to read .xls files. "
                     "Please install it using: pip install xlrd"
                 )
         elif filename.lower().endswith('.xlsx'):
-            # For .xlsx files, use openpyxl engine
-            df = pd.read_excel(io.BytesIO(file_data), engine='openpyxl')
+            # For .xlsx files, prefer the native calamine engine when
+            # installed; openpyxl is the compatible fallback
+            if CALAMINE_AVAILABLE:
+                try:
+                    df = pd.read_excel(file_path, engine='calamine')
+                except Exception as e:
+                    log.warning(f"calamine read failed for {filename} ({e}), using openpyxl")
+                    df = pd.read_excel(file_path, engine='openpyxl')
+            else:
+                df = pd.read_excel(file_path, engine='openpyxl')
         else:
             # Try default engine
-            df = pd.read_excel(io.BytesIO(file_data))
+            df = pd.read_excel(file_path)
         
         # Apply conversion based on process type
         converters = {
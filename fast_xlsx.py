@@ -0,0 +1,162 @@
+"""
+Minimal streaming XLSX writer for hot processes, bypassing openpyxl's cell model.
+
+Writes the OOXML parts straight into the zip with a fixed set of
+pre-registered styles, so large sheets avoid per-cell object overhead.
+Strings are written as inline strings (no shared-strings table needed).
+"""
+
+from xml.sax.saxutils import escape
+from zipfile import ZipFile, ZIP_DEFLATED
+
+# Pre-registered cell style (xf) indices in styles.xml
+STYLE_DEFAULT = 0
+STYLE_CENTER = 1
+STYLE_RIGHT = 2
+STYLE_MONEY_RIGHT = 3   # '#,##0.00', right-aligned
+STYLE_MONEY_CENTER = 4  # '#,##0.00', center-aligned
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# numFmt 164 is the first custom slot: '#,##0.00'
+# cellXfs order must match the STYLE_* constants above
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="#,##0.00"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="right"/></xf>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1" applyAlignment="1"><alignment horizontal="right"/></xf>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1" applyAlignment="1"><alignment horizontal="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def _col_letter(n):
+    """Convert a 1-based column number to its Excel letter ('A', 'B', ... 'AA')"""
+    letters = ''
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _col_index(letters):
+    """Convert an Excel column letter ('A', 'B', ... 'AA') back to its
+    1-based number - inverse of _col_letter"""
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch.upper()) - 64)
+    return n
+
+
+def _number_to_xml(value):
+    """Render a number for the <v> element (ints without trailing .0)"""
+    if isinstance(value, float) and value == int(value):
+        return str(int(value))
+    return str(value)
+
+
+def write_xlsx(path, rows, column_widths=None, col_styles=None, data_start_row=0):
+    """
+    Stream rows into an XLSX file at `path`.
+
+    Args:
+        path: Output file path or writable binary file object
+        rows: Iterable of row tuples/lists (already in sheet order, row 1 first)
+        column_widths (dict, optional): Column letter -> width
+        col_styles (dict, optional): 1-based column number -> STYLE_* index,
+            applied only to rows >= data_start_row
+        data_start_row (int): First Excel row with data; rows above keep the
+            default style (report header rows)
+    """
+    column_widths = column_widths or {}
+    col_styles = col_styles or {}
+
+    with ZipFile(path, 'w', ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _ROOT_RELS)
+        zf.writestr('xl/workbook.xml', _WORKBOOK)
+        zf.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+        zf.writestr('xl/styles.xml', _STYLES)
+
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as f:
+            f.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">')
+
+            if column_widths:
+                # min/max come from the letter key itself, so sparse dicts
+                # and columns past 'Z' attach their width to the right column
+                cols = []
+                for col, width in sorted(column_widths.items(),
+                                         key=lambda kv: _col_index(kv[0])):
+                    i = _col_index(col)
+                    cols.append(f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>')
+                f.write(f'<cols>{"".join(cols)}</cols>'.encode('utf-8'))
+
+            f.write(b'<sheetData>')
+
+            for excel_row, row in enumerate(rows, 1):
+                in_data = data_start_row > 0 and excel_row >= data_start_row
+                cells = []
+                prev_col = 0
+                for col_num, value in enumerate(row, 1):
+                    if value is None:
+                        # Skipped cells leave a gap; the next cell must carry
+                        # an explicit r attribute so its column isn't implied
+                        continue
+                    style = col_styles.get(col_num, STYLE_DEFAULT) if in_data else STYLE_DEFAULT
+                    attrs = f' s="{style}"' if style else ''
+                    if col_num != prev_col + 1:
+                        attrs = f' r="{_col_letter(col_num)}{excel_row}"' + attrs
+                    prev_col = col_num
+                    if isinstance(value, bool):
+                        cells.append(f'<c{attrs} t="b"><v>{int(value)}</v></c>')
+                    elif isinstance(value, (int, float)):
+                        cells.append(f'<c{attrs}><v>{_number_to_xml(value)}</v></c>')
+                    else:
+                        cells.append(f'<c{attrs} t="inlineStr"><is><t>{escape(str(value))}</t></is></c>')
+                f.write(f'<row r="{excel_row}">{"".join(cells)}</row>'.encode('utf-8'))
+
+            f.write(b'</sheetData></worksheet>')
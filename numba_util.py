@@ -0,0 +1,54 @@
+"""
+Optional numba-accelerated helpers for the numeric coercion pass in app.py.
+
+numba is not a hard dependency - when it isn't installed the helpers fall
+back to plain numpy, which is still vectorized and correct, just slower on
+very large sheets.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this row count the JIT warmup costs more than it saves;
+# coerce_int_col falls back to the numpy path for smaller arrays
+JIT_ROW_THRESHOLD = 10_000
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _coerce_int_col_jit(arr, out, mask):
+        for i in prange(arr.size):
+            v = arr[i]
+            if math.isnan(v):
+                mask[i] = True
+                out[i] = 0
+            else:
+                mask[i] = False
+                # Truncate toward zero, exactly like the numpy branch and
+                # the per-cell int() the app used before vectorization
+                out[i] = int(v)
+
+
+def coerce_int_col(arr):
+    """
+    Truncate a float64 array to int64 in one pass.
+
+    Values truncate toward zero (int() semantics), identically on the JIT
+    and numpy paths; the JIT kernel only kicks in above JIT_ROW_THRESHOLD
+    where it outruns its warmup. Returns (values, is_null) where is_null
+    marks the NaN slots; the values at those slots are 0 and should be
+    treated as missing by the caller.
+    """
+    out = np.empty(arr.size, dtype=np.int64)
+    mask = np.empty(arr.size, dtype=np.bool_)
+    if NUMBA_AVAILABLE and arr.size > JIT_ROW_THRESHOLD:
+        _coerce_int_col_jit(arr, out, mask)
+    else:
+        np.isnan(arr, out=mask)
+        out[:] = np.where(mask, 0.0, arr).astype(np.int64)
+    return out, mask
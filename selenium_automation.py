@@ -9,6 +9,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException
+import threading
 import time
 import sys
 import os
@@ -27,11 +28,60 @@ PROCESS_TO_CARD_MAP = {
    
 }
 
+# Locators shared by the navigation helpers. Hoisting the (By, selector)
+# tuples keeps the strategy code short and the selectors in one place.
+CARD_BODY = (By.CLASS_NAME, "card-body")
+ANT_SELECT = (By.CLASS_NAME, "ant-select")
+ANT_SELECT_PLACEHOLDER = (By.CLASS_NAME, "ant-select-selection-placeholder")
+ANT_SELECT_SEARCH_INPUT = (By.CLASS_NAME, "ant-select-selection-search-input")
+DROPDOWN_OPTION = (By.CLASS_NAME, "ant-select-item-option")
+OPEN_DROPDOWN = (By.CSS_SELECTOR, ".ant-select-dropdown:not(.ant-select-dropdown-hidden)")
+OPEN_DROPDOWN_OPTION = (By.CSS_SELECTOR, ".ant-select-dropdown:not(.ant-select-dropdown-hidden) .ant-select-item-option")
+SEARCH_LIKE_INPUT = (By.XPATH, "//input[@type='search' or contains(@class, 'search') or @role='combobox']")
+IEC_LABEL = (By.XPATH, "//*[contains(text(), 'IEC') or contains(text(), 'iec') or contains(text(), 'Exporter')]")
+ADJACENT_INPUT = (By.XPATH, "following::input[1] | preceding::input[1]")
+PLACEHOLDER_SELECT = (By.CSS_SELECTOR, "div.ant-select:has(.ant-select-selection-placeholder)")
+IEC_PLACEHOLDER_XPATH = "//input[contains(@placeholder, '{}')]"
+EMAIL_FIELD = (By.XPATH, "//input[@placeholder='Enter email' or @type='email']")
+PASSWORD_FIELD = (By.XPATH, "//input[@placeholder='Enter password' or @type='password']")
+SUBMIT_BUTTON = (By.XPATH, "//button[contains(text(), 'Sign In') or contains(text(), 'Login') or @type='submit']")
+DASHBOARD_INDICATOR = (By.XPATH, "//*[contains(text(), 'Dashboard') or contains(text(), 'Upload') or contains(text(), 'dashboard')]")
+CARD_PLACEHOLDER_SELECT = (By.CSS_SELECTOR, ".card-body div.ant-select:has(.ant-select-selection-placeholder)")
+LOGIN_ERROR = (By.CSS_SELECTOR, ".ant-form-item-explain-error, .ant-message-error, .alert-danger")
+
+# Seconds to keep the browser open after a successful run, for manual
+# inspection; off by default, opt in with e.g. CIP_HOLD_OPEN=30
+HOLD_OPEN_SECONDS = float(os.environ.get('CIP_HOLD_OPEN', '0') or 0)
+
+# Remembers which locator found each element on the last run, so repeat
+# runs (the browser session is reused) try the winner first with a short
+# wait instead of walking the whole strategy cascade again
+_LOCATOR_CACHE = {}
+
+
+def _find_cached(driver, key):
+    """Return the element the cached locator for `key` finds, or None"""
+    locator = _LOCATOR_CACHE.get(key)
+    if locator is None:
+        return None
+    try:
+        return WebDriverWait(driver, 2, poll_frequency=0.2).until(
+            EC.presence_of_element_located(locator)
+        )
+    except TimeoutException:
+        # Page layout changed since the last run; forget the stale entry
+        _LOCATOR_CACHE.pop(key, None)
+        return None
+
+
+def _remember_locator(key, locator):
+    _LOCATOR_CACHE[key] = locator
+
+
 def select_brc_type(driver, wait, brc_type):
     """Select BRC type (FOB or INV) in the portal before IEC selection"""
     try:
         print(f"\nAttempting to select BRC type: {brc_type}")
-        time.sleep(2)  # Wait for page to load completely
 
         # Map UI brc_type to portal options (FOB or INV)
         brc_type_upper = brc_type.upper() if brc_type else 'FOB'
@@ -43,62 +93,87 @@ def select_brc_type(driver, wait, brc_type):
         try:
             # Find the card-body containing BRC
             card_body = wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "card-body"))
+                EC.presence_of_element_located(CARD_BODY)
             )
             
-            # Find all ant-select elements within card-body
-            ant_selects = card_body.find_elements(By.CLASS_NAME, "ant-select")
-            
-            if len(ant_selects) >= 1:
-                # First ant-select should be BRC Type (width: 150px)
-                brc_type_selector = ant_selects[0]
-                
-                # Verify it's the BRC type selector by placeholder
+            # Try whatever locator found the selector on the last run
+            brc_type_selector = _find_cached(driver, 'brc_type_select')
+            if brc_type_selector is not None:
+                print("✓ Found BRC type selector (cached locator)")
+            else:
+                # One scoped :has() query returns only the selects still
+                # showing their placeholder, replacing the per-element
+                # placeholder probe. Chrome builds without :has() fall
+                # back to the plain scan.
+                try:
+                    ant_selects = card_body.find_elements(*PLACEHOLDER_SELECT)
+                except Exception:
+                    ant_selects = []
+                if ant_selects:
+                    _remember_locator('brc_type_select', CARD_PLACEHOLDER_SELECT)
+                else:
+                    ant_selects = card_body.find_elements(*ANT_SELECT)
+                if ant_selects:
+                    brc_type_selector = ant_selects[0]
+                    print("✓ Found BRC type selector")
+
+            if brc_type_selector is not None:
+
+                # Click to open dropdown
+                print("Clicking BRC type selector...")
+                brc_type_selector.click()
+
+                # Wait for the open dropdown to render its options
+                # instead of sleeping a fixed second
+                wait.until(EC.visibility_of_element_located(OPEN_DROPDOWN_OPTION))
+
+                # Fast path: hit the matching option with one XPath lookup
+                # and click it through the browser, which also scrolls it
+                # into view; no need to pull every option's text first
                 try:
-                    placeholder = brc_type_selector.find_element(
-                        By.CLASS_NAME, "ant-select-selection-placeholder"
+                    option = driver.find_element(
+                        By.XPATH,
+                        "//div[contains(@class, 'ant-select-dropdown') and not(contains(@class, 'ant-select-dropdown-hidden'))]"
+                        f"//div[contains(@class, 'ant-select-item-option') and contains(., '{brc_type_upper}')]"
                     )
-                    if "Select Type" in placeholder.text or "Type" in placeholder.text:
-                        print(f"✓ Found BRC type selector: '{placeholder.text}'")
-                        
-                        # Click to open dropdown
-                        print("Clicking BRC type selector...")
-                        brc_type_selector.click()
-                        time.sleep(1)
-                        
-                        # Now find and click the option
-                        # Options are in a dropdown list with class "ant-select-item-option"
-                        dropdown_options = wait.until(
-                            EC.presence_of_all_elements_located((By.CLASS_NAME, "ant-select-item-option"))
-                        )
-                        
-                        print(f"Found {len(dropdown_options)} dropdown options")
-                        
-                        # Look for option matching our brc_type
-                        for option in dropdown_options:
-                            option_text = option.text.strip().upper()
-                            print(f"Option: {option_text}")
-                            if brc_type_upper in option_text or option_text == brc_type_upper:
-                                print(f"Found matching option: '{option.text}', clicking...")
-                                option.click()
-                                time.sleep(1)
-                                print(f"✓ BRC type {brc_type_upper} selected")
-                                return True
-                        
-                        # If exact match not found, click first option
-                        if dropdown_options:
-                            print(f"No exact match, clicking first option: '{dropdown_options[0].text}'")
-                            dropdown_options[0].click()
-                            time.sleep(1)
-                            print("✓ Clicked first dropdown option")
-                            return True
-                        
-                    else:
-                        print(f"Placeholder text is: '{placeholder.text}'")
-                except Exception as e:
-                    print(f"Error checking placeholder: {e}")
+                    driver.execute_script(
+                        "arguments[0].scrollIntoView({block: 'nearest'}); arguments[0].click();",
+                        option
+                    )
+                    wait.until(EC.invisibility_of_element_located(OPEN_DROPDOWN))
+                    print(f"✓ BRC type {brc_type_upper} selected")
+                    return True
+                except NoSuchElementException:
+                    print(f"No direct option match for '{brc_type_upper}', scanning options...")
+
+                # Case-insensitive match in a single XPath call:
+                # translate() upper-cases each option inside the browser,
+                # so no per-option .text round trips are needed
+                matches = driver.find_elements(
+                    By.XPATH,
+                    "//div[contains(@class, 'ant-select-dropdown') and not(contains(@class, 'ant-select-dropdown-hidden'))]"
+                    "//div[contains(@class, 'ant-select-item-option') and contains("
+                    "translate(., 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), "
+                    f"'{brc_type_upper}')]"
+                )
+                if matches:
+                    print(f"Found matching option: '{matches[0].text}', clicking...")
+                    matches[0].click()
+                    # The dropdown hides once the selection lands
+                    wait.until(EC.invisibility_of_element_located(OPEN_DROPDOWN))
+                    print(f"✓ BRC type {brc_type_upper} selected")
+                    return True
+
+                # No match at all - fall back to the first option
+                dropdown_options = driver.find_elements(*DROPDOWN_OPTION)
+                if dropdown_options:
+                    print(f"No matching option, clicking first option: '{dropdown_options[0].text}'")
+                    dropdown_options[0].click()
+                    wait.until(EC.invisibility_of_element_located(OPEN_DROPDOWN))
+                    print("✓ Clicked first dropdown option")
+                    return True
             else:
-                print(f"Found {len(ant_selects)} ant-select elements")
+                print("No ant-select element found for BRC type")
                 
         except Exception as e:
             print(f"Error in Strategy 1: {e}")
@@ -116,11 +191,46 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
     """Select IEC number in the portal - handles both BRC and non-BRC processes"""
     try:
         print(f"\nAttempting to select IEC number: {iec_number} for process: {process_type}")
-        time.sleep(2)
         
         # COMMON METHOD FOR ALL PROCESSES: Look for IEC by various patterns
         print("Looking for IEC selector using multiple methods...")
         
+        def type_and_pick(el):
+            """Type the IEC into the input and keyboard-select the match"""
+            driver.execute_script("arguments[0].scrollIntoView(true);", el)
+            el.click()
+            
+            # Clear and type
+            el.send_keys(Keys.CONTROL + "a")
+            el.send_keys(Keys.DELETE)
+            
+            print(f"Typing IEC: {iec_number}")
+            el.send_keys(iec_number)
+            
+            # Wait for the suggestion dropdown rather than a
+            # fixed pause; no dropdown just means free typing
+            try:
+                wait.until(EC.visibility_of_element_located(OPEN_DROPDOWN_OPTION))
+            except TimeoutException:
+                pass
+            
+            # Select from dropdown
+            el.send_keys(Keys.ARROW_DOWN)
+            el.send_keys(Keys.ENTER)
+        
+        # Try whatever locator found the IEC input on the last run before
+        # walking the method cascade again
+        cache_key = ('iec_input', process_type)
+        cached_input = _find_cached(driver, cache_key)
+        if cached_input is not None:
+            try:
+                print("Using cached IEC locator")
+                type_and_pick(cached_input)
+                print("✓ IEC selected via cached locator")
+                return True
+            except Exception as e:
+                print(f"Cached IEC locator failed: {e}")
+        
         # METHOD 1: Look for input with IEC-related placeholder
         try:
             print("\nMethod 1: Searching by placeholder...")
@@ -130,34 +240,14 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
             
             for keyword in iec_keywords:
                 try:
-                    inputs = driver.find_elements(By.XPATH, f"//input[contains(@placeholder, '{keyword}')]")
+                    inputs = driver.find_elements(By.XPATH, IEC_PLACEHOLDER_XPATH.format(keyword))
                     if inputs:
                         print(f"Found {len(inputs)} inputs with placeholder containing '{keyword}'")
                         iec_input = inputs[0]
                         
                         print(f"Clicking IEC input (placeholder: '{iec_input.get_attribute('placeholder')}')")
-                        driver.execute_script("arguments[0].scrollIntoView(true);", iec_input)
-                        time.sleep(0.5)
-                        iec_input.click()
-                        time.sleep(0.5)
-                        
-                        # Clear and type
-                        iec_input.send_keys(Keys.CONTROL + "a")
-                        iec_input.send_keys(Keys.DELETE)
-                        time.sleep(0.5)
-                        
-                        print(f"Typing IEC: {iec_number}")
-                        for char in iec_number:
-                            iec_input.send_keys(char)
-                            time.sleep(0.1)
-                        
-                        time.sleep(1.5)  # Wait for dropdown
-                        
-                        # Select from dropdown
-                        iec_input.send_keys(Keys.ARROW_DOWN)
-                        time.sleep(0.5)
-                        iec_input.send_keys(Keys.ENTER)
-                        time.sleep(1)
+                        type_and_pick(iec_input)
+                        _remember_locator(cache_key, (By.XPATH, IEC_PLACEHOLDER_XPATH.format(keyword)))
                         
                         print(f"✓ IEC selected via placeholder method")
                         return True
@@ -174,7 +264,7 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
             print("\nMethod 2: Searching ant-select components...")
             
             # Find all ant-select elements
-            ant_selects = driver.find_elements(By.CLASS_NAME, "ant-select")
+            ant_selects = driver.find_elements(*ANT_SELECT)
             print(f"Found {len(ant_selects)} ant-select components")
             
             # For BRC: Use second ant-select (first is BRC type)
@@ -191,7 +281,7 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
                 for i, select in enumerate(ant_selects):
                     try:
                         # Check placeholder
-                        placeholder = select.find_element(By.CLASS_NAME, "ant-select-selection-placeholder")
+                        placeholder = select.find_element(*ANT_SELECT_PLACEHOLDER)
                         placeholder_text = placeholder.text.lower()
                         
                         if any(keyword in placeholder_text for keyword in ['iec', 'exporter', 'search']):
@@ -209,14 +299,13 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
             if target_select:
                 print("Clicking ant-select...")
                 target_select.click()
-                time.sleep(1)
                 
                 # Find the search input
                 try:
-                    search_input = target_select.find_element(By.CLASS_NAME, "ant-select-selection-search-input")
+                    search_input = target_select.find_element(*ANT_SELECT_SEARCH_INPUT)
                 except:
                     # Try to find any search input
-                    search_inputs = driver.find_elements(By.CLASS_NAME, "ant-select-selection-search-input")
+                    search_inputs = driver.find_elements(*ANT_SELECT_SEARCH_INPUT)
                     if search_inputs:
                         search_input = search_inputs[0]
                     else:
@@ -225,16 +314,20 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
                 # Clear and type
                 search_input.send_keys(Keys.CONTROL + "a")
                 search_input.send_keys(Keys.DELETE)
-                time.sleep(0.5)
                 
                 print(f"Typing IEC: {iec_number}")
                 search_input.send_keys(iec_number)
-                time.sleep(2)  # Wait for dropdown
+                
+                # Wait for the filtered options rather than a fixed pause
+                try:
+                    wait.until(EC.visibility_of_element_located(OPEN_DROPDOWN_OPTION))
+                except TimeoutException:
+                    pass
                 
                 # Try to select from dropdown
                 try:
                     # Look for dropdown options
-                    dropdown_options = driver.find_elements(By.CLASS_NAME, "ant-select-item-option")
+                    dropdown_options = driver.find_elements(*DROPDOWN_OPTION)
                     if dropdown_options:
                         print(f"Found {len(dropdown_options)} dropdown options")
                         # Click the first option
@@ -246,7 +339,6 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
                     # Press Enter as fallback
                     search_input.send_keys(Keys.ENTER)
                 
-                time.sleep(1)
                 print("✓ IEC selected via ant-select method")
                 return True
                 
@@ -258,9 +350,7 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
             print("\nMethod 3: Searching any search input...")
             
             # Find all inputs that could be searchable
-            search_inputs = driver.find_elements(By.XPATH, 
-                "//input[@type='search' or contains(@class, 'search') or @role='combobox']"
-            )
+            search_inputs = driver.find_elements(*SEARCH_LIKE_INPUT)
             print(f"Found {len(search_inputs)} search-like inputs")
             
             if search_inputs:
@@ -275,22 +365,23 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
                 
                 # Click and type
                 iec_input.click()
-                time.sleep(0.5)
                 
                 # Clear field
                 iec_input.send_keys(Keys.CONTROL + "a")
                 iec_input.send_keys(Keys.DELETE)
-                time.sleep(0.5)
                 
                 print(f"Typing IEC: {iec_number}")
                 iec_input.send_keys(iec_number)
-                time.sleep(1.5)
+                
+                # Wait for suggestions before keyboard-selecting
+                try:
+                    wait.until(EC.visibility_of_element_located(OPEN_DROPDOWN_OPTION))
+                except TimeoutException:
+                    pass
                 
                 # Try to select
                 iec_input.send_keys(Keys.ARROW_DOWN)
-                time.sleep(0.5)
                 iec_input.send_keys(Keys.ENTER)
-                time.sleep(1)
                 
                 print("✓ IEC selected via search input method")
                 return True
@@ -303,9 +394,7 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
             print("\nMethod 4: Searching by labels...")
             
             # Look for elements containing "IEC"
-            iec_elements = driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'IEC') or contains(text(), 'iec') or contains(text(), 'Exporter')]"
-            )
+            iec_elements = driver.find_elements(*IEC_LABEL)
             
             if iec_elements:
                 print(f"Found {len(iec_elements)} elements with IEC/Exporter text")
@@ -314,25 +403,24 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
                 for element in iec_elements:
                     try:
                         # Find nearby input
-                        nearby_input = element.find_element(By.XPATH, 
-                            "following::input[1] | preceding::input[1]"
-                        )
+                        nearby_input = element.find_element(*ADJACENT_INPUT)
                         
                         if nearby_input:
                             print("Found input near IEC text")
                             nearby_input.click()
-                            time.sleep(0.5)
                             
                             nearby_input.send_keys(Keys.CONTROL + "a")
                             nearby_input.send_keys(Keys.DELETE)
-                            time.sleep(0.5)
                             
                             print(f"Typing IEC: {iec_number}")
                             nearby_input.send_keys(iec_number)
-                            time.sleep(1.5)
+                            
+                            try:
+                                wait.until(EC.visibility_of_element_located(OPEN_DROPDOWN_OPTION))
+                            except TimeoutException:
+                                pass
                             
                             nearby_input.send_keys(Keys.ENTER)
-                            time.sleep(1)
                             
                             print("✓ IEC selected via label method")
                             return True
@@ -618,7 +706,79 @@ def select_iec_number(driver, wait, iec_number, process_type='brc'):
 #         print(f"Error in dropdown selection: {e}")
 #         return False
 
-def login_and_navigate(username, password, process_type, iec_number=None, file_to_upload=None, brc_type=None):
+# Chrome startup and login dominate the wall time of repeat uploads, so
+# one browser session is cached at module level and reused across runs.
+# The session is a single browser, so the automation pool's workers must
+# take this lock for a whole run - interleaved navigation from two
+# threads on one Chrome instance corrupts both uploads. RLock so
+# get_driver/close_session can be called while a run holds it.
+_cached_driver = None
+_SESSION_LOCK = threading.RLock()
+
+
+def get_driver():
+    """Return the cached Chrome session, starting a fresh one if needed"""
+    global _cached_driver
+    with _SESSION_LOCK:
+        return _get_driver_locked()
+
+
+def _get_driver_locked():
+    global _cached_driver
+    if _cached_driver is not None:
+        try:
+            _cached_driver.current_url  # probe: raises once the browser died
+            return _cached_driver
+        except Exception:
+            print("Cached browser session is gone, starting a new one...")
+            close_session()
+
+    # Configure Chrome options - NO HEADLESS (visible browser)
+    chrome_options = Options()
+
+    # Add options for better performance and compatibility.
+    # 'eager' returns from driver.get at DOMContentLoaded so the
+    # explicit waits take over before images/fonts finish loading
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument("--disable-save-password-bubble")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_experimental_option("prefs", {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        # The automation never looks at images; skip downloading them
+        "profile.managed_default_content_settings.images": 2
+    })
+    # NO HEADLESS - Browser will be visible
+    # chrome_options.add_argument('--headless')  # REMOVED
+
+    print("Initializing Chrome driver...")
+    _cached_driver = webdriver.Chrome(options=chrome_options)
+    # Keep the implicit wait at zero: every find_elements probe in the
+    # strategy cascades should return immediately when nothing matches,
+    # leaving all actual waiting to the explicit WebDriverWait conditions
+    _cached_driver.implicitly_wait(0)
+    return _cached_driver
+
+
+def close_session():
+    """Quit the cached browser session, if any"""
+    global _cached_driver
+    with _SESSION_LOCK:
+        if _cached_driver is not None:
+            try:
+                _cached_driver.quit()
+                print("Browser closed.")
+            except Exception:
+                pass
+            _cached_driver = None
+
+
+def login_and_navigate(username, password, process_type, iec_number=None, file_to_upload=None, brc_type=None, hold_open=None):
     """
     Automate login to CIP-Signal portal and navigate to specific process dashboard
     Args:
@@ -628,6 +788,8 @@ def login_and_navigate(username, password, process_type, iec_number=None, file_t
         iec_number (str, optional): IEC number to select in the portal
         file_to_upload (str, optional): Path to the file to upload
         brc_type (str, optional): BRC type (FOB or INV) for BRC process
+        hold_open (float, optional): Seconds to keep the browser open after
+            a successful run; defaults to the CIP_HOLD_OPEN environment value
     
     Returns:
         dict: Result with status and message
@@ -637,194 +799,208 @@ def login_and_navigate(username, password, process_type, iec_number=None, file_t
         'message': ''
     }
     
-    driver = None
-    try:
-        print("Starting CIP-Signal automation...")
-        
-        # Configure Chrome options - NO HEADLESS (visible browser)
-        chrome_options = Options()
-        
-        # Add options for better performance and compatibility
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument("--disable-save-password-bubble")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_experimental_option("prefs", {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False
-        })
-        # NO HEADLESS - Browser will be visible
-        # chrome_options.add_argument('--headless')  # REMOVED
+    # One run owns the shared browser end to end; concurrent jobs
+    # from the automation pool queue here instead of interleaving
+    with _SESSION_LOCK:
+        driver = None
+        try:
+            print("Starting CIP-Signal automation...")
         
-        # Initialize Chrome driver
-        print("Initializing Chrome driver...")
-        driver = webdriver.Chrome(options=chrome_options)
+            driver = get_driver()
         
-        # Navigate to CIP-Signal portal
-        print("Navigating to https://www.cip-lucrative.com...")
-        driver.get("https://www.cip-lucrative.com")
+            # Explicit waits return the moment the DOM is ready; a slightly
+            # longer ceiling with a fast poll beats fixed sleeps on both ends
+            wait = WebDriverWait(driver, 15, poll_frequency=0.2)
         
-        # Wait for page to load
-        wait = WebDriverWait(driver, 10)
-        time.sleep(2)
-        
-        # Find login elements - SIMPLE APPROACH
-        print("Looking for login form...")
+            # A reused session is usually still authenticated; only walk the
+            # login form when the browser isn't already inside the portal
+            try:
+                current = driver.current_url
+                already_logged_in = ('cip-lucrative.com' in current
+                                     and 'login' not in current.lower())
+            except Exception:
+                already_logged_in = False
         
-        # Find email field
-        email_field = wait.until(
-            EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Enter email' or @type='email']"))
-        )
-        print("Found email field")
+            if already_logged_in:
+                print("Reusing logged-in browser session, skipping login")
+            else:
+                # Navigate to CIP-Signal portal
+                print("Navigating to https://www.cip-lucrative.com...")
+                driver.get("https://www.cip-lucrative.com")
         
-        # Find password field
-        password_field = driver.find_element(By.XPATH, "//input[@placeholder='Enter password' or @type='password']")
-        print("Found password field")
+                # Find login elements - SIMPLE APPROACH
+                print("Looking for login form...")
         
-        # Find submit button
-        try:
-            submit_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Sign In') or contains(text(), 'Login') or @type='submit']")
-            print("Found submit button")
-        except:
-            submit_button = None
+                # Find email field
+                email_field = wait.until(EC.presence_of_element_located(EMAIL_FIELD))
+                print("Found email field")
         
-        # Enter credentials
-        print(f"Entering username: {username}")
-        email_field.clear()
-        email_field.send_keys(username)
-        time.sleep(0.5)
+                # Find password field
+                password_field = driver.find_element(*PASSWORD_FIELD)
+                print("Found password field")
         
-        print("Entering password...")
-        password_field.clear()
-        password_field.send_keys(password)
-        time.sleep(0.5)
+                # Find submit button
+                try:
+                    submit_button = driver.find_element(*SUBMIT_BUTTON)
+                    print("Found submit button")
+                except:
+                    submit_button = None
         
-        # Submit form
-        if submit_button:
-            print("Clicking Sign In button...")
-            submit_button.click()
-        else:
-            print("Pressing Enter in password field...")
-            password_field.send_keys(Keys.RETURN)
+                # Enter credentials - one script call fills both fields and fires
+                # the input/change events the form listens for, instead of clearing
+                # and typing each field through separate WebDriver round trips
+                print("Entering credentials...")
+                try:
+                    driver.execute_script(
+                        """
+                        const setValue = (el, value) => {
+                            const setter = Object.getOwnPropertyDescriptor(
+                                window.HTMLInputElement.prototype, 'value').set;
+                            setter.call(el, value);
+                            el.dispatchEvent(new Event('input', {bubbles: true}));
+                            el.dispatchEvent(new Event('change', {bubbles: true}));
+                        };
+                        setValue(arguments[0], arguments[2]);
+                        setValue(arguments[1], arguments[3]);
+                        """,
+                        email_field, password_field, username, password
+                    )
+                except Exception as e:
+                    print(f"Script fill failed ({e}), typing credentials instead...")
+                    email_field.clear()
+                    email_field.send_keys(username)
+                    password_field.clear()
+                    password_field.send_keys(password)
         
-        # Wait for login to complete
-        print("Waiting for login to complete...")
-        time.sleep(3)
+                # Submit form
+                if submit_button:
+                    print("Clicking Sign In button...")
+                    submit_button.click()
+                else:
+                    print("Pressing Enter in password field...")
+                    password_field.send_keys(Keys.RETURN)
         
-        # Check if login was successful by looking for dashboard elements
-        print("Checking for successful login...")
+            # Check if login was successful by looking for dashboard elements
+            print("Checking for successful login...")
         
-        # Look for dashboard indicators
-        try:
-            # Wait for dashboard or navigation elements
-            wait.until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Dashboard') or contains(text(), 'Upload') or contains(text(), 'dashboard')]"))
-            )
-            print("✓ Login successful - Dashboard detected")
-            result['success'] = True
-            result['message'] = "Successfully logged in"
+            # Look for dashboard indicators
+            try:
+                # Wait for whichever shows first - the dashboard or a login
+                # error - so bad credentials surface immediately instead of
+                # running the dashboard wait to its full timeout
+                wait.until(EC.any_of(
+                    EC.presence_of_element_located(DASHBOARD_INDICATOR),
+                    EC.presence_of_element_located(LOGIN_ERROR),
+                ))
+                if not driver.find_elements(*DASHBOARD_INDICATOR):
+                    # The error branch fired; the URL check below reports it
+                    raise TimeoutException("login error message displayed")
+                print("✓ Login successful - Dashboard detected")
+                result['success'] = True
+                result['message'] = "Successfully logged in"
             
-            # Now navigate to specific process dashboard based on process_type
-            if process_type in PROCESS_TO_CARD_MAP:
-                card_name = PROCESS_TO_CARD_MAP[process_type]
-                print(f"Navigating to {card_name} dashboard...")
+                # Now navigate to specific process dashboard based on process_type
+                if process_type in PROCESS_TO_CARD_MAP:
+                    card_name = PROCESS_TO_CARD_MAP[process_type]
+                    print(f"Navigating to {card_name} dashboard...")
                 
-                # Construct the URL for the specific card
-                card_url = f"https://www.cip-lucrative.com/dashboard/upload/upload-files?__card__={card_name}"
+                    # Construct the URL for the specific card
+                    card_url = f"https://www.cip-lucrative.com/dashboard/upload/upload-files?__card__={card_name}"
                 
-                # Navigate to the specific card URL
-                print(f"Opening URL: {card_url}")
-                driver.get(card_url)
-                time.sleep(3)
+                    # Navigate to the specific card URL
+                    print(f"Opening URL: {card_url}")
+                    driver.get(card_url)
                 
-                # Check if we're on the right page
-                current_url = driver.current_url
-                if card_name in current_url:
-                    print(f"✓ Successfully navigated to {card_name} dashboard")
-                    result['message'] = f"Successfully logged in and navigated to {card_name} dashboard"
-                else:
-                    print(f"⚠ Might not be on {card_name} dashboard, but login was successful")
+                    # Wait until the card URL actually lands instead of a
+                    # fixed pause; fall through to the check below either way
+                    try:
+                        wait.until(EC.url_contains(card_name))
+                    except TimeoutException:
+                        pass
                 
-                # FOR BRC PROCESS: Select BRC type first (FOB or INV)
-                if process_type == 'brc' and brc_type:
-                    select_brc_type_success = select_brc_type(driver, wait, brc_type)
-                    if select_brc_type_success:
-                        result['message'] += f", selected BRC type: {brc_type.upper()}"
+                    # Check if we're on the right page
+                    current_url = driver.current_url
+                    if card_name in current_url:
+                        print(f"✓ Successfully navigated to {card_name} dashboard")
+                        result['message'] = f"Successfully logged in and navigated to {card_name} dashboard"
                     else:
-                        print("⚠ Could not select BRC type, continuing...")
+                        print(f"⚠ Might not be on {card_name} dashboard, but login was successful")
+                
+                    # FOR BRC PROCESS: Select BRC type first (FOB or INV)
+                    if process_type == 'brc' and brc_type:
+                        select_brc_type_success = select_brc_type(driver, wait, brc_type)
+                        if select_brc_type_success:
+                            result['message'] += f", selected BRC type: {brc_type.upper()}"
+                        else:
+                            print("⚠ Could not select BRC type, continuing...")
                 
-                if iec_number and iec_number.strip():
-                    print(f"Attempting to select IEC number: {iec_number} for process: {process_type}")
-                    select_iec_success = select_iec_number(driver, wait, iec_number, process_type)
-                    if select_iec_success:
-                        result['message'] += f" and selected IEC: {iec_number}"
-                        print(f"✓ IEC selection successful for {process_type}")
+                    if iec_number and iec_number.strip():
+                        print(f"Attempting to select IEC number: {iec_number} for process: {process_type}")
+                        select_iec_success = select_iec_number(driver, wait, iec_number, process_type)
+                        if select_iec_success:
+                            result['message'] += f" and selected IEC: {iec_number}"
+                            print(f"✓ IEC selection successful for {process_type}")
+                        else:
+                            print(f"⚠ Could not select IEC number for {process_type}, continuing...")
+                            result['message'] += " (IEC selection failed)"
                     else:
-                        print(f"⚠ Could not select IEC number for {process_type}, continuing...")
-                        result['message'] += " (IEC selection failed)"
-                else:
-                    print("No IEC number provided, skipping IEC selection")
+                        print("No IEC number provided, skipping IEC selection")
                 
-                # Upload file if provided
-                if file_to_upload and os.path.exists(file_to_upload):
-                    upload_success = upload_file_to_portal(driver, wait, file_to_upload)
-                    if upload_success:
-                        result['message'] += f" and uploaded file: {os.path.basename(file_to_upload)}"
-                        result['success'] = True
+                    # Upload file if provided
+                    if file_to_upload and os.path.exists(file_to_upload):
+                        upload_success = upload_file_to_portal(driver, wait, file_to_upload)
+                        if upload_success:
+                            result['message'] += f" and uploaded file: {os.path.basename(file_to_upload)}"
+                            result['success'] = True
+                        else:
+                            print("⚠ File upload failed")
                     else:
-                        print("⚠ File upload failed")
-                else:
-                    print(f"No file to upload or file doesn't exist: {file_to_upload}")
+                        print(f"No file to upload or file doesn't exist: {file_to_upload}")
                     
-            else:
-                print(f"⚠ No specific card mapping for process: {process_type}")
-                print("Staying on main dashboard")
+                else:
+                    print(f"⚠ No specific card mapping for process: {process_type}")
+                    print("Staying on main dashboard")
                 
-        except Exception as e:
-            print(f"⚠ Could not confirm dashboard: {e}")
-            # Check if we're still on login page
-            current_url = driver.current_url
-            if "login" in current_url.lower() or "signin" in current_url.lower():
-                result['message'] = "Login failed - Still on login page"
-                print("✗ Login failed")
-            else:
-                result['success'] = True
-                result['message'] = "Login likely successful (not on login page)"
-                print("✓ Login likely successful")
+            except Exception as e:
+                print(f"⚠ Could not confirm dashboard: {e}")
+                # Check if we're still on login page
+                current_url = driver.current_url
+                if "login" in current_url.lower() or "signin" in current_url.lower():
+                    result['message'] = "Login failed - Still on login page"
+                    print("✗ Login failed")
+                else:
+                    result['success'] = True
+                    result['message'] = "Login likely successful (not on login page)"
+                    print("✓ Login likely successful")
     
-    except TimeoutException as e:
-        result['message'] = f"Timeout while waiting for page elements: {str(e)}"
-        print(f"✗ Timeout error: {e}")
-    except NoSuchElementException as e:
-        result['message'] = f"Required element not found: {str(e)}"
-        print(f"✗ Element not found: {e}")
-    except Exception as e:
-        result['message'] = f"Error during automation: {str(e)}"
-        print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        except TimeoutException as e:
+            result['message'] = f"Timeout while waiting for page elements: {str(e)}"
+            print(f"✗ Timeout error: {e}")
+        except NoSuchElementException as e:
+            result['message'] = f"Required element not found: {str(e)}"
+            print(f"✗ Element not found: {e}")
+        except Exception as e:
+            result['message'] = f"Error during automation: {str(e)}"
+            print(f"✗ Error: {e}")
+            import traceback
+            traceback.print_exc()
     
-    # Keep browser open for a while if successful
-    if driver:
-        if result['success']:
-            print("\n✓ Automation completed successfully!")
-            print("Browser will remain open for 30 seconds for manual inspection...")
-            print("Press Ctrl+C in terminal to stop the application")
-            
-            # Keep browser open for longer
-            try:
-                time.sleep(30)  # Keep browser open for 30 seconds
-            except KeyboardInterrupt:
-                print("\nClosing browser...")
-        
-        # Close the browser
-        try:
-            driver.quit()
-            print("Browser closed.")
-        except:
-            pass
+        if driver is not None:
+            if result['success']:
+                # Keep the session alive so the next run skips browser startup
+                # and login; callers can tear it down with close_session()
+                print("\n✓ Automation completed successfully!")
+                delay = HOLD_OPEN_SECONDS if hold_open is None else hold_open
+                if delay > 0:
+                    print(f"Keeping browser open for {delay:g} seconds for manual inspection...")
+                    try:
+                        time.sleep(delay)
+                    except KeyboardInterrupt:
+                        pass
+            else:
+                # A failed run can leave the browser in an odd state; make the
+                # next attempt start from a fresh session
+                close_session()
     
     return result
 
@@ -840,7 +1016,7 @@ def upload_file_to_portal(driver, wait, file_path):
         # Strategy 1: Look in card-body
         try:
             card_body = wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "card-body"))
+                EC.presence_of_element_located(CARD_BODY)
             )
             
             # Find file input in card-body
@@ -1104,6 +1280,9 @@ if __name__ == "__main__":
             print("No test file found for upload")
         
         result = login_and_navigate(fixed_username, fixed_password, fixed_process, fixed_iec, test_file, fixed_brc_type)
-        
+
         print(f"\nResult: {result['success']}")
-        print(f"Message: {result['message']}")
\ No newline at end of file
+        print(f"Message: {result['message']}")
+
+    # The standalone test run has no later request to reuse the session
+    close_session()
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Regression tests for date handling in converters.py.
+
+The portal files write dates day-first, so an ambiguous value like
+07-11-2025 must come out as 07-Nov-2025, never 11-Jul-2025. These tests
+pin that down after a bug where the expected-dtype maps cast date
+columns through astype('datetime64[ns]'), which parses month-first.
+"""
+
+import pandas as pd
+
+from converters import (
+    BRC_INPUT_DTYPES,
+    IGST_INPUT_DTYPES,
+    SB_INPUT_DTYPES,
+    _apply_expected_dtypes,
+    convert_igst_scroll,
+    format_date_series,
+    parse_date_series,
+)
+
+
+def test_parse_date_series_is_dayfirst_for_ambiguous_dates():
+    s = pd.Series(['07-11-2025', '10.07.2025', '01/02/2025'])
+    parsed = parse_date_series(s)
+    assert parsed.tolist() == [
+        pd.Timestamp(2025, 11, 7),
+        pd.Timestamp(2025, 7, 10),
+        pd.Timestamp(2025, 2, 1),
+    ]
+
+
+def test_expected_dtypes_leave_date_columns_to_the_parser():
+    # astype('datetime64[ns]') parses month-first, so the dtype maps must
+    # never target date columns; parse_date_series owns them
+    for dtypes in (BRC_INPUT_DTYPES, IGST_INPUT_DTYPES, SB_INPUT_DTYPES):
+        assert 'datetime64' not in ' '.join(dtypes.values())
+
+    df = pd.DataFrame({'BRC Date': ['07-11-2025']})
+    out = _apply_expected_dtypes(df, BRC_INPUT_DTYPES)
+    formatted = format_date_series(parse_date_series(out['BRC Date']))
+    assert formatted.tolist() == ['07-Nov-2025']
+
+
+def test_convert_igst_scroll_keeps_ambiguous_dates_dayfirst():
+    df = pd.DataFrame(
+        [['999888', '10.07.2025', 'SCR1', '11.07.2025', '1234.5',
+          'OK', 'OK', '00', 'TXN1']],
+        columns=['Shipping Bill No.', 'Shipping Bill Date', 'IGST Scroll No',
+                 'IGST Scroll Date', 'Scroll Amount(INR)',
+                 'Scroll Status At PFMS', 'Scroll Status At PAO',
+                 'Bank Response Code', 'Bank Transaction ID'])
+    out = convert_igst_scroll(df)
+    data_row = out.iloc[-1]
+    assert data_row['Shipping Bill Date'] == '10-Jul-2025'
+    assert data_row['IGST Scroll Date'] == '11-Jul-2025'